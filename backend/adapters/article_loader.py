@@ -16,6 +16,13 @@ _articles_cache: list[dict[str, Any]] | None = None
 _articles_hash: str | None = None
 
 
+def clear_articles_cache() -> None:
+    """Drop the cached articles so the next load re-reads the directory."""
+    global _articles_cache, _articles_hash
+    _articles_cache = None
+    _articles_hash = None
+
+
 def _compute_directory_hash(articles_dir: Path) -> str:
     """Compute hash of all markdown files in directory for cache invalidation.
 
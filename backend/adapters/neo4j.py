@@ -8,6 +8,7 @@ from neo4j import Driver, GraphDatabase, Session
 from neo4j.exceptions import ServiceUnavailable
 
 from config import get_settings
+from core.ai import vector_norm
 
 logger = logging.getLogger(__name__)
 
@@ -223,6 +224,85 @@ class Neo4jAdapter:
 
             return note
 
+    def create_notes(
+        self, notes: list[dict[str, Any]], author: str = "admin"
+    ) -> list[dict[str, Any]]:
+        """Create several notes in one transaction.
+
+        Nodes are written with a single UNWIND query and links with a second,
+        so links between notes of the same batch resolve too. created_at
+        increases by a microsecond per note, keeping list order stable.
+
+        Args:
+            notes: Dicts with 'id' and 'content', plus optional 'title',
+                'tags', 'links' and 'is_reference' (as for create_note)
+            author: Note author for every note (default: admin)
+
+        Returns:
+            Created notes as dicts, in input order
+        """
+        if not self._available or not self.driver:
+            raise RuntimeError("Neo4j not available")
+
+        now = time.time()
+        rows = [
+            {
+                "id": note["id"],
+                "title": note.get("title") or "",
+                "content": note["content"],
+                "tags": note.get("tags") or [],
+                "links": note.get("links") or [],
+                "is_reference": note.get("is_reference", False),
+                "created_at": now + i * 1e-6,
+            }
+            for i, note in enumerate(notes)
+        ]
+
+        with (
+            self.driver.session(database=self.database) as session,
+            session.begin_transaction() as tx,
+        ):
+            result = tx.run(
+                """
+                UNWIND $rows AS row
+                CREATE (n:Note {
+                    id: row.id,
+                    title: row.title,
+                    content: row.content,
+                    author: $author,
+                    tags: row.tags,
+                    links: row.links,
+                    is_reference: row.is_reference,
+                    created_at: row.created_at,
+                    updated_at: row.created_at
+                })
+                RETURN n
+                """,
+                rows=rows,
+                author=author,
+            )
+            created = {record["n"]["id"]: self._node_to_dict(record["n"]) for record in result}
+
+            # Same rule as _create_links: only link to notes that exist
+            tx.run(
+                """
+                UNWIND $rows AS row
+                MATCH (source:Note {id: row.id})
+                UNWIND row.links AS target_id
+                MATCH (target:Note {id: target_id})
+                MERGE (source)-[:LINKS_TO]->(target)
+                """,
+                rows=rows,
+            )
+            tx.commit()
+
+        ordered = []
+        for row in rows:
+            note = created[row["id"]]
+            note["links"] = row["links"]
+            ordered.append(note)
+        return ordered
+
     def get_note(self, note_id: str) -> dict[str, Any] | None:
         """Get note by ID.
 
@@ -1254,12 +1334,14 @@ class Neo4jAdapter:
                 f"""
                 MATCH (n:{validated_type} {{id: $id}})
                 SET n.embedding = $embedding,
+                    n.embedding_norm = $embedding_norm,
                     n.embedding_model = $model,
                     n.embedding_version = $version,
                     n.content_hash = $content_hash
                 """,
                 id=node_id,
                 embedding=embedding,
+                embedding_norm=vector_norm(embedding),
                 model=model,
                 version=version,
                 content_hash=content_hash,
@@ -1311,7 +1393,8 @@ class Neo4jAdapter:
             node_type: Optional filter for "Article" or "Note" (None = both)
 
         Returns:
-            List of dicts with id, type, embedding, model, version
+            List of dicts with id, type, embedding, embedding_norm, model, version
+            (embedding_norm is None for nodes embedded before norms were stored)
         """
         if not self._available or not self.driver:
             return []
@@ -1326,6 +1409,7 @@ class Neo4jAdapter:
                     RETURN n.id as id,
                            '{validated_type}' as type,
                            n.embedding as embedding,
+                           n.embedding_norm as embedding_norm,
                            n.embedding_model as model,
                            n.embedding_version as version
                 """
@@ -1336,6 +1420,7 @@ class Neo4jAdapter:
                     RETURN n.id as id,
                            labels(n)[0] as type,
                            n.embedding as embedding,
+                           n.embedding_norm as embedding_norm,
                            n.embedding_model as model,
                            n.embedding_version as version
                 """
@@ -1346,6 +1431,7 @@ class Neo4jAdapter:
                     "id": record["id"],
                     "type": record["type"],
                     "embedding": record["embedding"],
+                    "embedding_norm": record["embedding_norm"],
                     "model": record["model"],
                     "version": record["version"],
                 }
@@ -1392,12 +1478,14 @@ class Neo4jAdapter:
                 CREATE (n)-[:HAS_CHUNK]->(:Chunk {{
                     seq: seq,
                     embedding: $embeddings[seq],
+                    embedding_norm: $norms[seq],
                     embedding_model: $model,
                     embedding_version: $version
                 }})
                 """,
                 id=node_id,
                 embeddings=chunk_embeddings,
+                norms=[vector_norm(embedding) for embedding in chunk_embeddings],
                 model=model,
                 version=version,
             )
@@ -1411,7 +1499,8 @@ class Neo4jAdapter:
         Neo4j vector index instead.
 
         Returns:
-            List of dicts with parent_id, parent_type, seq, embedding
+            List of dicts with parent_id, parent_type, seq, embedding, embedding_norm
+            (embedding_norm is None for chunks stored before norms were recorded)
         """
         if not self._available or not self.driver:
             return []
@@ -1424,7 +1513,8 @@ class Neo4jAdapter:
                 RETURN n.id as parent_id,
                        labels(n)[0] as parent_type,
                        c.seq as seq,
-                       c.embedding as embedding
+                       c.embedding as embedding,
+                       c.embedding_norm as embedding_norm
                 """
             )
             return [
@@ -1433,6 +1523,7 @@ class Neo4jAdapter:
                     "parent_type": record["parent_type"],
                     "seq": record["seq"],
                     "embedding": record["embedding"],
+                    "embedding_norm": record["embedding_norm"],
                 }
                 for record in result
             ]
@@ -1619,7 +1710,8 @@ class Neo4jAdapter:
         Returns only notes with computed embeddings.
 
         Returns:
-            List of dicts with id, title, embedding
+            List of dicts with id, title, embedding, embedding_norm (None for
+            notes embedded before norms were stored)
         """
         if not self._available or not self.driver:
             return []
@@ -1631,7 +1723,8 @@ class Neo4jAdapter:
                 WHERE n.embedding IS NOT NULL
                 RETURN n.id AS id,
                        n.title AS title,
-                       n.embedding AS embedding
+                       n.embedding AS embedding,
+                       n.embedding_norm AS embedding_norm
                 ORDER BY n.created_at DESC
                 """
             )
@@ -1641,6 +1734,7 @@ class Neo4jAdapter:
                     "id": record["id"],
                     "title": record["title"] or record["id"],
                     "embedding": record["embedding"],
+                    "embedding_norm": record["embedding_norm"],
                 }
                 for record in result
             ]
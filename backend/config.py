@@ -88,6 +88,10 @@ class Settings(BaseSettings):
     ollama_model: str = "llama3.2:1b"  # Legacy: fallback if embed/chat not set
     ollama_enabled: bool = True  # Enable/disable Ollama features
     ollama_num_ctx: int = 2048  # Context window size (reduce from default 4096 to save memory)
+    # Seconds before a single Ollama HTTP call is abandoned. None waits
+    # indefinitely (CPU inference plus a cold model load can take minutes);
+    # set it to fail fast instead of blocking on a hung model.
+    ollama_request_timeout: float | None = None
 
     # Embedding sync settings
     sync_embeddings_on_startup: bool = False  # Set to True to sync embeddings on app startup
@@ -4,18 +4,28 @@ This module contains pure functions with no I/O or side effects.
 All functions are deterministic and fully unit-testable.
 """
 
+import heapq
 import json
 import logging
+import math
+from collections.abc import Callable, Iterable
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Shared decoder for raw_decode(), which parses one JSON value starting at an
+# offset and ignores whatever text follows it
+_JSON_DECODER = json.JSONDecoder()
+
 
 def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     """Calculate cosine similarity between two vectors.
 
     Pure function: No I/O, no side effects, deterministic.
 
+    The dot products use math.sumprod, which runs the multiply-add loop in C
+    (with extended-precision accumulation) instead of a Python generator.
+
     Args:
         vec1: First embedding vector
         vec2: Second embedding vector
@@ -23,20 +33,90 @@ def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     Returns:
         Cosine similarity score (0.0 to 1.0)
     """
-    if len(vec1) != len(vec2):
+    # Mismatched or empty vectors cost one compare, before any pass over them
+    if len(vec1) != len(vec2) or not vec1:
         return 0.0
 
-    dot_product = sum(a * b for a, b in zip(vec1, vec2, strict=True))
-    magnitude1 = sum(a * a for a in vec1) ** 0.5
-    magnitude2 = sum(b * b for b in vec2) ** 0.5
+    return cosine_similarity_from_norms(vec1, vec2, vector_norm(vec1), vector_norm(vec2))
+
+
+def cosine_similarity_from_norms(
+    vec1: list[float], vec2: list[float], norm1: float, norm2: float
+) -> float:
+    """Cosine similarity of two vectors whose L2 norms are already known.
+
+    Pure function: No I/O, no side effects, deterministic.
+
+    For callers that compute or store norms once and score many pairs with
+    them. Applies the same 0.0 rules as cosine_similarity (mismatched
+    lengths, empty or all-zero vectors); callers that may still need to
+    compute a norm should reject mismatched lengths first.
 
-    if magnitude1 == 0 or magnitude2 == 0:
+    Args:
+        vec1: First embedding vector
+        vec2: Second embedding vector
+        norm1: vector_norm(vec1)
+        norm2: vector_norm(vec2)
+
+    Returns:
+        Cosine similarity score (0.0 to 1.0)
+    """
+    # Also guards math.sumprod, which raises on unequal lengths; empty vectors
+    # have a zero norm, so the second check covers them
+    if len(vec1) != len(vec2) or norm1 == 0 or norm2 == 0:
         return 0.0
 
-    similarity: float = dot_product / (magnitude1 * magnitude2)
+    similarity: float = math.sumprod(vec1, vec2) / (norm1 * norm2)
     return similarity
 
 
+def vector_norm(vector: list[float]) -> float:
+    """Euclidean (L2) norm of a vector.
+
+    Pure function: No I/O, no side effects, deterministic.
+
+    Stored alongside embeddings at ingest ('embedding_norm') so ranking only
+    needs one dot product per document instead of a dot product plus a norm.
+
+    Args:
+        vector: Embedding vector
+
+    Returns:
+        The vector's L2 norm (0.0 for an empty or all-zero vector)
+    """
+    return math.sqrt(math.sumprod(vector, vector))
+
+
+def _similarity_to(
+    query_embedding: list[float],
+) -> Callable[[list[float], float | None], float]:
+    """Return a scorer giving cosine similarity to a fixed query vector.
+
+    Same result as cosine_similarity(query_embedding, embedding), but the
+    query's norm is computed once rather than once per scored document, and
+    a document's stored norm is used when given (None computes it).
+    """
+    dim = len(query_embedding)
+    query_norm = vector_norm(query_embedding)
+
+    if query_norm == 0:
+        # Empty or all-zero query: every document scores 0.0, so skip the math
+        def zero(embedding: list[float], norm: float | None) -> float:
+            return 0.0
+
+        return zero
+
+    def score(embedding: list[float], norm: float | None) -> float:
+        # Dimension mismatch is decided by one compare, before any arithmetic
+        if len(embedding) != dim:
+            return 0.0
+        if norm is None:
+            norm = vector_norm(embedding)
+        return cosine_similarity_from_norms(query_embedding, embedding, query_norm, norm)
+
+    return score
+
+
 def rank_documents_by_similarity(
     query_embedding: list[float], documents_with_embeddings: list[dict[str, Any]], top_k: int = 5
 ) -> list[dict[str, Any]]:
@@ -46,29 +126,24 @@ def rank_documents_by_similarity(
 
     Args:
         query_embedding: Query embedding vector
-        documents_with_embeddings: Documents with 'embedding' field
+        documents_with_embeddings: Documents with 'embedding' field (and
+            optionally a precomputed 'embedding_norm')
         top_k: Maximum number of results to return
 
     Returns:
         Top K documents sorted by similarity (highest first) with 'score' field added
     """
-    scored_docs: list[tuple[float, dict[str, Any]]] = []
-
-    for doc in documents_with_embeddings:
-        doc_embedding = doc.get("embedding")
-        if not doc_embedding:
-            continue
-
-        # Calculate similarity
-        similarity = cosine_similarity(query_embedding, doc_embedding)
-
-        # Add score to document (non-destructive)
-        doc_with_score = {**doc, "score": similarity}
-        scored_docs.append((similarity, doc_with_score))
+    score = _similarity_to(query_embedding)
+    scored: list[tuple[float, int]] = [
+        (score(doc["embedding"], doc.get("embedding_norm")), i)
+        for i, doc in enumerate(documents_with_embeddings)
+        if doc.get("embedding")
+    ]
 
-    # Sort by similarity (highest first) and take top_k
-    scored_docs.sort(key=lambda x: x[0], reverse=True)
-    return [doc for _, doc in scored_docs[:top_k]]
+    # Select top_k without sorting everything (ties keep input order, like a
+    # stable sort), and only copy the winners to add their score (non-destructive)
+    top = heapq.nlargest(top_k, scored, key=lambda item: item[0])
+    return [{**documents_with_embeddings[i], "score": similarity} for similarity, i in top]
 
 
 def mean_vector(vectors: list[list[float]]) -> list[float]:
@@ -92,7 +167,10 @@ def mean_vector(vectors: list[list[float]]) -> list[float]:
     if any(len(v) != dim for v in vectors):
         logger.warning("mean_vector: mismatched vector lengths, returning []")
         return []
-    return [sum(v[i] for v in vectors) / len(vectors) for i in range(dim)]
+    # zip(*vectors) transposes in C, so each dimension is summed in a single
+    # pass over its column instead of re-indexing every vector per dimension
+    count = len(vectors)
+    return [sum(column) / count for column in zip(*vectors, strict=True)]
 
 
 def rank_parents_by_chunk_similarity(
@@ -110,26 +188,28 @@ def rank_parents_by_chunk_similarity(
 
     Args:
         query_embedding: Query embedding vector
-        chunks: Chunk dicts with 'parent_id', 'parent_type', 'embedding'
+        chunks: Chunk dicts with 'parent_id', 'parent_type', 'embedding' (and
+            optionally a precomputed 'embedding_norm')
         top_k: Maximum number of parents to return
 
     Returns:
         Top K parents as {'id', 'type', 'score'} sorted by score descending
     """
+    score = _similarity_to(query_embedding)
     best: dict[tuple[str, str], float] = {}
     for chunk in chunks:
         embedding = chunk.get("embedding")
         if not embedding:
             continue
         key = (chunk["parent_type"], chunk["parent_id"])
-        similarity = cosine_similarity(query_embedding, embedding)
+        similarity = score(embedding, chunk.get("embedding_norm"))
         if similarity > best.get(key, -1.0):
             best[key] = similarity
 
-    ranked = sorted(best.items(), key=lambda item: item[1], reverse=True)
+    ranked = heapq.nlargest(top_k, best.items(), key=lambda item: item[1])
     return [
-        {"id": parent_id, "type": parent_type, "score": score}
-        for (parent_type, parent_id), score in ranked[:top_k]
+        {"id": parent_id, "type": parent_type, "score": similarity}
+        for (parent_type, parent_id), similarity in ranked
     ]
 
 
@@ -594,7 +674,7 @@ JSON:"""
 
 
 def filter_link_candidates(
-    all_notes: list[dict[str, Any]], current_note_id: str, existing_links: list[str]
+    all_notes: list[dict[str, Any]], current_note_id: str, existing_links: Iterable[str]
 ) -> list[dict[str, Any]]:
     """Filter notes to get valid link candidates.
 
@@ -603,13 +683,13 @@ def filter_link_candidates(
     Args:
         all_notes: All notes in the system
         current_note_id: ID of the current note
-        existing_links: IDs of notes already linked from current note
+        existing_links: IDs of notes already linked from current note (any iterable;
+            collected into a set so each candidate check is O(1))
 
     Returns:
         List of candidate notes (excluding current note and existing links)
     """
-    excluded_ids = set(existing_links)
-    excluded_ids.add(current_note_id)
+    excluded_ids = {current_note_id, *existing_links}
 
     return [note for note in all_notes if note["id"] not in excluded_ids and note.get("content")]
 
@@ -668,56 +748,31 @@ Example: [{{"note_id": "psychological-safety", "confidence": 0.85, "reason": "Bo
 JSON:"""
 
 
-def extract_json_payload(text: str, opener: str = "[") -> str | None:
-    """Extract the first balanced JSON array or object from surrounding text.
+def decode_embedded_json(text: str, opener: str = "[") -> Any | None:
+    """Decode the JSON value that starts at the first opener in text.
 
     Pure function: No I/O, no side effects, deterministic.
 
-    Small models routinely wrap their output in prose ("Sure! Here is the
-    JSON: [...] Hope that helps!"). Bracket matching recovers the payload
-    where a plain json.loads fails. Quote- and escape-aware, so brackets
-    inside string values do not throw off the depth count.
+    Recovers payloads a model wrapped in prose ("Here is the JSON: [...]").
+    raw_decode parses from the opener in C and stops at the end of that
+    value, so trailing text (even with more brackets) is ignored.
 
     Args:
         text: Raw text that may contain a JSON payload
         opener: "[" for arrays, "{" for objects
 
     Returns:
-        The JSON substring, or None if no balanced payload is found
+        The decoded value, or None if there is no opener or it does not
+        begin valid JSON
     """
-    closer = "]" if opener == "[" else "}"
-
     start = text.find(opener)
     if start == -1:
         return None
-
-    depth = 0
-    in_string = False
-    escaped = False
-
-    for index in range(start, len(text)):
-        char = text[index]
-
-        if escaped:
-            escaped = False
-            continue
-        if char == "\\":
-            escaped = True
-            continue
-        if char == '"':
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-
-        if char == opener:
-            depth += 1
-        elif char == closer:
-            depth -= 1
-            if depth == 0:
-                return text[start : index + 1]
-
-    return None
+    try:
+        data, _ = _JSON_DECODER.raw_decode(text, start)
+    except json.JSONDecodeError:
+        return None
+    return data
 
 
 def parse_json_response(
@@ -772,20 +827,14 @@ def parse_json_response(
 
     except json.JSONDecodeError:
         # Fallback 1: the payload is embedded in prose ("Here is the JSON: [...]")
-        opener = "[" if expected_type == "array" else "{"
-        extracted = extract_json_payload(response, opener=opener)
-        if extracted is not None:
-            try:
-                data = json.loads(extracted)
-                if expected_type == "array":
-                    if isinstance(data, dict):
-                        return [data]
-                    if isinstance(data, list):
-                        return data
-                elif isinstance(data, dict):
-                    return data
-            except json.JSONDecodeError:
-                pass
+        data = decode_embedded_json(response, "[" if expected_type == "array" else "{")
+        if expected_type == "array":
+            if isinstance(data, dict):
+                return [data]
+            if isinstance(data, list):
+                return data
+        elif isinstance(data, dict):
+            return data
 
         # Fallback 2: newline-delimited JSON objects (some models emit these)
         if expected_type == "array":
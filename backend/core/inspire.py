@@ -12,15 +12,18 @@ Suggestion philosophy (see #259):
 """
 
 import hashlib
+import heapq
 import json
 import logging
 import re
 from typing import Any
 
-from core.ai import cosine_similarity, extract_json_payload
+from core.ai import cosine_similarity_from_norms, decode_embedded_json, vector_norm
 
 logger = logging.getLogger(__name__)
 
+_TITLE_WORD_RE = re.compile(r"[a-z0-9]+")
+
 # --- thresholds ------------------------------------------------------------
 # These deliberately mirror the guidance the note editor shows while typing
 # (NoteEditorForm.tsx). If you change one, change both, or Inspire will start
@@ -74,7 +77,7 @@ def _title_tokens(title: str) -> frozenset[str]:
     Lowercases, drops punctuation and stopwords, and spells out small numbers
     so numeric and written forms of the same title agree.
     """
-    words = re.findall(r"[a-z0-9]+", title.lower())
+    words = _TITLE_WORD_RE.findall(title.lower())
     return frozenset(
         _NUMBER_WORDS.get(w, w) for w in words if _NUMBER_WORDS.get(w, w) not in _STOPWORDS
     )
@@ -118,8 +121,7 @@ def find_orphan_notes(notes: list[dict[str, Any]], limit: int = 10) -> list[dict
         for note in notes
         if note.get("link_count", 0) == 0 and note.get("backlink_count", 0) == 0
     ]
-    orphans.sort(key=lambda x: int(x["content_length"]), reverse=True)
-    return orphans[:limit]
+    return heapq.nlargest(limit, orphans, key=lambda x: int(x["content_length"]))
 
 
 def find_oversized_notes(
@@ -149,8 +151,7 @@ def find_oversized_notes(
         for note in notes
         if note.get("content_length", len(note.get("content", ""))) > min_length
     ]
-    oversized.sort(key=lambda x: int(x["content_length"]), reverse=True)
-    return oversized[:limit]
+    return heapq.nlargest(limit, oversized, key=lambda x: int(x["content_length"]))
 
 
 def find_promotion_candidates(
@@ -181,18 +182,21 @@ def find_promotion_candidates(
         for note in notes
         if note.get("backlink_count", 0) >= min_backlinks
     ]
-    candidates.sort(key=lambda x: int(x["backlink_count"]), reverse=True)
-    return candidates[:limit]
+    return heapq.nlargest(limit, candidates, key=lambda x: int(x["backlink_count"]))
 
 
 # --- similarity-based opportunities ----------------------------------------
 
+_NO_LINKS: frozenset[str] = frozenset()
+"""Shared default for notes absent from the link map (no set built per note)."""
+
 
 def find_unlinked_similar_notes(
     note_embeddings: list[tuple[str, str, list[float]]],
     existing_links: dict[str, set[str]],
     similarity_threshold: float = CONNECTION_MIN_SIMILARITY,
     limit: int = 10,
+    embedding_norms: list[float | None] | None = None,
 ) -> list[dict[str, Any]]:
     """Find semantically similar notes that aren't linked to each other.
 
@@ -207,6 +211,8 @@ def find_unlinked_similar_notes(
         existing_links: Dict mapping note_id -> set of linked note_ids (bidirectional)
         similarity_threshold: Minimum cosine similarity to consider (0.0 to 1.0)
         limit: Maximum results to return
+        embedding_norms: Optional stored L2 norms, parallel to note_embeddings
+            ('embedding_norm' from the graph); None entries are computed
 
     Returns:
         List of opportunities with similarity scores and kind, highest first
@@ -214,19 +220,36 @@ def find_unlinked_similar_notes(
     opportunities: list[dict[str, Any]] = []
     n = len(note_embeddings)
 
+    # Every note meets every other one, so take each norm once up front rather
+    # than twice per pair inside cosine_similarity (same arithmetic, same result).
+    # Norms stored at ingest skip even that, leaving one dot product per pair.
+    stored_norms = embedding_norms or [None] * n
+    norms = [
+        vector_norm(embedding) if norm is None else norm
+        for (_, _, embedding), norm in zip(note_embeddings, stored_norms, strict=True)
+    ]
+
+    # Fold both link directions into one neighbour set per note up front, so
+    # each pair needs a single membership test (callers may pass either direction)
+    linked: dict[str, set[str]] = {}
+    for source, targets in existing_links.items():
+        linked.setdefault(source, set()).update(targets)
+        for target in targets:
+            linked.setdefault(target, set()).add(source)
+
     for i in range(n):
         note_a_id, note_a_title, embedding_a = note_embeddings[i]
+        norm_a = norms[i]
+        a_links = linked.get(note_a_id, _NO_LINKS)
 
         for j in range(i + 1, n):
             note_b_id, note_b_title, embedding_b = note_embeddings[j]
 
-            # Skip if already linked (check both directions)
-            a_links = existing_links.get(note_a_id, set())
-            b_links = existing_links.get(note_b_id, set())
-            if note_b_id in a_links or note_a_id in b_links:
+            # Skip if already linked (either direction)
+            if note_b_id in a_links:
                 continue
 
-            similarity = cosine_similarity(embedding_a, embedding_b)
+            similarity = cosine_similarity_from_norms(embedding_a, embedding_b, norm_a, norms[j])
             if similarity < similarity_threshold:
                 continue
 
@@ -247,8 +270,9 @@ def find_unlinked_similar_notes(
                 }
             )
 
-    opportunities.sort(key=lambda x: float(x["similarity"]), reverse=True)
-    return opportunities[:limit]
+    # Pairs grow with N^2 while limit stays small: keep a bounded heap instead
+    # of sorting them all (same order as a stable descending sort, ties included)
+    return heapq.nlargest(limit, opportunities, key=lambda x: float(x["similarity"]))
 
 
 def find_hub_opportunities(
@@ -371,6 +395,7 @@ def find_uncovered_tag_clusters(
 # --- composition ------------------------------------------------------------
 
 SUGGESTION_TYPES = ("orphan", "duplicate", "connection", "hub", "promote", "split", "article")
+_VALID_SUGGESTION_TYPES = frozenset(SUGGESTION_TYPES)
 
 # Round-robin order. Highest-signal problems come first so that when the
 # requested limit is small, the user sees the things most worth fixing.
@@ -643,6 +668,11 @@ JSON:"""
 # --- parsing ----------------------------------------------------------------
 
 
+_REQUIRED_SUGGESTION_FIELDS = frozenset(
+    {"type", "title", "description", "related_notes", "action_text"}
+)
+
+
 def parse_inspiration_response(raw_response: str) -> list[dict[str, Any]]:
     """Parse LLM response into structured suggestions.
 
@@ -672,18 +702,12 @@ def parse_inspiration_response(raw_response: str) -> list[dict[str, Any]]:
     try:
         data = json.loads(response)
     except json.JSONDecodeError:
-        # Model wrapped the array in prose - recover it
-        extracted = extract_json_payload(response, opener="[")
-        if extracted is None:
-            logger.warning("No JSON array found in inspiration response")
+        # Model wrapped the array in prose - decode from the first "["
+        data = decode_embedded_json(response, "[")
+        if data is None:
+            logger.warning("No valid JSON array found in inspiration response")
             logger.debug("Raw response (first 500 chars): %s", raw_response[:500])
             return []
-        try:
-            data = json.loads(extracted)
-        except json.JSONDecodeError:
-            logger.warning("Extracted inspiration payload is not valid JSON")
-            logger.debug("Extracted (first 500 chars): %s", extracted[:500])
-            return []
 
     if isinstance(data, dict):
         data = [data]
@@ -692,15 +716,14 @@ def parse_inspiration_response(raw_response: str) -> list[dict[str, Any]]:
         return []
 
     valid_suggestions = []
-    required_fields = {"type", "title", "description", "related_notes", "action_text"}
-
     for item in data:
         if not isinstance(item, dict):
             continue
-        if not required_fields.issubset(item.keys()):
-            logger.debug("Suggestion missing fields: %s", required_fields - set(item.keys()))
+        if not _REQUIRED_SUGGESTION_FIELDS.issubset(item):
+            logger.debug("Suggestion missing fields: %s", _REQUIRED_SUGGESTION_FIELDS - item.keys())
             continue
-        if item["type"] not in SUGGESTION_TYPES:
+        # str check first: set membership would raise on an unhashable type value
+        if not isinstance(item["type"], str) or item["type"] not in _VALID_SUGGESTION_TYPES:
             logger.debug("Invalid suggestion type: %s", item["type"])
             continue
         if not isinstance(item["related_notes"], list):
@@ -19,6 +19,11 @@ from pygments.formatters import HtmlFormatter
 from pygments.lexers import get_lexer_by_name, guess_lexer
 from pygments.util import ClassNotFound
 
+_ARTICLE_LINK_RE = re.compile(r"\[\[article:(\d+)\]\]")
+_NOTE_LINK_RE = re.compile(r"\[\[([a-z0-9-]+)\]\]")
+_SLUG_STRIP_RE = re.compile(r"[^a-z0-9\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def _highlight_code(code: str, lang: str, **_kwargs: Any) -> str:
     """Highlight code using Pygments.
@@ -55,9 +60,8 @@ def _convert_wikilinks(html: str) -> str:
     Returns:
         HTML with wikilinks converted to anchor tags
     """
-    # First, handle article links [[article:id]]
-    article_pattern = r"\[\[article:(\d+)\]\]"
 
+    # First, handle article links [[article:id]]
     def replace_article_link(match: re.Match[str]) -> str:
         article_id = match.group(1)
         return (
@@ -65,16 +69,14 @@ def _convert_wikilinks(html: str) -> str:
             f'class="wikilink wikilink-article">📄 Article {article_id}</a>'
         )
 
-    html = re.sub(article_pattern, replace_article_link, html)
+    html = _ARTICLE_LINK_RE.sub(replace_article_link, html)
 
     # Then, handle note links [[note-id]]
-    note_pattern = r"\[\[([a-z0-9-]+)\]\]"
-
     def replace_note_link(match: re.Match[str]) -> str:
         note_id = match.group(1)
         return f'<a href="/knowledge-base/notes/{note_id}" class="wikilink">{match.group(0)}</a>'
 
-    return re.sub(note_pattern, replace_note_link, html)
+    return _NOTE_LINK_RE.sub(replace_note_link, html)
 
 
 def _slugify_heading(title: str) -> str:
@@ -84,8 +86,8 @@ def _slugify_heading(title: str) -> str:
     frontend/src/components/ArticleTableOfContents.tsx, which computes the
     same ids from raw markdown to build its jump links.
     """
-    slug = re.sub(r"[^a-z0-9\s-]", "", title.lower())
-    return re.sub(r"\s+", "-", slug)
+    slug = _SLUG_STRIP_RE.sub("", title.lower())
+    return _WHITESPACE_RE.sub("-", slug)
 
 
 def render_markdown_to_html(markdown_content: str) -> str:
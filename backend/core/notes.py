@@ -7,6 +7,11 @@ All functions are deterministic and fully unit-testable.
 import re
 from typing import Any
 
+# Compiled once at import; these run on every note save/render
+_WIKILINK_RE = re.compile(r"\[\[([a-z0-9-]+)\]\]")
+# Used with fullmatch: a "$" anchor would also accept a trailing newline
+_NOTE_ID_RE = re.compile(r"[a-z0-9]+-[a-z0-9]+")
+
 
 def extract_wikilinks(content: str) -> list[str]:
     """Extract [[note-id]] wikilinks from markdown content.
@@ -25,8 +30,7 @@ def extract_wikilinks(content: str) -> list[str]:
         >>> extract_wikilinks("No links here")
         []
     """
-    pattern = r"\[\[([a-z0-9-]+)\]\]"
-    return re.findall(pattern, content)
+    return _WIKILINK_RE.findall(content)
 
 
 def validate_note_id(note_id: str) -> bool:
@@ -50,8 +54,7 @@ def validate_note_id(note_id: str) -> bool:
         >>> validate_note_id("UPPERCASE")
         False
     """
-    pattern = r"^[a-z0-9]+-[a-z0-9]+$"
-    return bool(re.match(pattern, note_id))
+    return _NOTE_ID_RE.fullmatch(note_id) is not None
 
 
 def build_graph_data(notes: list[dict[str, Any]]) -> dict[str, Any]:
@@ -141,22 +144,20 @@ def build_local_subgraph(
         >>> len(subgraph['nodes'])  # center + neighbor only
         2
     """
-    # Build adjacency map for efficient traversal
-    adjacency: dict[str, set[str]] = {}
-    for note in notes:
-        note_id = note["id"]
-        adjacency[note_id] = set(note.get("links", []))
+    # Index notes by ID once; links are only read for notes the BFS reaches,
+    # so unreachable notes never pay for a set build
+    notes_by_id = {note["id"]: note for note in notes}
 
     # BFS to find all notes within depth hops
     visited = {center_note_id}
     current_level = {center_note_id}
 
     for _ in range(depth):
-        next_level = set()
+        next_level: set[str] = set()
         for node_id in current_level:
-            if node_id in adjacency:
-                neighbors = adjacency[node_id]
-                next_level.update(neighbors - visited)
+            note = notes_by_id.get(node_id)
+            if note is not None:
+                next_level.update(link for link in note.get("links", []) if link not in visited)
 
         visited.update(next_level)
         current_level = next_level
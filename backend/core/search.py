@@ -5,9 +5,12 @@ functionality like snippet extraction and text matching.
 """
 
 import re
+from functools import lru_cache
 
 from rapidfuzz import fuzz
 
+_WORD_RE = re.compile(r"\S+")
+
 
 def fuzzy_match_text(query: str, text: str, threshold: int = 80) -> float:
     """Score how well a query matches a text with typo-tolerant matching.
@@ -68,6 +71,43 @@ def _fuzzy_match_token(token: str, text: str, words: list[str], threshold: int)
     return best
 
 
+@lru_cache(maxsize=256)
+def _query_pattern(query: str) -> re.Pattern[str]:
+    """Compile a case-insensitive literal pattern for a query (cached per query).
+
+    Searching the original content with this avoids allocating a lowercased
+    copy of every document, and match offsets always index the original
+    string (str.lower() can change length, e.g. "İ" -> "i̇").
+    """
+    return re.compile(re.escape(query), re.IGNORECASE)
+
+
+def _trim_to_word_boundaries(content: str, start: int, end: int, max_shift: int) -> str:
+    """Slice content[start:end] for a snippet, avoiding cut-off words at the edges.
+
+    A truncated edge moves to the nearest space within max_shift characters
+    and gets an ellipsis. Both scans are bounded str.find/rfind calls on the
+    original content, so the text is sliced once.
+    """
+    left, right = start, end
+
+    if start > 0:
+        # Find first word boundary to avoid starting mid-word
+        first_space = content.find(" ", start, min(end, start + max_shift))
+        if first_space != -1:
+            left = first_space + 1
+
+    if end < len(content):
+        # Find last word boundary to avoid ending mid-word
+        last_space = content.rfind(" ", max(left, end - max_shift + 1), end)
+        if last_space != -1:
+            right = last_space
+
+    prefix = "..." if start > 0 else ""
+    suffix = "..." if end < len(content) else ""
+    return (prefix + content[left:right] + suffix).strip()
+
+
 def _best_token_match(
     content_lower: str, query_lower: str, threshold: int = 80
 ) -> tuple[int, int] | None:
@@ -87,7 +127,7 @@ def _best_token_match(
                 best_pos, best_len, best_score = pos, len(token), 2.0
             continue
 
-        for match in re.finditer(r"\S+", content_lower):
+        for match in _WORD_RE.finditer(content_lower):
             word = match.group()
             if abs(len(word) - len(token)) <= 2:
                 similarity = fuzz.ratio(token, word) / 100.0
@@ -131,16 +171,16 @@ def extract_snippet(
         return content[:max_snippet_length] if content else ""
 
     query_lower = query.lower().strip()
-    content_lower = content.lower()
 
     # Find first match position
-    match_pos = content_lower.find(query_lower)
-    match_len = len(query_lower)
-
-    if match_pos == -1:
+    match = _query_pattern(query_lower).search(content)
+    if match is not None:
+        match_pos, match_len = match.start(), match.end() - match.start()
+    else:
         # Full query not found verbatim (multi-word or fuzzy hit) - anchor
         # on the best-matching query token instead
-        token_match = _best_token_match(content_lower, query_lower)
+        match_pos, match_len = -1, len(query_lower)
+        token_match = _best_token_match(content.lower(), query_lower)
         if token_match is not None:
             match_pos, match_len = token_match
 
@@ -166,25 +206,7 @@ def extract_snippet(
         start = max(0, match_pos - half_length)
         end = min(len(content), start + max_snippet_length)
 
-    # Extract snippet
-    snippet = content[start:end]
-
-    # Clean up word boundaries
-    if start > 0:
-        # Find first word boundary to avoid starting mid-word
-        first_space = snippet.find(" ")
-        if first_space != -1 and first_space < 20:
-            snippet = snippet[first_space + 1 :]
-        snippet = "..." + snippet
-
-    if end < len(content):
-        # Find last word boundary to avoid ending mid-word
-        last_space = snippet.rfind(" ")
-        if last_space != -1 and len(snippet) - last_space < 20:
-            snippet = snippet[:last_space]
-        snippet = snippet + "..."
-
-    return snippet.strip()
+    return _trim_to_word_boundaries(content, start, end, max_shift=20)
 
 
 def extract_multiple_snippets(
@@ -212,51 +234,26 @@ def extract_multiple_snippets(
         return [content[:max_snippet_length]] if content else []
 
     query_lower = query.lower().strip()
-    content_lower = content.lower()
-
-    # Find all match positions
-    matches: list[int] = []
-    pos = 0
-    while len(matches) < max_snippets * 2:  # Find more than we need to filter
-        pos = content_lower.find(query_lower, pos)
-        if pos == -1:
-            break
-        matches.append(pos)
-        pos += len(query_lower)
-
-    if not matches:
-        return [extract_snippet(content, query, context_chars, max_snippet_length)]
 
-    # Filter to non-overlapping matches (at least max_snippet_length apart)
-    filtered_matches = [matches[0]]
-    for match_pos in matches[1:]:
-        if match_pos - filtered_matches[-1] >= max_snippet_length:
+    # Single scan: keep matches at least max_snippet_length apart so snippets
+    # don't overlap, and stop as soon as we have enough
+    filtered_matches: list[int] = []
+    for match in _query_pattern(query_lower).finditer(content):
+        match_pos = match.start()
+        if not filtered_matches or match_pos - filtered_matches[-1] >= max_snippet_length:
             filtered_matches.append(match_pos)
             if len(filtered_matches) >= max_snippets:
                 break
 
+    if not filtered_matches:
+        return [extract_snippet(content, query, context_chars, max_snippet_length)]
+
     # Generate snippets for each match
     snippets = []
-    for match_pos in filtered_matches[:max_snippets]:
+    for match_pos in filtered_matches:
         start = max(0, match_pos - context_chars)
         end = min(len(content), match_pos + len(query) + context_chars)
-
-        snippet = content[start:end]
-
-        # Clean up boundaries
-        if start > 0:
-            first_space = snippet.find(" ")
-            if first_space != -1 and first_space < 15:
-                snippet = snippet[first_space + 1 :]
-            snippet = "..." + snippet
-
-        if end < len(content):
-            last_space = snippet.rfind(" ")
-            if last_space != -1 and len(snippet) - last_space < 15:
-                snippet = snippet[:last_space]
-            snippet = snippet + "..."
-
-        snippets.append(snippet.strip())
+        snippets.append(_trim_to_word_boundaries(content, start, end, max_shift=15))
 
     return snippets
 
@@ -278,5 +275,5 @@ def find_best_match_position(content: str, query: str) -> int | None:
     if not content or not query:
         return None
 
-    pos = content.lower().find(query.lower().strip())
-    return pos if pos != -1 else None
+    match = _query_pattern(query.lower().strip()).search(content)
+    return match.start() if match is not None else None
@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import re
+import shutil
 import time
 import uuid
 from collections.abc import AsyncIterator
@@ -337,6 +338,8 @@ MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 # Whole-request ceiling: file limit plus slack for multipart framing (#224)
 MAX_UPLOAD_BODY_SIZE = MAX_FILE_SIZE + 16 * 1024
 UPLOAD_READ_CHUNK = 1024 * 1024  # 1 MB
+# Enough leading bytes for every IMAGE_MAGIC_BYTES check (WebP reads [8:12])
+MAGIC_HEAD_SIZE = 16
 ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
 # Magic bytes for common image formats
 IMAGE_MAGIC_BYTES = {
@@ -417,7 +420,7 @@ def _validate_image_magic_bytes(content: bytes) -> str | None:
     """Validate image file by checking magic bytes.
 
     Args:
-        content: File content bytes
+        content: Leading file bytes (at least MAGIC_HEAD_SIZE when available)
 
     Returns:
         Detected MIME type or None if invalid
@@ -431,6 +434,69 @@ def _validate_image_magic_bytes(content: bytes) -> str | None:
     return None
 
 
+async def _validate_upload(file: UploadFile) -> tuple[int, str]:
+    """Check an upload's declared type, size and magic bytes.
+
+    Args:
+        file: The uploaded file
+
+    Returns:
+        (size in bytes, MIME type detected from content)
+
+    Raises:
+        HTTPException: 400 for a disallowed type, empty, unreadable or
+            non-image file; 413 when over MAX_FILE_SIZE
+    """
+    # 1. Validate Content-Type header
+    if file.content_type not in ALLOWED_IMAGE_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type '{file.content_type}'. Allowed: {', '.join(ALLOWED_IMAGE_TYPES)}",
+        )
+
+    # 2. Measure in chunks with a hard size cutoff - never the whole body at
+    # once, so a lying/chunked client can't spike memory (#224). Nothing is
+    # kept: the body stays in UploadFile's spooled temp file, and only the
+    # leading bytes are read back for the magic-byte check
+    size = 0
+    try:
+        while chunk := await file.read(UPLOAD_READ_CHUNK):
+            size += len(chunk)
+            if size > MAX_FILE_SIZE:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)} MB",
+                )
+        await file.seek(0)
+        head = await file.read(MAGIC_HEAD_SIZE)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error reading uploaded file: %s", e)
+        raise HTTPException(status_code=400, detail="Failed to read uploaded file") from e
+
+    if size == 0:
+        raise HTTPException(status_code=400, detail="Empty file uploaded")
+
+    # 4. Validate magic bytes (actual file content, not just header)
+    detected_type = _validate_image_magic_bytes(head)
+    if detected_type is None:
+        raise HTTPException(
+            status_code=400,
+            detail="File content does not match a valid image format",
+        )
+
+    # Log if Content-Type doesn't match detected type (potential spoofing attempt)
+    if detected_type != file.content_type:
+        logger.warning(
+            "Content-Type mismatch: header=%s, detected=%s",
+            file.content_type,
+            detected_type,
+        )
+
+    return size, detected_type
+
+
 def enforce_upload_body_size(request: Request) -> None:
     """Reject oversized uploads before the multipart body is parsed (#224).
 
@@ -476,64 +542,19 @@ async def upload_image(
     - Magic bytes validation (actual file content)
     - Sanitized filename (UUID-based)
     """
-    # 1. Validate Content-Type header
-    if file.content_type not in ALLOWED_IMAGE_TYPES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type '{file.content_type}'. Allowed: {', '.join(ALLOWED_IMAGE_TYPES)}",
-        )
-
-    # 2. Read in chunks with a hard size cutoff - never the whole body at
-    # once, so a lying/chunked client can't spike memory (#224)
-    chunks: list[bytes] = []
-    size = 0
-    try:
-        while chunk := await file.read(UPLOAD_READ_CHUNK):
-            size += len(chunk)
-            if size > MAX_FILE_SIZE:
-                raise HTTPException(
-                    status_code=413,
-                    detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)} MB",
-                )
-            chunks.append(chunk)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error("Error reading uploaded file: %s", e)
-        raise HTTPException(status_code=400, detail="Failed to read uploaded file") from e
-    content = b"".join(chunks)
-
-    if len(content) == 0:
-        raise HTTPException(status_code=400, detail="Empty file uploaded")
-
-    # 4. Validate magic bytes (actual file content, not just header)
-    detected_type = _validate_image_magic_bytes(content)
-    if detected_type is None:
-        raise HTTPException(
-            status_code=400,
-            detail="File content does not match a valid image format",
-        )
-
-    # Log if Content-Type doesn't match detected type (potential spoofing attempt)
-    if detected_type != file.content_type:
-        logger.warning(
-            "Content-Type mismatch: header=%s, detected=%s",
-            file.content_type,
-            detected_type,
-        )
+    size, detected_type = await _validate_upload(file)
 
     # 5. Generate sanitized filename (UUID-based, ignore user-provided filename)
     # This prevents path traversal and other filename-based attacks
     temp_filename = f"{uuid.uuid4()}.tmp"
     temp_path = UPLOAD_DIR / temp_filename
 
-    # Save file temporarily
+    # Save file temporarily, streamed from the spool in chunks
     try:
+        await file.seek(0)
         with open(temp_path, "wb") as f:
-            f.write(content)
-        logger.info(
-            "Image uploaded: %s (size=%d, type=%s)", temp_filename, len(content), detected_type
-        )
+            shutil.copyfileobj(file.file, f, UPLOAD_READ_CHUNK)
+        logger.info("Image uploaded: %s (size=%d, type=%s)", temp_filename, size, detected_type)
     except Exception as e:
         logger.error("Error uploading image: %s", e)
         raise HTTPException(status_code=500, detail="Failed to upload image") from e
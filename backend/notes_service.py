@@ -96,6 +96,41 @@ class NotesService:
 
         return note
 
+    def bulk_create_notes(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Create several notes with one ID lookup and one Neo4j transaction.
+
+        Args:
+            items: Dicts with 'content' and optional 'title', 'tags' and
+                'is_reference' (the create_note arguments)
+
+        Returns:
+            Created note dicts, in input order (created_at increasing)
+
+        Raises:
+            RuntimeError: If Neo4j is not available
+        """
+        self._require_neo4j()
+
+        existing_ids = self._get_all_note_ids()
+        notes = []
+        for item in items:
+            note_id = self.id_generator.generate(existing_ids)
+            existing_ids.add(note_id)
+            notes.append(
+                {
+                    "id": note_id,
+                    "content": item["content"],
+                    "title": item.get("title"),
+                    "tags": item.get("tags") or [],
+                    "links": self.wikilink_parser.extract_links(item["content"]),
+                    "is_reference": item.get("is_reference", False),
+                }
+            )
+
+        created = self.neo4j.create_notes(notes, author="Erik")
+        logger.info("Created %d notes", len(created))
+        return created
+
     def get_note(self, note_id: str) -> dict[str, Any] | None:
         """Get note by ID.
 
@@ -290,7 +325,7 @@ class NotesService:
         """Get notes that have embeddings for similarity analysis.
 
         Returns:
-            List of dicts with id, title, embedding
+            List of dicts with id, title, embedding, embedding_norm
         """
         self._require_neo4j()
         return self.neo4j.get_notes_with_embeddings()
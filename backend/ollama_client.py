@@ -5,12 +5,14 @@ receive a RoutingLLMClient (see llm_client.py) that delegates each call here
 or to the hosted API chain based on the "llm_use_api" feature flag.
 """
 
+import heapq
 import logging
 import time
 from collections.abc import Generator
 from typing import Any
 
 from config import get_settings
+from core.ai import cosine_similarity, rank_documents_by_similarity
 from utils import calculate_content_hash
 
 logger = logging.getLogger(__name__)
@@ -54,7 +56,7 @@ class OllamaClient:
         try:
             import ollama
 
-            client = ollama.Client(host=self.host)
+            client = ollama.Client(host=self.host, timeout=settings.ollama_request_timeout)
             # Test connection
             client.list()
             self.client = client
@@ -280,25 +282,17 @@ class OllamaClient:
                 "Computing similarities with %d precomputed embeddings...",
                 len(documents_with_embeddings),
             )
-            scored_docs = []
-
             for doc in documents_with_embeddings:
-                doc_embedding = doc.get("embedding")
-                if not doc_embedding:
+                if not doc.get("embedding"):
                     logger.warning(
                         "Document %s missing embedding, skipping", doc.get("id", "unknown")
                     )
-                    continue
 
-                # Calculate cosine similarity
-                similarity = self._cosine_similarity(query_embedding, doc_embedding)
-                # Add score to document
-                doc_with_score = {**doc, "score": similarity}
-                scored_docs.append((similarity, doc_with_score))
-
-            # Sort by similarity (highest first) and return top_k
-            scored_docs.sort(key=lambda x: x[0], reverse=True)
-            results = [doc for _, doc in scored_docs[:top_k]]
+            # Shared ranking: uses each document's stored 'embedding_norm' when
+            # present and copies only the top_k winners to add their score
+            results = rank_documents_by_similarity(
+                query_embedding, documents_with_embeddings, top_k
+            )
 
             logger.info("Semantic search complete: returning %d results", len(results))
             if results:
@@ -384,16 +378,16 @@ class OllamaClient:
                 len(documents),
             )
 
-            # Sort by similarity (highest first) and return top_k
-            scored_docs.sort(key=lambda x: x[0], reverse=True)
-            results = [doc for _, doc in scored_docs[:top_k]]
+            # Select top_k (highest first) without sorting everything
+            top = heapq.nlargest(top_k, scored_docs, key=lambda x: x[0])
+            results = [doc for _, doc in top]
 
             logger.info("Semantic search complete: returning %d results", len(results))
             if results:
                 logger.info(
                     "Top result: '%s' (score: %.3f)",
                     results[0].get("title", "Untitled"),
-                    scored_docs[0][0],
+                    top[0][0],
                 )
 
             return results
@@ -594,18 +588,7 @@ Summary:"""
         Returns:
             Cosine similarity score (0 to 1)
         """
-        if len(vec1) != len(vec2):
-            return 0.0
-
-        dot_product = sum(a * b for a, b in zip(vec1, vec2, strict=True))
-        magnitude1 = sum(a * a for a in vec1) ** 0.5
-        magnitude2 = sum(b * b for b in vec2) ** 0.5
-
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
-
-        similarity: float = dot_product / (magnitude1 * magnitude2)
-        return similarity
+        return cosine_similarity(vec1, vec2)
 
 
 # Global instance
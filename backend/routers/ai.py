@@ -153,7 +153,11 @@ def _retrieve_documents_for_synthesis(
                 )
                 if full_doc:
                     documents_with_embeddings.append(
-                        {**full_doc, "embedding": emb_data["embedding"]}
+                        {
+                            **full_doc,
+                            "embedding": emb_data["embedding"],
+                            "embedding_norm": emb_data.get("embedding_norm"),
+                        }
                     )
             if documents_with_embeddings:
                 docs = ollama.semantic_search_with_precomputed_embeddings(
@@ -429,7 +433,11 @@ def ask_question(
 
                 if full_doc:
                     # Combine full document with its embedding
-                    doc_with_embedding = {**full_doc, "embedding": emb_data["embedding"]}
+                    doc_with_embedding = {
+                        **full_doc,
+                        "embedding": emb_data["embedding"],
+                        "embedding_norm": emb_data.get("embedding_norm"),
+                    }
                     documents_with_embeddings.append(doc_with_embedding)
 
             logger.info("Q&A: Matched %d documents with embeddings", len(documents_with_embeddings))
@@ -737,17 +745,17 @@ def suggest_stream(
         )
 
         try:
-            # Generate tags with token streaming for real-time progress
-            tag_text = ""
+            # Generate tags with token streaming for real-time progress. Tokens
+            # are collected and joined once; += would recopy the text per token
+            tag_tokens: list[str] = []
             token_count = 0
             for text in _ollama.generate_stream(tag_prompt, role="structured", num_ctx=4096):
-                tag_text += text
+                tag_tokens.append(text)
                 token_count += 1
                 # Send heartbeat every 10 tokens to show activity
                 if token_count % 10 == 0:
-                    yield format_sse(
-                        {"type": "generating", "phase": "tags", "tokens": token_count}
-                    )
+                    yield format_sse({"type": "generating", "phase": "tags", "tokens": token_count})
+            tag_text = "".join(tag_tokens)
 
             if tag_text:
                 tags_data = ai_core.parse_json_response(tag_text, expected_type="array")
@@ -789,18 +797,17 @@ def suggest_stream(
 
             try:
                 # Generate links with token streaming for real-time progress
-                link_text = ""
+                link_tokens: list[str] = []
                 token_count = 0
-                for text in _ollama.generate_stream(
-                    link_prompt, role="structured", num_ctx=8192
-                ):
-                    link_text += text
+                for text in _ollama.generate_stream(link_prompt, role="structured", num_ctx=8192):
+                    link_tokens.append(text)
                     token_count += 1
                     # Send heartbeat every 10 tokens to show activity
                     if token_count % 10 == 0:
                         yield format_sse(
                             {"type": "generating", "phase": "links", "tokens": token_count}
                         )
+                link_text = "".join(link_tokens)
 
                 if link_text:
                     links_data = ai_core.parse_json_response(link_text, expected_type="array")
@@ -1152,9 +1159,9 @@ def editor_assist_stream(
                 return
 
             try:
-                link_text = ""
-                for chunk in _ollama.generate_stream(prompt, role="structured", num_ctx=8192):
-                    link_text += chunk
+                link_text = "".join(
+                    _ollama.generate_stream(prompt, role="structured", num_ctx=8192)
+                )
 
                 if not link_text:
                     logger.error("Editor /link stream: empty response from LLM")
@@ -77,6 +77,7 @@ def _analyze(
     pairs = inspire_core.find_unlinked_similar_notes(
         note_embeddings=note_embeddings,
         existing_links=all_links,
+        embedding_norms=[note.get("embedding_norm") for note in notes_with_embeddings],
         limit=30,
     )
 
@@ -268,6 +269,7 @@ def get_connection_opportunities(
     pairs = inspire_core.find_unlinked_similar_notes(
         note_embeddings=note_embeddings,
         existing_links=all_links,
+        embedding_norms=[note.get("embedding_norm") for note in notes_with_embeddings],
         similarity_threshold=similarity_threshold,
         limit=max(limit, 30),
     )
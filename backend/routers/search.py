@@ -4,6 +4,7 @@ Uses FastAPI dependency injection for testability. Dependencies can be
 overridden in tests using app.dependency_overrides.
 """
 
+import heapq
 import logging
 import time
 from typing import Annotated, Any
@@ -55,11 +56,9 @@ def _text_search(query: str, all_resources: list[dict[str, Any]], top_k: int) ->
                 continue
             scored_docs.append((doc, total_score))
 
-    # Sort by score (descending) and take top_k
-    scored_docs.sort(key=lambda x: x[1], reverse=True)
-    results = [
-        _normalize_search_result(doc, query, score=score) for doc, score in scored_docs[:top_k]
-    ]
+    # Take the top_k by score (descending) without sorting every match
+    top = heapq.nlargest(top_k, scored_docs, key=lambda x: x[1])
+    results = [_normalize_search_result(doc, query, score=score) for doc, score in top]
     return SearchResponse(results=results, count=len(results))
 
 
@@ -250,7 +249,11 @@ def search_resources(
 
                 if full_doc:
                     # Combine full document with its embedding
-                    doc_with_embedding = {**full_doc, "embedding": emb_data["embedding"]}
+                    doc_with_embedding = {
+                        **full_doc,
+                        "embedding": emb_data["embedding"],
+                        "embedding_norm": emb_data.get("embedding_norm"),
+                    }
                     documents_with_embeddings.append(doc_with_embedding)
 
             logger.info("Matched %d documents with embeddings", len(documents_with_embeddings))
@@ -1,8 +1,10 @@
 """Pytest configuration and fixtures."""
 
+import functools
+import math
 import os
 import time
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -10,8 +12,17 @@ from unittest.mock import MagicMock
 os.environ["TESTING"] = "1"
 # Enable LLM features in tests so AI endpoints are registered
 os.environ["LLM_FEATURES_ENABLED"] = "true"
-
+# Bound real-Ollama calls (@slow tests) so a hung model fails the request
+# instead of blocking the runner; the endpoints report it as unavailable
+os.environ.setdefault("OLLAMA_REQUEST_TIMEOUT", "30")
+# Every TestClient/async_client entry runs the lifespan; its startup embedding
+# sync calls get_ollama() directly, outside dependency_overrides, so keep it off
+# even when the container environment enables it
+os.environ["SYNC_EMBEDDINGS_ON_STARTUP"] = "false"
+
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
 import main
@@ -25,6 +36,17 @@ TEST_ADMIN_TOKEN = "test-admin-token-for-ci"
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=1024)
+def _mock_embedding(text: str) -> tuple[float, ...]:
+    """Deterministic 768-dim mock embedding for text, cached per distinct text.
+
+    Uses hash() for some variation between texts; returned as a tuple so the
+    cached value can't be mutated by callers.
+    """
+    base_value = (hash(text) % 100) / 1000
+    return tuple(base_value + (i / 1000) for i in range(768))
+
+
 class MockOllamaClient:
     """Mock OllamaClient for testing AI endpoints without a running Ollama instance.
 
@@ -88,9 +110,7 @@ class MockOllamaClient:
         if not self._available:
             return None
 
-        # Return consistent mock embedding (use hash for some variation)
-        base_value = (hash(text) % 100) / 1000
-        return [base_value + (i / 1000) for i in range(768)]
+        return list(_mock_embedding(text))
 
     def semantic_search(
         self, query: str, documents: list[dict[str, Any]], top_k: int = 5
@@ -188,12 +208,17 @@ class MockOllamaClient:
 
     @staticmethod
     def _cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
-        """Calculate cosine similarity (copied from real client)."""
+        """Calculate cosine similarity (same contract as the real client).
+
+        math.sumprod does the dot products in C, avoiding a Python-level loop
+        over every element of a 768-dim embedding.
+        """
+        # Length check first: cheap, and math.sumprod raises on unequal lengths
         if len(vec1) != len(vec2):
             return 0.0
-        dot_product = sum(a * b for a, b in zip(vec1, vec2, strict=True))
-        magnitude1 = sum(a * a for a in vec1) ** 0.5
-        magnitude2 = sum(b * b for b in vec2) ** 0.5
+        dot_product = math.sumprod(vec1, vec2)
+        magnitude1 = math.sqrt(math.sumprod(vec1, vec1))
+        magnitude2 = math.sqrt(math.sumprod(vec2, vec2))
         if magnitude1 == 0 or magnitude2 == 0:
             return 0.0
         result: float = dot_product / (magnitude1 * magnitude2)
@@ -242,8 +267,7 @@ class MockNotesService:
         if include_embedding:
             for note in notes:
                 # Generate a consistent mock embedding based on note ID
-                base_value = (hash(note["id"]) % 100) / 1000
-                note["embedding"] = [base_value + (i / 1000) for i in range(768)]
+                note["embedding"] = list(_mock_embedding(note["id"]))
 
         return notes
 
@@ -360,6 +384,26 @@ class MockNotesService:
         return self.get_ai_content(note_id)
 
 
+# ============================================================================
+# Marker Hooks
+# ============================================================================
+
+
+def pytest_runtest_setup(item: pytest.Item) -> None:
+    """Skip @pytest.mark.neo4j tests when Neo4j isn't reachable.
+
+    CI runs a Neo4j service, so these still run there; without one they skip
+    instead of failing on connection errors.
+    """
+    if item.get_closest_marker("neo4j") is None:
+        return
+
+    from notes_service import get_notes_service
+
+    if not get_notes_service().neo4j.is_available():
+        pytest.skip("Neo4j not available")
+
+
 # ============================================================================
 # Mock Fixtures
 # ============================================================================
@@ -383,6 +427,20 @@ def mock_ollama_unavailable() -> MockOllamaClient:
     return MockOllamaClient(available=False)
 
 
+@pytest.fixture
+def mock_ollama(request: pytest.FixtureRequest) -> MockOllamaClient:
+    """Get a mock OllamaClient whose state can be parametrized.
+
+    Available (CPU-only) by default. Indirect parametrization takes either an
+    availability flag or a dict of MockOllamaClient keyword arguments:
+        @pytest.mark.parametrize("mock_ollama", [True, False], indirect=True)
+        @pytest.mark.parametrize("mock_ollama", [{"has_gpu": True}], indirect=True)
+    """
+    param = getattr(request, "param", True)
+    kwargs = param if isinstance(param, dict) else {"available": param}
+    return MockOllamaClient(**kwargs)
+
+
 @pytest.fixture
 def mock_notes_service() -> MockNotesService:
     """Get a mock notes service with test data."""
@@ -416,8 +474,36 @@ def reset_auth_tracker() -> Generator[None]:
     auth_tracker.reset()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def static_articles_loaded_once() -> Generator[None]:
+    """Parse the static article corpus once per session.
+
+    Every `with TestClient(app)` re-runs the lifespan, which re-reads and
+    re-renders all article markdown. The corpus doesn't change mid-run, so
+    later startups get a fresh list over the same parsed articles.
+    """
+    articles = main.load_static_articles()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(main, "load_static_articles", lambda: list(articles))
+        yield
+
+
+@pytest.fixture(scope="session")
+def session_client() -> Generator[TestClient]:
+    """One TestClient shared by the whole session.
+
+    Entering a TestClient runs the app lifespan (article loading, feature
+    flags), so the per-test client fixtures below reuse this one and only
+    swap dependency overrides. The client holds no cookies or auth state;
+    per-test state lives in the mocks injected via dependency_overrides.
+    """
+    with TestClient(main.app) as client:
+        yield client
+
+
 @pytest.fixture
 def client(
+    session_client: TestClient,
     mock_ollama_available: MockOllamaClient,
     mock_notes_service: MockNotesService,
 ) -> Generator[TestClient]:
@@ -435,26 +521,52 @@ def client(
     main.app.dependency_overrides[get_ollama] = lambda: mock_ollama_available
     main.app.dependency_overrides[get_notes] = lambda: mock_notes_service
 
-    with TestClient(main.app) as client:
-        yield client
+    yield session_client
 
     # Clear overrides
     main.app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture
+async def async_client(
+    mock_ollama: MockOllamaClient,
+    mock_notes_service: MockNotesService,
+) -> AsyncGenerator[httpx.AsyncClient]:
+    """Async counterpart of `client`, for tests that issue concurrent requests.
+
+    Requests go straight to the ASGI app on the test's event loop (no
+    TestClient thread portal), so independent calls can be awaited together
+    with asyncio.gather. The app lifespan is entered explicitly because
+    ASGITransport does not run startup/shutdown on its own.
+    """
+    from dependencies import get_notes, get_ollama
+
+    main.app.dependency_overrides[get_ollama] = lambda: mock_ollama
+    main.app.dependency_overrides[get_notes] = lambda: mock_notes_service
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with (
+        main.app.router.lifespan_context(main.app),
+        httpx.AsyncClient(transport=transport, base_url="http://testserver") as client,
+    ):
+        yield client
+
+    main.app.dependency_overrides.clear()
+
+
 @pytest.fixture
-def client_real_services() -> Generator[TestClient]:
+def client_real_services(session_client: TestClient) -> TestClient:
     """Get test client with real services (no mocks).
 
     Use this for integration tests that need to hit real Ollama or Neo4j.
     These tests should be marked @slow.
     """
-    with TestClient(main.app) as client:
-        yield client
+    return session_client
 
 
 @pytest.fixture
 def client_with_mock_ollama(
+    session_client: TestClient,
     mock_ollama_available: MockOllamaClient,
 ) -> Generator[tuple[TestClient, MockOllamaClient]]:
     """Get test client with mocked Ollama client.
@@ -467,8 +579,7 @@ def client_with_mock_ollama(
     # Override the dependency
     main.app.dependency_overrides[get_ollama] = lambda: mock_ollama_available
 
-    with TestClient(main.app) as client:
-        yield client, mock_ollama_available
+    yield session_client, mock_ollama_available
 
     # Clear the override
     main.app.dependency_overrides.clear()
@@ -476,6 +587,7 @@ def client_with_mock_ollama(
 
 @pytest.fixture
 def client_with_unavailable_ollama(
+    session_client: TestClient,
     mock_ollama_unavailable: MockOllamaClient,
 ) -> Generator[tuple[TestClient, MockOllamaClient]]:
     """Get test client with Ollama appearing unavailable.
@@ -487,8 +599,7 @@ def client_with_unavailable_ollama(
     # Override the dependency
     main.app.dependency_overrides[get_ollama] = lambda: mock_ollama_unavailable
 
-    with TestClient(main.app) as client:
-        yield client, mock_ollama_unavailable
+    yield session_client, mock_ollama_unavailable
 
     # Clear the override
     main.app.dependency_overrides.clear()
@@ -496,6 +607,7 @@ def client_with_unavailable_ollama(
 
 @pytest.fixture
 def client_with_mocks(
+    session_client: TestClient,
     mock_ollama_available: MockOllamaClient,
     mock_notes_service: MockNotesService,
 ) -> Generator[TestClient]:
@@ -510,20 +622,58 @@ def client_with_mocks(
     main.app.dependency_overrides[get_ollama] = lambda: mock_ollama_available
     main.app.dependency_overrides[get_notes] = lambda: mock_notes_service
 
-    with TestClient(main.app) as client:
-        yield client
+    yield session_client
 
     # Clear all overrides
     main.app.dependency_overrides.clear()
 
 
 @pytest.fixture
+def first_note_id(mock_notes_service: MockNotesService) -> str:
+    """ID of the first note served by the mocked notes service.
+
+    Function-scoped because the mock is per-test; read straight from the mock
+    rather than round-tripping through GET /api/notes.
+    """
+    notes = mock_notes_service.list_notes()
+    if not notes:
+        pytest.skip("No notes available for testing")
+    return str(notes[0]["id"])
+
+
+@pytest.fixture(scope="session")
+def published_articles(session_client: TestClient) -> list[dict[str, Any]]:
+    """Anonymous GET /api/articles listing, fetched once per session.
+
+    For tests that only need real article IDs/metadata to set up something
+    else; tests of the listing endpoint itself should still call it.
+    """
+    response = session_client.get("/api/articles")
+    if response.status_code != 200:
+        pytest.skip("Articles endpoint not available")
+
+    articles: list[dict[str, Any]] = response.json().get("resources", [])
+    if not articles:
+        pytest.skip("No articles available for testing")
+    return articles
+
+
+@pytest.fixture(scope="session")
+def first_article_id(published_articles: list[dict[str, Any]]) -> int:
+    """ID of the first published static article."""
+    return int(published_articles[0]["id"])
+
+
+@pytest.fixture(scope="session")
 def admin_headers() -> dict[str, str]:
     """Passkey-session auth headers granting full admin access.
 
     Since #267 the static admin token is scoped to passkey enrollment only, so
     tests exercising full admin operations must present a session token. Tests
     that specifically exercise the static-token path build their own headers.
+
+    Session-scoped: the token is stateless (HMAC-signed, 12h TTL) and only
+    reads settings, so one token serves every test. Don't mutate the dict.
     """
     settings = get_settings()
     secret = derive_session_secret(
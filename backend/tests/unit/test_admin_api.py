@@ -5,7 +5,7 @@ Deep integration testing of backup/restore functionality is done separately
 since the neo4j_adapter is instantiated at module level in main.py.
 """
 
-import os
+from collections.abc import Generator
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, Mock, patch
@@ -13,18 +13,13 @@ from unittest.mock import MagicMock, Mock, patch
 import pytest
 from fastapi.testclient import TestClient
 
-# Set testing mode before importing app modules
-os.environ["TESTING"] = "1"
-
-from main import app
-
 # admin_headers (a passkey-session token) comes from conftest since #267.
 
 
 @pytest.fixture
-def client() -> TestClient:
-    """Get test client for API testing."""
-    return TestClient(app)
+def client(session_client: TestClient) -> TestClient:
+    """Get test client for API testing (the shared session client)."""
+    return session_client
 
 
 class TestListBackups:
@@ -365,63 +360,79 @@ class TestDatabaseHealth:
             assert data["needs_restore"] is True
             assert data["status"] in ["degraded", "unhealthy"]
 
+
+@pytest.fixture(scope="class")
+def cron_backup_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path]:
+    """Backups directory that ``Path.cwd()`` resolves to for a whole test class.
+
+    The ``Path.cwd`` patch is entered once per class instead of once per test;
+    ``TestCronHeartbeat`` clears the heartbeat file between tests. Class scope
+    (not session) because the patch lands on ``pathlib.Path`` itself.
+    """
+    root = tmp_path_factory.mktemp("cron")
+    backup_dir = root / "backups"
+    backup_dir.mkdir()
+    with patch("routers.admin.Path.cwd", return_value=root):
+        yield backup_dir
+
+
+class TestCronHeartbeat:
+    """Tests for the backup cron heartbeat reported by /api/admin/health/database."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_heartbeat(self, cron_backup_dir: Path) -> Generator[None]:
+        """Remove any heartbeat a previous test left behind."""
+        yield
+        (cron_backup_dir / ".last_cron_run").unlink(missing_ok=True)
+
     def test_database_health_no_cron_heartbeat(self, client: TestClient) -> None:
         """Without a heartbeat file, cron health is unknown (None), not unhealthy."""
-        with TemporaryDirectory() as temp_dir:
-            (Path(temp_dir) / "backups").mkdir()
-            with patch("routers.admin.Path.cwd", return_value=Path(temp_dir)):
-                response = client.get("/api/admin/health/database")
+        response = client.get("/api/admin/health/database")
 
         assert response.status_code == 200
         data = response.json()
         assert data["backup_cron_last_run"] is None
         assert data["backup_cron_healthy"] is None
 
-    def test_database_health_fresh_cron_heartbeat(self, client: TestClient) -> None:
+    def test_database_health_fresh_cron_heartbeat(
+        self, client: TestClient, cron_backup_dir: Path
+    ) -> None:
         """A heartbeat within 48h reports the cron as healthy."""
         from datetime import UTC, datetime
 
-        with TemporaryDirectory() as temp_dir:
-            backup_dir = Path(temp_dir) / "backups"
-            backup_dir.mkdir()
-            timestamp = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-            (backup_dir / ".last_cron_run").write_text(timestamp + "\n")
+        timestamp = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        (cron_backup_dir / ".last_cron_run").write_text(timestamp + "\n")
 
-            with patch("routers.admin.Path.cwd", return_value=Path(temp_dir)):
-                response = client.get("/api/admin/health/database")
+        response = client.get("/api/admin/health/database")
 
         assert response.status_code == 200
         data = response.json()
         assert data["backup_cron_last_run"] == timestamp
         assert data["backup_cron_healthy"] is True
 
-    def test_database_health_stale_cron_heartbeat(self, client: TestClient) -> None:
+    def test_database_health_stale_cron_heartbeat(
+        self, client: TestClient, cron_backup_dir: Path
+    ) -> None:
         """A heartbeat older than 48h reports the cron as unhealthy and degrades status."""
         from datetime import UTC, datetime, timedelta
 
-        with TemporaryDirectory() as temp_dir:
-            backup_dir = Path(temp_dir) / "backups"
-            backup_dir.mkdir()
-            stale = datetime.now(UTC) - timedelta(days=5)
-            (backup_dir / ".last_cron_run").write_text(stale.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        stale = datetime.now(UTC) - timedelta(days=5)
+        (cron_backup_dir / ".last_cron_run").write_text(stale.strftime("%Y-%m-%dT%H:%M:%SZ"))
 
-            with patch("routers.admin.Path.cwd", return_value=Path(temp_dir)):
-                response = client.get("/api/admin/health/database")
+        response = client.get("/api/admin/health/database")
 
         assert response.status_code == 200
         data = response.json()
         assert data["backup_cron_healthy"] is False
         assert data["status"] in ["degraded", "unhealthy"]
 
-    def test_database_health_corrupt_cron_heartbeat(self, client: TestClient) -> None:
+    def test_database_health_corrupt_cron_heartbeat(
+        self, client: TestClient, cron_backup_dir: Path
+    ) -> None:
         """An unparseable heartbeat is treated as unhealthy rather than crashing."""
-        with TemporaryDirectory() as temp_dir:
-            backup_dir = Path(temp_dir) / "backups"
-            backup_dir.mkdir()
-            (backup_dir / ".last_cron_run").write_text("not-a-timestamp")
+        (cron_backup_dir / ".last_cron_run").write_text("not-a-timestamp")
 
-            with patch("routers.admin.Path.cwd", return_value=Path(temp_dir)):
-                response = client.get("/api/admin/health/database")
+        response = client.get("/api/admin/health/database")
 
         assert response.status_code == 200
         assert response.json()["backup_cron_healthy"] is False
@@ -4,148 +4,210 @@ These tests verify AI endpoint behavior both when Ollama is available and when
 it gracefully degrades (unavailable). Tests are designed to pass in CI where
 Ollama is not running.
 
-Tests marked with @pytest.mark.slow hit real Ollama and can take 30-120+ seconds
-on CPU-only systems. Run with `pytest -m "not slow"` to skip them.
+Endpoint tests run against MockOllamaClient (injected by the `client` and
+`async_client` fixtures), so they are fast and deterministic. Tests marked with
+@pytest.mark.slow hit real Ollama and can take 30-120+ seconds on CPU-only
+systems. They are deselected by default (see pyproject.toml); run them with
+`pytest -m slow`.
 """
 
-from collections.abc import Generator
-from contextlib import contextmanager
-from typing import Any
+import asyncio
+import json
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager, suppress
+from typing import Any, NamedTuple
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
 from dependencies import get_llm, get_neo4j, get_notes, get_static_articles, get_user_resources
 from main import app
+from models.ai import (
+    ConceptExtractionResponse,
+    EditorAssistResponse,
+    GPUStatusResponse,
+    QuestionResponse,
+    SummaryResponse,
+    SynthesisResponse,
+    WarmupResponse,
+)
+from models.note import LinkSuggestionsResponse, TagSuggestionsResponse
+from tests.conftest import MockNotesService, MockOllamaClient
 
 # Mark for slow tests that hit real Ollama
 slow = pytest.mark.slow
 
-
+# /api/ask payloads, serialized once and sent as raw content
+JSON_HEADERS = {"content-type": "application/json"}
+ASK_PAYLOAD = json.dumps({"question": "What is software delivery performance?"}).encode()
+
+# Response shapes are checked by decoding straight into the endpoints' own
+# response models: Model.model_validate_json(response.content, strict=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("method", "path", "content", "model"),
+    [
+        ("GET", "/api/ollama/gpu-status", None, GPUStatusResponse),
+        ("POST", "/api/ask", ASK_PAYLOAD, QuestionResponse),
+        ("POST", "/api/notes/{note_id}/suggest-links", None, LinkSuggestionsResponse),
+        ("POST", "/api/articles/{article_id}/extract-concepts", None, ConceptExtractionResponse),
+    ],
+    ids=["gpu-status", "ask", "suggest-links", "extract-concepts"],
+)
+async def test_endpoint_returns_valid_schema(
+    async_client: httpx.AsyncClient,
+    first_note_id: str,
+    first_article_id: int,
+    method: str,
+    path: str,
+    content: bytes | None,
+    model: type[BaseModel],
+) -> None:
+    """AI endpoints answer 200 with a body matching their response model."""
+    url = path.format(note_id=first_note_id, article_id=first_article_id)
+    headers = JSON_HEADERS if content is not None else None
+    response = await async_client.request(method, url, content=content, headers=headers)
+
+    assert response.status_code == 200
+    model.model_validate_json(response.content, strict=True)
+
+
+@pytest.mark.asyncio
 class TestOllamaWarmup:
     """Tests for POST /api/ollama/warmup endpoint."""
 
-    def test_warmup_endpoint_returns_valid_response(self, client: TestClient) -> None:
-        """Warmup endpoint returns valid response structure."""
-        response = client.post("/api/ollama/warmup")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "success" in data
-        assert "message" in data
-        assert isinstance(data["success"], bool)
-        assert isinstance(data["message"], str)
+    async def test_warmup_endpoint_returns_valid_response(
+        self, async_client: httpx.AsyncClient
+    ) -> None:
+        """Warmup returns a valid response naming the model for each context."""
+        expected_models = {
+            "chat": "llama3.2:1b",
+            "structured": "qwen2.5:1.5b",
+            "embedding": "nomic-embed-text",
+        }
+        # The contexts are independent, so warm them up concurrently
+        responses = await asyncio.gather(
+            *(
+                async_client.post("/api/ollama/warmup", params={"context": context})
+                for context in expected_models
+            )
+        )
 
-    def test_warmup_response_indicates_availability(self, client: TestClient) -> None:
+        for (context, model), response in zip(expected_models.items(), responses, strict=True):
+            assert response.status_code == 200
+            data = WarmupResponse.model_validate_json(response.content, strict=True)
+            assert data.success is True
+            assert data.context == context
+            assert data.model == model
+
+    @pytest.mark.parametrize(
+        ("mock_ollama", "expected_success", "expected_message"),
+        [
+            (True, True, "Ollama chat model (llama3.2:1b) warmed up successfully."),
+            (False, False, "Ollama is not available or not configured."),
+        ],
+        indirect=["mock_ollama"],
+        ids=["available", "unavailable"],
+    )
+    async def test_warmup_response_indicates_availability(
+        self, async_client: httpx.AsyncClient, expected_success: bool, expected_message: str
+    ) -> None:
         """Warmup response message indicates Ollama status."""
-        response = client.post("/api/ollama/warmup")
-        data = response.json()
+        response = await async_client.post("/api/ollama/warmup")
+        data = WarmupResponse.model_validate_json(response.content, strict=True)
 
-        # Either Ollama is available (warmed up) or not (not available)
-        if data["success"]:
-            assert "warmed up" in data["message"].lower() or "success" in data["message"].lower()
-        else:
-            assert "not available" in data["message"].lower() or "failed" in data["message"].lower()
+        assert data.success is expected_success
+        assert data.message == expected_message
 
 
+@pytest.mark.asyncio
 class TestGPUStatus:
     """Tests for GET /api/ollama/gpu-status endpoint."""
 
-    def test_gpu_status_returns_valid_response(self, client: TestClient) -> None:
-        """GPU status endpoint returns valid response structure."""
-        response = client.get("/api/ollama/gpu-status")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "has_gpu" in data
-        assert "message" in data
-        assert isinstance(data["has_gpu"], bool)
-        assert isinstance(data["message"], str)
-
-    def test_gpu_status_message_matches_status(self, client: TestClient) -> None:
+    @pytest.mark.parametrize(
+        ("mock_ollama", "expected_gpu", "expected_message"),
+        [
+            (
+                {"has_gpu": True},
+                True,
+                "GPU acceleration is available. AI features will be fast.",
+            ),
+            (
+                {"has_gpu": False},
+                False,
+                "Running on CPU only. AI generation features will be slower"
+                " (60-120s response times).",
+            ),
+            (
+                {"available": False},
+                False,
+                "Ollama is not available. AI features are disabled.",
+            ),
+        ],
+        indirect=["mock_ollama"],
+        ids=["gpu", "cpu", "unavailable"],
+    )
+    async def test_gpu_status_message_matches_status(
+        self, async_client: httpx.AsyncClient, expected_gpu: bool, expected_message: str
+    ) -> None:
         """GPU status message is consistent with has_gpu flag."""
-        response = client.get("/api/ollama/gpu-status")
-        data = response.json()
-
-        if data["has_gpu"]:
-            # GPU available - message should indicate GPU
-            assert "gpu" in data["message"].lower() or "available" in data["message"].lower()
-        else:
-            # No GPU or Ollama unavailable
-            assert (
-                "cpu" in data["message"].lower()
-                or "not available" in data["message"].lower()
-                or "disabled" in data["message"].lower()
-            )
+        response = await async_client.get("/api/ollama/gpu-status")
+        data = GPUStatusResponse.model_validate_json(response.content, strict=True)
 
+        assert data.has_gpu is expected_gpu
+        assert data.message == expected_message
 
+
+@pytest.mark.asyncio
 class TestAskQuestion:
     """Tests for POST /api/ask endpoint."""
 
-    @slow
-    def test_ask_question_valid_request(self, client: TestClient) -> None:
-        """Ask question accepts valid request and returns appropriate response."""
-        response = client.post(
-            "/api/ask", json={"question": "What is software delivery performance?"}
-        )
-
-        # Either success (200) with answer, or 503 if Ollama unavailable
-        assert response.status_code in [200, 503]
-
-        if response.status_code == 200:
-            data = response.json()
-            assert "answer" in data
-            assert "sources" in data
-            assert isinstance(data["answer"], str)
-            assert isinstance(data["sources"], list)
-        else:
-            # 503 means Ollama not available - expected in CI
-            assert "not available" in response.json()["detail"].lower()
-
-    def test_ask_question_empty_question_handled(self, client: TestClient) -> None:
-        """Ask question handles empty question gracefully."""
-        response = client.post("/api/ask", json={"question": ""})
-
-        # Empty question is technically valid (str type), endpoint decides behavior
-        # Either 200 (with response), 503 (Ollama unavailable), or 400/422 (validation)
-        assert response.status_code in [200, 400, 422, 503]
-
-    def test_ask_question_missing_question_rejected(self, client: TestClient) -> None:
-        """Ask question requires question field."""
-        response = client.post("/api/ask", json={})
+    @pytest.mark.parametrize(
+        ("mock_ollama", "payload", "expected_status"),
+        [
+            # An empty question is a valid str; the endpoint answers it
+            (True, json.dumps({"question": ""}).encode(), 200),
+            (False, json.dumps({"question": ""}).encode(), 503),
+            # The question field is required
+            (True, b"{}", 422),
+        ],
+        indirect=["mock_ollama"],
+        ids=["empty-available", "empty-unavailable", "missing"],
+    )
+    async def test_ask_question_validation(
+        self,
+        async_client: httpx.AsyncClient,
+        payload: bytes,
+        expected_status: int,
+    ) -> None:
+        """Ask question handles empty and missing questions."""
+        response = await async_client.post("/api/ask", content=payload, headers=JSON_HEADERS)
 
-        assert response.status_code == 422
+        assert response.status_code == expected_status
 
 
+@pytest.mark.asyncio
 class TestSuggestTags:
     """Tests for POST /api/notes/{note_id}/suggest-tags endpoint."""
 
-    @slow
-    def test_suggest_tags_returns_valid_structure(self, client: TestClient) -> None:
+    async def test_suggest_tags_returns_valid_structure(
+        self, async_client: httpx.AsyncClient, first_note_id: str
+    ) -> None:
         """Suggest tags returns valid response structure for existing note."""
-        # Get a note ID first
-        notes_response = client.get("/api/notes")
-        if notes_response.status_code != 200:
-            pytest.skip("Notes endpoint not available")
-
-        notes = notes_response.json().get("notes", [])
-        if not notes:
-            pytest.skip("No notes available for testing")
-
-        note_id = notes[0]["id"]
-        response = client.post(f"/api/notes/{note_id}/suggest-tags")
+        response = await async_client.post(f"/api/notes/{first_note_id}/suggest-tags")
 
         assert response.status_code == 200
-        data = response.json()
-        assert "suggestions" in data
-        assert "count" in data
-        assert isinstance(data["suggestions"], list)
-        assert isinstance(data["count"], int)
-        assert data["count"] == len(data["suggestions"])
-
-    def test_suggest_tags_not_found(self, client: TestClient) -> None:
-        """Suggest tags returns 404 for non-existent note."""
-        response = client.post("/api/notes/nonexistent-note-id-12345/suggest-tags")
+        data = TagSuggestionsResponse.model_validate_json(response.content, strict=True)
+        assert data.count == len(data.suggestions)
+
+    @pytest.mark.parametrize("mock_ollama", [True, False], indirect=True)
+    async def test_suggest_tags_not_found(self, async_client: httpx.AsyncClient) -> None:
+        """Suggest tags returns 404 for non-existent note, whether or not AI is available."""
+        response = await async_client.post("/api/notes/nonexistent-note-id-12345/suggest-tags")
         assert response.status_code == 404
 
 
@@ -188,160 +250,134 @@ class TestDegradedSignalling:
             return self._response
 
     @contextmanager
-    def _client(self, llm: Any) -> Generator[TestClient]:
+    def _client(self, client: TestClient, llm: Any) -> Generator[TestClient]:
         app.dependency_overrides[get_llm] = lambda: llm
         app.dependency_overrides[get_notes] = lambda: self._NotesService(self.NOTE)
         try:
-            with TestClient(app) as test_client:
-                yield test_client
+            yield client
         finally:
             app.dependency_overrides.clear()
 
-    def test_degraded_when_llm_unavailable(self) -> None:
-        with self._client(self._LLM(available=False)) as client:
-            data = client.post("/api/notes/test-note/suggest-tags").json()
+    @staticmethod
+    def _suggest_tags(client: TestClient) -> TagSuggestionsResponse:
+        response = client.post("/api/notes/test-note/suggest-tags")
+        return TagSuggestionsResponse.model_validate_json(response.content, strict=True)
+
+    def test_degraded_when_llm_unavailable(self, session_client: TestClient) -> None:
+        with self._client(session_client, self._LLM(available=False)) as client:
+            data = self._suggest_tags(client)
 
-        assert data["suggestions"] == []
-        assert data["degraded"] is True
+        assert data.suggestions == []
+        assert data.degraded is True
 
-    def test_degraded_when_llm_returns_nothing(self) -> None:
-        with self._client(self._LLM(response=None)) as client:
-            data = client.post("/api/notes/test-note/suggest-tags").json()
+    def test_degraded_when_llm_returns_nothing(self, session_client: TestClient) -> None:
+        with self._client(session_client, self._LLM(response=None)) as client:
+            data = self._suggest_tags(client)
 
-        assert data["degraded"] is True
+        assert data.degraded is True
 
-    def test_degraded_when_output_unparseable(self) -> None:
-        with self._client(self._LLM(response="I'm afraid I can't do that.")) as client:
-            data = client.post("/api/notes/test-note/suggest-tags").json()
+    def test_degraded_when_output_unparseable(self, session_client: TestClient) -> None:
+        with self._client(
+            session_client, self._LLM(response="I'm afraid I can't do that.")
+        ) as client:
+            data = self._suggest_tags(client)
 
-        assert data["degraded"] is True
+        assert data.degraded is True
 
-    def test_not_degraded_when_llm_returns_empty_array(self) -> None:
+    def test_not_degraded_when_llm_returns_empty_array(self, session_client: TestClient) -> None:
         """A working LLM that finds no tags is NOT degraded - the key distinction."""
-        with self._client(self._LLM(response="[]")) as client:
-            data = client.post("/api/notes/test-note/suggest-tags").json()
+        with self._client(session_client, self._LLM(response="[]")) as client:
+            data = self._suggest_tags(client)
 
-        assert data["suggestions"] == []
-        assert data["degraded"] is False
+        assert data.suggestions == []
+        assert data.degraded is False
 
-    def test_not_degraded_on_success(self) -> None:
+    def test_not_degraded_on_success(self, session_client: TestClient) -> None:
         response = '[{"tag": "reliability", "confidence": 0.9, "reason": "core topic"}]'
-        with self._client(self._LLM(response=response)) as client:
-            data = client.post("/api/notes/test-note/suggest-tags").json()
+        with self._client(session_client, self._LLM(response=response)) as client:
+            data = self._suggest_tags(client)
 
-        assert data["count"] == 1
-        assert data["degraded"] is False
+        assert data.count == 1
+        assert data.degraded is False
 
-    def test_prose_wrapped_output_is_not_degraded(self) -> None:
+    def test_prose_wrapped_output_is_not_degraded(self, session_client: TestClient) -> None:
         """The #260 parser fix, verified through the endpoint."""
         response = 'Sure!\n[{"tag": "reliability", "confidence": 0.9, "reason": "core"}]\nDone.'
-        with self._client(self._LLM(response=response)) as client:
-            data = client.post("/api/notes/test-note/suggest-tags").json()
+        with self._client(session_client, self._LLM(response=response)) as client:
+            data = self._suggest_tags(client)
 
-        assert data["count"] == 1
-        assert data["suggestions"][0]["tag"] == "reliability"
-        assert data["degraded"] is False
+        assert data.count == 1
+        assert data.suggestions[0].tag == "reliability"
+        assert data.degraded is False
 
 
+@pytest.mark.asyncio
 class TestSuggestLinks:
     """Tests for POST /api/notes/{note_id}/suggest-links endpoint."""
 
-    @slow
-    def test_suggest_links_returns_valid_structure(self, client: TestClient) -> None:
-        """Suggest links returns valid response structure for existing note."""
-        notes_response = client.get("/api/notes")
-        if notes_response.status_code != 200:
-            pytest.skip("Notes endpoint not available")
-
-        notes = notes_response.json().get("notes", [])
-        if not notes:
-            pytest.skip("No notes available for testing")
-
-        note_id = notes[0]["id"]
-        response = client.post(f"/api/notes/{note_id}/suggest-links")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert "suggestions" in data
-        assert "count" in data
-        assert isinstance(data["suggestions"], list)
-        assert isinstance(data["count"], int)
-
-    def test_suggest_links_not_found(self, client: TestClient) -> None:
-        """Suggest links returns 404 for non-existent note."""
-        response = client.post("/api/notes/nonexistent-note-id-12345/suggest-links")
+    @pytest.mark.parametrize("mock_ollama", [True, False], indirect=True)
+    async def test_suggest_links_not_found(self, async_client: httpx.AsyncClient) -> None:
+        """Suggest links returns 404 for non-existent note, whether or not AI is available."""
+        response = await async_client.post("/api/notes/nonexistent-note-id-12345/suggest-links")
         assert response.status_code == 404
 
 
+@pytest.mark.asyncio
 class TestArticleSummary:
     """Tests for GET /api/articles/{article_id}/summary endpoint."""
 
-    @slow
-    def test_article_summary_valid_response(self, client: TestClient) -> None:
+    async def test_article_summary_valid_response(
+        self, async_client: httpx.AsyncClient, first_article_id: int
+    ) -> None:
         """Article summary returns valid response for existing article."""
-        # Get first article ID
-        articles_response = client.get("/api/articles")
-        if articles_response.status_code != 200:
-            pytest.skip("Articles endpoint not available")
-
-        articles = articles_response.json().get("resources", [])
-        if not articles:
-            pytest.skip("No articles available for testing")
+        response = await async_client.get(f"/api/articles/{first_article_id}/summary")
 
-        article_id = articles[0]["id"]
-        response = client.get(f"/api/articles/{article_id}/summary")
-
-        # Either success or 503 if Ollama unavailable
-        assert response.status_code in [200, 503]
+        assert response.status_code == 200
+        data = SummaryResponse.model_validate_json(response.content, strict=True)
+        assert len(data.summary) > 0
 
-        if response.status_code == 200:
-            data = response.json()
-            assert "summary" in data
-            assert isinstance(data["summary"], str)
-            assert len(data["summary"]) > 0
+    @pytest.mark.parametrize("mock_ollama", [True, False], indirect=True)
+    async def test_article_summary_not_found(self, async_client: httpx.AsyncClient) -> None:
+        """Article summary returns 404 for non-existent article, whether or not AI is available.
 
-    def test_article_summary_not_found(self, client: TestClient) -> None:
-        """Article summary returns 404 for non-existent article (or 503 if Ollama unavailable)."""
-        response = client.get("/api/articles/99999/summary")
-        # 404 if Ollama available and article not found
-        # 503 if Ollama unavailable (checked first in endpoint)
-        assert response.status_code in [404, 503]
+        The article lookup happens before any Ollama availability check.
+        """
+        response = await async_client.get("/api/articles/99999/summary")
+        assert response.status_code == 404
 
 
+@pytest.mark.asyncio
 class TestExtractConcepts:
     """Tests for POST /api/articles/{article_id}/extract-concepts endpoint."""
 
-    @slow
-    def test_extract_concepts_valid_response(self, client: TestClient) -> None:
-        """Extract concepts returns valid response structure."""
-        articles_response = client.get("/api/articles")
-        if articles_response.status_code != 200:
-            pytest.skip("Articles endpoint not available")
+    async def test_extract_concepts_not_found(self, async_client: httpx.AsyncClient) -> None:
+        """Extract concepts returns 404 for non-existent article."""
+        response = await async_client.post("/api/articles/99999/extract-concepts")
+        assert response.status_code == 404
 
-        articles = articles_response.json().get("resources", [])
-        if not articles:
-            pytest.skip("No articles available for testing")
+    @pytest.mark.parametrize("mock_ollama", [False], indirect=True)
+    async def test_extract_concepts_unavailable_degrades(
+        self, async_client: httpx.AsyncClient
+    ) -> None:
+        """Extract concepts returns 200 with no concepts when Ollama is unavailable."""
+        response = await async_client.post("/api/articles/99999/extract-concepts")
+        assert response.status_code == 200
+        data = ConceptExtractionResponse.model_validate_json(response.content, strict=True)
+        assert data.concepts == []
+        assert data.count == 0
 
-        article_id = articles[0]["id"]
-        response = client.post(f"/api/articles/{article_id}/extract-concepts")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "concepts" in data
-        assert "count" in data
-        assert isinstance(data["concepts"], list)
-        assert isinstance(data["count"], int)
-
-    def test_extract_concepts_not_found(self, client: TestClient) -> None:
-        """Extract concepts returns 404 for non-existent article (or empty if Ollama unavailable)."""
-        response = client.post("/api/articles/99999/extract-concepts")
-        # 404 if Ollama available and article not found
-        # 200 with empty concepts if Ollama unavailable (graceful degradation)
-        assert response.status_code in [200, 404]
-        if response.status_code == 200:
-            data = response.json()
-            assert data["concepts"] == []
-            assert data["count"] == 0
+class TestRealOllama:
+    """Smoke test against the real LLM client (no dependency overrides)."""
+
+    @slow
+    def test_ask_question_real_ollama(self, client_real_services: TestClient) -> None:
+        """Ask question answers with real Ollama, or reports it unavailable."""
+        response = client_real_services.post("/api/ask", content=ASK_PAYLOAD, headers=JSON_HEADERS)
+
+        assert response.status_code in [200, 503]
+        if response.status_code == 503:
+            assert "not available" in response.json()["detail"].lower()
 
 
 class _SynthesisLLM:
@@ -406,7 +442,7 @@ class _SynthesisNotesService:
 
 @contextmanager
 def _synthesis_client(
-    llm: Any, notes_service: Any | None = None
+    client: TestClient, llm: Any, notes_service: Any | None = None
 ) -> Generator[TestClient]:
     app.dependency_overrides[get_llm] = lambda: llm
     app.dependency_overrides[get_notes] = lambda: notes_service or _SynthesisNotesService()
@@ -416,8 +452,7 @@ def _synthesis_client(
     ]
     app.dependency_overrides[get_user_resources] = lambda: []
     try:
-        with TestClient(app) as test_client:
-            yield test_client
+        yield client
     finally:
         app.dependency_overrides.clear()
 
@@ -425,42 +460,36 @@ def _synthesis_client(
 class TestSynthesize:
     """Tests for POST /api/synthesize."""
 
-    def test_happy_path_returns_synthesis_and_sources(self) -> None:
-        with _synthesis_client(_SynthesisLLM()) as client:
-            response = client.post(
-                "/api/synthesize", json={"query": "incident response"}
-            )
+    def test_happy_path_returns_synthesis_and_sources(self, session_client: TestClient) -> None:
+        with _synthesis_client(session_client, _SynthesisLLM()) as client:
+            response = client.post("/api/synthesize", json={"query": "incident response"})
 
         assert response.status_code == 200
-        data = response.json()
-        assert "## Key Concepts" in data["synthesis"]
-        assert data["degraded"] is False
-        assert len(data["sources"]) > 0
+        data = SynthesisResponse.model_validate_json(response.content, strict=True)
+        assert "## Key Concepts" in data.synthesis
+        assert data.degraded is False
+        assert len(data.sources) > 0
         # Sources use the id/type/title/content/score shape the frontend renders.
-        source = data["sources"][0]
+        source = data.sources[0]
         assert {"id", "type", "title", "content", "score"} <= source.keys()
 
-    def test_ai_unavailable_returns_503(self) -> None:
-        with _synthesis_client(_SynthesisLLM(available=False)) as client:
-            response = client.post(
-                "/api/synthesize", json={"query": "incident response"}
-            )
+    def test_ai_unavailable_returns_503(self, session_client: TestClient) -> None:
+        with _synthesis_client(session_client, _SynthesisLLM(available=False)) as client:
+            response = client.post("/api/synthesize", json={"query": "incident response"})
 
         assert response.status_code == 503
 
-    def test_empty_llm_response_is_degraded(self) -> None:
-        with _synthesis_client(_SynthesisLLM(generate_response=None)) as client:
-            response = client.post(
-                "/api/synthesize", json={"query": "incident response"}
-            )
+    def test_empty_llm_response_is_degraded(self, session_client: TestClient) -> None:
+        with _synthesis_client(session_client, _SynthesisLLM(generate_response=None)) as client:
+            response = client.post("/api/synthesize", json={"query": "incident response"})
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["degraded"] is True
-        assert data["synthesis"] == ""
+        data = SynthesisResponse.model_validate_json(response.content, strict=True)
+        assert data.degraded is True
+        assert data.synthesis == ""
 
-    def test_missing_query_rejected(self) -> None:
-        with _synthesis_client(_SynthesisLLM()) as client:
+    def test_missing_query_rejected(self, session_client: TestClient) -> None:
+        with _synthesis_client(session_client, _SynthesisLLM()) as client:
             response = client.post("/api/synthesize", json={})
 
         assert response.status_code == 422
@@ -479,9 +508,11 @@ class TestSynthesizeStream:
                 events.append(_json.loads(line[len("data: ") :]))
         return events
 
-    def test_stream_emits_sources_before_tokens_then_completes(self) -> None:
+    def test_stream_emits_sources_before_tokens_then_completes(
+        self, session_client: TestClient
+    ) -> None:
         with _synthesis_client(
-            _SynthesisLLM(stream_tokens=["## Key Concepts\n", "Some ", "text."])
+            session_client, _SynthesisLLM(stream_tokens=["## Key Concepts\n", "Some ", "text."])
         ) as client:
             response = client.post(
                 "/api/synthesize/stream", json={"query": "incident response"}
@@ -499,21 +530,19 @@ class TestSynthesizeStream:
         first_token_index = types.index("token")
         assert sources_index < first_token_index
 
-    def test_stream_degrades_gracefully_when_ai_unavailable(self) -> None:
-        with _synthesis_client(_SynthesisLLM(available=False)) as client:
-            response = client.post(
-                "/api/synthesize/stream", json={"query": "incident response"}
-            )
+    def test_stream_degrades_gracefully_when_ai_unavailable(
+        self, session_client: TestClient
+    ) -> None:
+        with _synthesis_client(session_client, _SynthesisLLM(available=False)) as client:
+            response = client.post("/api/synthesize/stream", json={"query": "incident response"})
 
         assert response.status_code == 200
         events = self._events(response)
         assert events[0]["type"] == "error"
 
-    def test_stream_emits_error_on_empty_generation(self) -> None:
-        with _synthesis_client(_SynthesisLLM(stream_tokens=[])) as client:
-            response = client.post(
-                "/api/synthesize/stream", json={"query": "incident response"}
-            )
+    def test_stream_emits_error_on_empty_generation(self, session_client: TestClient) -> None:
+        with _synthesis_client(session_client, _SynthesisLLM(stream_tokens=[])) as client:
+            response = client.post("/api/synthesize/stream", json={"query": "incident response"})
 
         assert response.status_code == 200
         events = self._events(response)
@@ -587,7 +616,9 @@ class _EditorNotesService:
 
 
 @contextmanager
-def _editor_client(llm: Any, notes_service: Any | None = None) -> Generator[TestClient]:
+def _editor_client(
+    client: TestClient, llm: Any, notes_service: Any | None = None
+) -> Generator[TestClient]:
     app.dependency_overrides[get_llm] = lambda: llm
     app.dependency_overrides[get_notes] = lambda: notes_service or _EditorNotesService()
     # Writing-partner commands (#146 Phase 2) also depend on neo4j/static
@@ -599,8 +630,7 @@ def _editor_client(llm: Any, notes_service: Any | None = None) -> Generator[Test
     app.dependency_overrides[get_static_articles] = lambda: []
     app.dependency_overrides[get_user_resources] = lambda: []
     try:
-        with TestClient(app) as test_client:
-            yield test_client
+        yield client
     finally:
         app.dependency_overrides.clear()
 
@@ -608,8 +638,12 @@ def _editor_client(llm: Any, notes_service: Any | None = None) -> Generator[Test
 class TestEditorAssist:
     """Tests for POST /api/editor/assist (#146)."""
 
-    def test_happy_path_transform_command(self, admin_headers: dict[str, str]) -> None:
-        with _editor_client(_EditorLLM(generate_response="Expanded version.")) as client:
+    def test_happy_path_transform_command(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
+        with _editor_client(
+            session_client, _EditorLLM(generate_response="Expanded version.")
+        ) as client:
             response = client.post(
                 "/api/editor/assist",
                 json={"command": "expand", "text": "short text"},
@@ -617,13 +651,16 @@ class TestEditorAssist:
             )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["command"] == "expand"
-        assert data["result"] == "Expanded version."
-        assert data["degraded"] is False
+        data = EditorAssistResponse.model_validate_json(response.content, strict=True)
+        assert data.command == "expand"
+        assert data.result == "Expanded version."
+        assert data.degraded is False
 
-    def test_link_command_returns_suggestions(self, admin_headers: dict[str, str]) -> None:
+    def test_link_command_returns_suggestions(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
         with _editor_client(
+            session_client,
             _EditorLLM(
                 generate_response=(
                     '[{"note_id": "wise-mountain", "confidence": 0.8, "reason": "related"}]'
@@ -641,20 +678,20 @@ class TestEditorAssist:
             )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["command"] == "link"
-        assert data["suggestions"][0]["note_id"] == "wise-mountain"
+        data = EditorAssistResponse.model_validate_json(response.content, strict=True)
+        assert data.command == "link"
+        assert data.suggestions[0]["note_id"] == "wise-mountain"
 
-    def test_unauthenticated_rejected(self) -> None:
-        with _editor_client(_EditorLLM()) as client:
-            response = client.post(
-                "/api/editor/assist", json={"command": "expand", "text": "hi"}
-            )
+    def test_unauthenticated_rejected(self, session_client: TestClient) -> None:
+        with _editor_client(session_client, _EditorLLM()) as client:
+            response = client.post("/api/editor/assist", json={"command": "expand", "text": "hi"})
 
         assert response.status_code == 401
 
-    def test_unknown_command_rejected(self, admin_headers: dict[str, str]) -> None:
-        with _editor_client(_EditorLLM()) as client:
+    def test_unknown_command_rejected(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
+        with _editor_client(session_client, _EditorLLM()) as client:
             response = client.post(
                 "/api/editor/assist",
                 json={"command": "frobnicate", "text": "hi"},
@@ -663,8 +700,10 @@ class TestEditorAssist:
 
         assert response.status_code == 400
 
-    def test_ai_unavailable_returns_503(self, admin_headers: dict[str, str]) -> None:
-        with _editor_client(_EditorLLM(available=False)) as client:
+    def test_ai_unavailable_returns_503(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
+        with _editor_client(session_client, _EditorLLM(available=False)) as client:
             response = client.post(
                 "/api/editor/assist",
                 json={"command": "expand", "text": "hi"},
@@ -673,8 +712,10 @@ class TestEditorAssist:
 
         assert response.status_code == 503
 
-    def test_empty_llm_response_is_degraded(self, admin_headers: dict[str, str]) -> None:
-        with _editor_client(_EditorLLM(generate_response=None)) as client:
+    def test_empty_llm_response_is_degraded(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
+        with _editor_client(session_client, _EditorLLM(generate_response=None)) as client:
             response = client.post(
                 "/api/editor/assist",
                 json={"command": "expand", "text": "hi"},
@@ -682,8 +723,8 @@ class TestEditorAssist:
             )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["degraded"] is True
+        data = EditorAssistResponse.model_validate_json(response.content, strict=True)
+        assert data.degraded is True
 
 
 class TestEditorAssistStream:
@@ -699,8 +740,12 @@ class TestEditorAssistStream:
                 events.append(_json.loads(line[len("data: ") :]))
         return events
 
-    def test_stream_emits_tokens_then_complete(self, admin_headers: dict[str, str]) -> None:
-        with _editor_client(_EditorLLM(stream_tokens=["Ex", "pand", "ed."])) as client:
+    def test_stream_emits_tokens_then_complete(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
+        with _editor_client(
+            session_client, _EditorLLM(stream_tokens=["Ex", "pand", "ed."])
+        ) as client:
             response = client.post(
                 "/api/editor/assist/stream",
                 json={"command": "expand", "text": "hi"},
@@ -713,9 +758,10 @@ class TestEditorAssistStream:
         assert types == ["token", "token", "token", "complete"]
 
     def test_link_stream_emits_link_events_then_complete(
-        self, admin_headers: dict[str, str]
+        self, session_client: TestClient, admin_headers: dict[str, str]
     ) -> None:
         with _editor_client(
+            session_client,
             _EditorLLM(
                 stream_tokens=[
                     '[{"note_id": "wise-mountain", "confidence": 0.8, "reason": "related"}]'
@@ -736,8 +782,8 @@ class TestEditorAssistStream:
         link_event = next(e for e in events if e["type"] == "link")
         assert link_event["note_id"] == "wise-mountain"
 
-    def test_unauthenticated_rejected(self) -> None:
-        with _editor_client(_EditorLLM()) as client:
+    def test_unauthenticated_rejected(self, session_client: TestClient) -> None:
+        with _editor_client(session_client, _EditorLLM()) as client:
             response = client.post(
                 "/api/editor/assist/stream", json={"command": "expand", "text": "hi"}
             )
@@ -745,9 +791,9 @@ class TestEditorAssistStream:
         assert response.status_code == 401
 
     def test_stream_degrades_gracefully_when_ai_unavailable(
-        self, admin_headers: dict[str, str]
+        self, session_client: TestClient, admin_headers: dict[str, str]
     ) -> None:
-        with _editor_client(_EditorLLM(available=False)) as client:
+        with _editor_client(session_client, _EditorLLM(available=False)) as client:
             response = client.post(
                 "/api/editor/assist/stream",
                 json={"command": "expand", "text": "hi"},
@@ -759,9 +805,9 @@ class TestEditorAssistStream:
         assert events[0]["type"] == "error"
 
     def test_stream_emits_error_on_empty_generation(
-        self, admin_headers: dict[str, str]
+        self, session_client: TestClient, admin_headers: dict[str, str]
     ) -> None:
-        with _editor_client(_EditorLLM(stream_tokens=[])) as client:
+        with _editor_client(session_client, _EditorLLM(stream_tokens=[])) as client:
             response = client.post(
                 "/api/editor/assist/stream",
                 json={"command": "expand", "text": "hi"},
@@ -814,9 +860,10 @@ class TestEditorAssistWritingPartner:
 
     @pytest.mark.parametrize("command", ["challenge", "gaps", "contradictions"])
     def test_happy_path_returns_result_and_sources(
-        self, command: str, admin_headers: dict[str, str]
+        self, session_client: TestClient, command: str, admin_headers: dict[str, str]
     ) -> None:
         with _editor_client(
+            session_client,
             _EditorLLM(generate_response="This is my critique. (Blameless Postmortems)"),
             notes_service=_PartnerNotesService(),
         ) as client:
@@ -832,18 +879,19 @@ class TestEditorAssistWritingPartner:
             )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["command"] == command
-        assert data["result"] == "This is my critique. (Blameless Postmortems)"
-        assert data["degraded"] is False
-        assert len(data["sources"]) > 0
-        source = data["sources"][0]
+        data = EditorAssistResponse.model_validate_json(response.content, strict=True)
+        assert data.command == command
+        assert data.result == "This is my critique. (Blameless Postmortems)"
+        assert data.degraded is False
+        assert len(data.sources) > 0
+        source = data.sources[0]
         assert {"id", "type", "title", "content", "score"} <= source.keys()
 
     def test_current_note_excluded_from_its_own_sources(
-        self, admin_headers: dict[str, str]
+        self, session_client: TestClient, admin_headers: dict[str, str]
     ) -> None:
         with _editor_client(
+            session_client,
             _EditorLLM(generate_response="Critique."),
             notes_service=_PartnerNotesService(),
         ) as client:
@@ -859,21 +907,23 @@ class TestEditorAssistWritingPartner:
             )
 
         assert response.status_code == 200
-        data = response.json()
-        source_ids = {s["id"] for s in data["sources"]}
+        data = EditorAssistResponse.model_validate_json(response.content, strict=True)
+        source_ids = {s["id"] for s in data.sources}
         assert "curious-elephant" not in source_ids
 
-    def test_unauthenticated_rejected(self) -> None:
-        with _editor_client(_EditorLLM(), notes_service=_PartnerNotesService()) as client:
-            response = client.post(
-                "/api/editor/assist", json={"command": "gaps", "text": "hi"}
-            )
+    def test_unauthenticated_rejected(self, session_client: TestClient) -> None:
+        with _editor_client(
+            session_client, _EditorLLM(), notes_service=_PartnerNotesService()
+        ) as client:
+            response = client.post("/api/editor/assist", json={"command": "gaps", "text": "hi"})
 
         assert response.status_code == 401
 
-    def test_ai_unavailable_returns_503(self, admin_headers: dict[str, str]) -> None:
+    def test_ai_unavailable_returns_503(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
         with _editor_client(
-            _EditorLLM(available=False), notes_service=_PartnerNotesService()
+            session_client, _EditorLLM(available=False), notes_service=_PartnerNotesService()
         ) as client:
             response = client.post(
                 "/api/editor/assist",
@@ -883,9 +933,11 @@ class TestEditorAssistWritingPartner:
 
         assert response.status_code == 503
 
-    def test_empty_llm_response_is_degraded(self, admin_headers: dict[str, str]) -> None:
+    def test_empty_llm_response_is_degraded(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
         with _editor_client(
-            _EditorLLM(generate_response=None), notes_service=_PartnerNotesService()
+            session_client, _EditorLLM(generate_response=None), notes_service=_PartnerNotesService()
         ) as client:
             response = client.post(
                 "/api/editor/assist",
@@ -894,11 +946,11 @@ class TestEditorAssistWritingPartner:
             )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["degraded"] is True
+        data = EditorAssistResponse.model_validate_json(response.content, strict=True)
+        assert data.degraded is True
 
     def test_zero_retrieval_returns_degraded_without_calling_llm(
-        self, admin_headers: dict[str, str]
+        self, session_client: TestClient, admin_headers: dict[str, str]
     ) -> None:
         """No embeddings available -> retrieval returns nothing -> the
         endpoint must not call the LLM with an empty context."""
@@ -908,6 +960,7 @@ class TestEditorAssistWritingPartner:
                 raise AssertionError("LLM must not be called when retrieval is empty")
 
         with _editor_client(
+            session_client,
             _NoEmbeddingsLLM(embeddings_available=False),
             notes_service=_PartnerNotesService(),
         ) as client:
@@ -918,14 +971,17 @@ class TestEditorAssistWritingPartner:
             )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["degraded"] is True
-        assert data["sources"] == []
+        data = EditorAssistResponse.model_validate_json(response.content, strict=True)
+        assert data.degraded is True
+        assert data.sources == []
 
-    def test_phase1_transform_command_unchanged(self, admin_headers: dict[str, str]) -> None:
+    def test_phase1_transform_command_unchanged(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
         """Regression: transform commands still return result/degraded only,
         with sources absent (None), unaffected by the new deps."""
         with _editor_client(
+            session_client,
             _EditorLLM(generate_response="Expanded version."),
             notes_service=_PartnerNotesService(),
         ) as client:
@@ -936,13 +992,16 @@ class TestEditorAssistWritingPartner:
             )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["result"] == "Expanded version."
-        assert data.get("sources") is None
+        data = EditorAssistResponse.model_validate_json(response.content, strict=True)
+        assert data.result == "Expanded version."
+        assert data.sources is None
 
-    def test_phase1_link_command_unchanged(self, admin_headers: dict[str, str]) -> None:
+    def test_phase1_link_command_unchanged(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
         """Regression: /link still returns suggestions, unaffected by the new deps."""
         with _editor_client(
+            session_client,
             _EditorLLM(
                 generate_response=(
                     '[{"note_id": "wise-mountain", "confidence": 0.8, "reason": "related"}]'
@@ -961,8 +1020,8 @@ class TestEditorAssistWritingPartner:
             )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["suggestions"][0]["note_id"] == "wise-mountain"
+        data = EditorAssistResponse.model_validate_json(response.content, strict=True)
+        assert data.suggestions[0]["note_id"] == "wise-mountain"
 
 
 class TestEditorAssistStreamWritingPartner:
@@ -979,9 +1038,10 @@ class TestEditorAssistStreamWritingPartner:
         return events
 
     def test_stream_emits_sources_before_tokens_then_completes(
-        self, admin_headers: dict[str, str]
+        self, session_client: TestClient, admin_headers: dict[str, str]
     ) -> None:
         with _editor_client(
+            session_client,
             _EditorLLM(stream_tokens=["This ", "is ", "my critique."]),
             notes_service=_PartnerNotesService(),
         ) as client:
@@ -1006,9 +1066,10 @@ class TestEditorAssistStreamWritingPartner:
         assert types.index("sources") < types.index("token")
 
     def test_current_note_excluded_from_stream_sources(
-        self, admin_headers: dict[str, str]
+        self, session_client: TestClient, admin_headers: dict[str, str]
     ) -> None:
         with _editor_client(
+            session_client,
             _EditorLLM(stream_tokens=["Critique."]),
             notes_service=_PartnerNotesService(),
         ) as client:
@@ -1028,8 +1089,10 @@ class TestEditorAssistStreamWritingPartner:
         source_ids = {s["id"] for s in sources_event["sources"]}
         assert "curious-elephant" not in source_ids
 
-    def test_unauthenticated_rejected(self) -> None:
-        with _editor_client(_EditorLLM(), notes_service=_PartnerNotesService()) as client:
+    def test_unauthenticated_rejected(self, session_client: TestClient) -> None:
+        with _editor_client(
+            session_client, _EditorLLM(), notes_service=_PartnerNotesService()
+        ) as client:
             response = client.post(
                 "/api/editor/assist/stream", json={"command": "gaps", "text": "hi"}
             )
@@ -1037,10 +1100,10 @@ class TestEditorAssistStreamWritingPartner:
         assert response.status_code == 401
 
     def test_stream_degrades_gracefully_when_ai_unavailable(
-        self, admin_headers: dict[str, str]
+        self, session_client: TestClient, admin_headers: dict[str, str]
     ) -> None:
         with _editor_client(
-            _EditorLLM(available=False), notes_service=_PartnerNotesService()
+            session_client, _EditorLLM(available=False), notes_service=_PartnerNotesService()
         ) as client:
             response = client.post(
                 "/api/editor/assist/stream",
@@ -1053,7 +1116,7 @@ class TestEditorAssistStreamWritingPartner:
         assert events[0]["type"] == "error"
 
     def test_zero_retrieval_emits_sources_then_degraded_complete_without_calling_llm(
-        self, admin_headers: dict[str, str]
+        self, session_client: TestClient, admin_headers: dict[str, str]
     ) -> None:
         class _NoEmbeddingsLLM(_EditorLLM):
             def generate_stream(self, prompt: str, **kwargs: Any) -> Generator[str]:
@@ -1061,6 +1124,7 @@ class TestEditorAssistStreamWritingPartner:
                 yield ""  # pragma: no cover - unreachable, satisfies generator typing
 
         with _editor_client(
+            session_client,
             _NoEmbeddingsLLM(embeddings_available=False),
             notes_service=_PartnerNotesService(),
         ) as client:
@@ -1079,10 +1143,13 @@ class TestEditorAssistStreamWritingPartner:
         complete_event = next(e for e in events if e["type"] == "complete")
         assert complete_event.get("degraded") is True
 
-    def test_phase1_transform_stream_unchanged(self, admin_headers: dict[str, str]) -> None:
+    def test_phase1_transform_stream_unchanged(
+        self, session_client: TestClient, admin_headers: dict[str, str]
+    ) -> None:
         """Regression: transform command streams still emit token/complete only,
         no sources event, unaffected by the new deps."""
         with _editor_client(
+            session_client,
             _EditorLLM(stream_tokens=["Ex", "pand", "ed."]),
             notes_service=_PartnerNotesService(),
         ) as client:
@@ -1098,329 +1165,285 @@ class TestEditorAssistStreamWritingPartner:
         assert types == ["token", "token", "token", "complete"]
 
 
-class TestMockOllamaClientUnit:
-    """Unit tests for the MockOllamaClient fixture to ensure it works correctly."""
+@pytest.fixture(scope="module")
+def mock_clients() -> dict[tuple[bool, bool], MockOllamaClient]:
+    """One MockOllamaClient per (available, has_gpu) state, built once per module.
+
+    The state tests only read from these clients, so sharing them is safe.
+    """
+    return {
+        (available, has_gpu): MockOllamaClient(available=available, has_gpu=has_gpu)
+        for available in (True, False)
+        for has_gpu in (True, False)
+    }
 
-    def test_mock_client_available(self) -> None:
-        """Mock client reports availability correctly."""
-        from tests.conftest import MockOllamaClient
 
-        available_client = MockOllamaClient(available=True)
-        unavailable_client = MockOllamaClient(available=False)
+@pytest.fixture(scope="module")
+def mock_available(mock_clients: dict[tuple[bool, bool], MockOllamaClient]) -> MockOllamaClient:
+    """Shared available (CPU-only) mock client."""
+    return mock_clients[(True, False)]
 
-        assert available_client.is_available() is True
-        assert unavailable_client.is_available() is False
 
-    def test_mock_client_gpu_status(self) -> None:
-        """Mock client reports GPU status correctly."""
-        from tests.conftest import MockOllamaClient
+@pytest.fixture(scope="module")
+def mock_unavailable(
+    mock_clients: dict[tuple[bool, bool], MockOllamaClient],
+) -> MockOllamaClient:
+    """Shared unavailable mock client."""
+    return mock_clients[(False, False)]
 
-        cpu_client = MockOllamaClient(available=True, has_gpu=False)
-        gpu_client = MockOllamaClient(available=True, has_gpu=True)
-        unavailable_client = MockOllamaClient(available=False, has_gpu=True)
 
-        assert cpu_client.has_gpu() is False
-        assert gpu_client.has_gpu() is True
-        # Unavailable client should return False for GPU even if configured
-        assert unavailable_client.has_gpu() is False
+# The mock's search methods only slice and score what they are given (they
+# never read or compute embeddings), so plain documents are enough
+SEARCH_DOCS: list[dict[str, Any]] = [
+    {"id": 1, "title": "Doc 1", "content": "Content 1"},
+    {"id": 2, "title": "Doc 2", "content": "Content 2"},
+]
 
-    def test_mock_embedding_generation(self) -> None:
-        """Mock client generates consistent embeddings."""
-        from tests.conftest import MockOllamaClient
 
-        client = MockOllamaClient(available=True)
+class TestMockOllamaClientUnit:
+    """Unit tests for the MockOllamaClient fixture to ensure it works correctly."""
 
-        embedding1 = client.generate_embedding("test text")
-        embedding2 = client.generate_embedding("test text")
+    @pytest.mark.parametrize(
+        ("available", "has_gpu", "expected_gpu", "expected_warmup"),
+        [
+            (True, False, False, (True, "llama3.2:1b")),
+            (True, True, True, (True, "llama3.2:1b")),
+            # Unavailable client reports no GPU even if configured, and warmup fails
+            (False, True, False, (False, "")),
+        ],
+    )
+    def test_mock_client_states(
+        self,
+        mock_clients: dict[tuple[bool, bool], MockOllamaClient],
+        available: bool,
+        has_gpu: bool,
+        expected_gpu: bool,
+        expected_warmup: tuple[bool, str],
+    ) -> None:
+        """Mock client reports availability, GPU status and warmup consistently."""
+        client = mock_clients[(available, has_gpu)]
+
+        assert client.is_available() is available
+        assert client.has_gpu() is expected_gpu
+        assert client.warmup() == expected_warmup
+
+    def test_mock_embedding_generation(self, mock_available: MockOllamaClient) -> None:
+        """Mock client generates consistent embeddings."""
+        embedding1 = mock_available.generate_embedding("test text")
+        embedding2 = mock_available.generate_embedding("test text")
 
         assert embedding1 is not None
         assert len(embedding1) == 768  # Standard dimension
         assert embedding1 == embedding2  # Same text = same embedding
 
-    def test_mock_embedding_unavailable(self) -> None:
-        """Mock client returns None when unavailable."""
-        from tests.conftest import MockOllamaClient
+    def test_mock_embedding_copies_cached_vector(self, mock_available: MockOllamaClient) -> None:
+        """Embeddings are memoized per text, but callers get their own list."""
+        embedding1 = mock_available.generate_embedding("cached text")
+        assert embedding1 is not None
+        embedding1[0] = 42.0
 
-        client = MockOllamaClient(available=False)
+        embedding2 = mock_available.generate_embedding("cached text")
+        assert embedding2 is not None
+        assert embedding2 is not embedding1
+        assert embedding2[0] != 42.0
 
-        embedding = client.generate_embedding("test text")
+    def test_mock_embedding_unavailable(self, mock_unavailable: MockOllamaClient) -> None:
+        """Mock client returns None when unavailable."""
+        embedding = mock_unavailable.generate_embedding("test text")
         assert embedding is None
 
-    def test_mock_semantic_search(self) -> None:
+    def test_mock_semantic_search(self, mock_available: MockOllamaClient) -> None:
         """Mock semantic search returns documents with scores."""
-        from tests.conftest import MockOllamaClient
-
-        client = MockOllamaClient(available=True)
-        docs = [
-            {"id": 1, "title": "Doc 1", "content": "Content 1"},
-            {"id": 2, "title": "Doc 2", "content": "Content 2"},
-        ]
-
-        results = client.semantic_search("query", docs, top_k=2)
+        results = mock_available.semantic_search("query", SEARCH_DOCS, top_k=2)
 
         assert len(results) == 2
         assert all("score" in r for r in results)
         # First result should have higher score
         assert results[0]["score"] > results[1]["score"]
 
-    def test_mock_ask_question(self) -> None:
-        """Mock Q&A returns answer referencing context."""
-        from tests.conftest import MockOllamaClient
+    def test_mock_semantic_search_precomputed(self, mock_available: MockOllamaClient) -> None:
+        """Mock precomputed-embedding search scores the first top_k documents given."""
+        results = mock_available.semantic_search_with_precomputed_embeddings(
+            "query", SEARCH_DOCS, top_k=1
+        )
+
+        assert [r["id"] for r in results] == [1]
+        assert results[0]["score"] > 0
 
-        client = MockOllamaClient(available=True)
+    def test_mock_ask_question(self, mock_available: MockOllamaClient) -> None:
+        """Mock Q&A returns answer referencing context."""
         context = [{"title": "Test Article"}]
 
-        answer = client.ask_question("What is testing?", context)
+        answer = mock_available.ask_question("What is testing?", context)
 
         assert answer is not None
         assert "Test Article" in answer
 
-    def test_mock_summarize(self) -> None:
+    def test_mock_summarize(self, mock_available: MockOllamaClient) -> None:
         """Mock summarization returns summary."""
-        from tests.conftest import MockOllamaClient
-
-        client = MockOllamaClient(available=True)
-
-        summary = client.summarize_article("This is a long article about testing.")
+        summary = mock_available.summarize_article("This is a long article about testing.")
 
         assert summary is not None
         assert "mock summary" in summary.lower()
 
-    def test_mock_warmup(self) -> None:
-        """Mock warmup returns (success, model) tuple."""
-        from tests.conftest import MockOllamaClient
-
-        available_client = MockOllamaClient(available=True)
-        unavailable_client = MockOllamaClient(available=False)
-
-        # Available client returns success with model name
-        success, model = available_client.warmup()
-        assert success is True
-        assert model == "llama3.2:1b"  # Default chat model
-
-        # Unavailable client returns failure
-        success, model = unavailable_client.warmup()
-        assert success is False
-        assert model == ""
-
-    def test_mock_warmup_context(self) -> None:
+    def test_mock_warmup_context(self, mock_available: MockOllamaClient) -> None:
         """Mock warmup respects context parameter."""
-        from tests.conftest import MockOllamaClient
-
-        client = MockOllamaClient(available=True)
-
         # Chat context (default)
-        success, model = client.warmup("chat")
+        success, model = mock_available.warmup("chat")
         assert success is True
         assert model == "llama3.2:1b"
 
         # Structured context
-        success, model = client.warmup("structured")
+        success, model = mock_available.warmup("structured")
         assert success is True
         assert model == "qwen2.5:1.5b"
 
         # Embedding context
-        success, model = client.warmup("embedding")
+        success, model = mock_available.warmup("embedding")
         assert success is True
         assert model == "nomic-embed-text"
 
-    def test_mock_cosine_similarity(self) -> None:
+    @pytest.mark.parametrize(
+        ("vec1", "vec2", "expected"),
+        [
+            # Identical vectors should have similarity 1.0
+            ([1.0, 0.0, 0.0], [1.0, 0.0, 0.0], 1.0),
+            # Orthogonal vectors should have similarity 0.0
+            ([1.0, 0.0, 0.0], [0.0, 1.0, 0.0], 0.0),
+            # Zero vectors have no direction
+            ([0.0, 0.0, 0.0], [1.0, 0.0, 0.0], 0.0),
+            # Different length vectors should return 0.0 (not raise)
+            ([1.0], [1.0, 2.0], 0.0),
+            ([1.0, 2.0], [1.0], 0.0),
+            # Full-size mock embedding against itself
+            (
+                MockOllamaClient().generate_embedding("a"),
+                MockOllamaClient().generate_embedding("a"),
+                1.0,
+            ),
+        ],
+        ids=["identical", "orthogonal", "zero", "shorter-first", "longer-first", "768-dim"],
+    )
+    def test_mock_cosine_similarity(
+        self, vec1: list[float], vec2: list[float], expected: float
+    ) -> None:
         """Mock cosine similarity calculation works correctly."""
-        from tests.conftest import MockOllamaClient
-
-        # Identical vectors should have similarity 1.0
-        vec = [1.0, 0.0, 0.0]
-        assert MockOllamaClient._cosine_similarity(vec, vec) == pytest.approx(1.0)
-
-        # Orthogonal vectors should have similarity 0.0
-        vec1 = [1.0, 0.0, 0.0]
-        vec2 = [0.0, 1.0, 0.0]
-        assert MockOllamaClient._cosine_similarity(vec1, vec2) == pytest.approx(0.0)
-
-        # Different length vectors should return 0.0
-        assert MockOllamaClient._cosine_similarity([1.0], [1.0, 2.0]) == 0.0
+        assert MockOllamaClient._cosine_similarity(vec1, vec2) == pytest.approx(expected)
 
 
+@pytest.mark.asyncio
 class TestSuggestStream:
     """Tests for GET /api/notes/{note_id}/suggest-stream endpoint (SSE streaming).
 
-    Note: Tests that require actual AI generation are marked @slow because
-    the current architecture captures ollama_client in closures at import time,
-    making mocking difficult. See issue #141 for the planned DI refactor.
+    Error paths go through `async_client`; assertions on a successful stream
+    share one request via the `suggest_stream` fixture (TestSuggestStreamEvents).
     """
 
-    def test_suggest_stream_not_found(self, client: TestClient) -> None:
+    async def test_suggest_stream_not_found(self, async_client: httpx.AsyncClient) -> None:
         """Streaming endpoint returns error event for non-existent note."""
-        response = client.get("/api/notes/nonexistent-note-id-12345/suggest-stream")
-
-        assert response.status_code == 200  # SSE always returns 200, errors in stream
-        content = response.text
-
-        # Should have error event
-        assert "data: " in content
-        assert '"type": "error"' in content or '"type":"error"' in content
-        assert "not found" in content.lower()
-
-    @slow
-    def test_suggest_stream_returns_sse_content_type(self, client: TestClient) -> None:
-        """Streaming endpoint returns text/event-stream content type."""
-        # Get a note ID first
-        notes_response = client.get("/api/notes")
-        if notes_response.status_code != 200:
-            pytest.skip("Notes endpoint not available")
-
-        notes = notes_response.json().get("notes", [])
-        if not notes:
-            pytest.skip("No notes available for testing")
-
-        note_id = notes[0]["id"]
-        response = client.get(f"/api/notes/{note_id}/suggest-stream")
-
-        assert response.status_code == 200
-        assert "text/event-stream" in response.headers.get("content-type", "")
-
-    @slow
-    def test_suggest_stream_returns_sse_events(self, client: TestClient) -> None:
-        """Streaming endpoint returns properly formatted SSE events."""
-        notes_response = client.get("/api/notes")
-        if notes_response.status_code != 200:
-            pytest.skip("Notes endpoint not available")
+        url = "/api/notes/nonexistent-note-id-12345/suggest-stream"
+        async with async_client.stream("GET", url) as response:
+            assert response.status_code == 200  # SSE always returns 200, errors in stream
 
-        notes = notes_response.json().get("notes", [])
-        if not notes:
-            pytest.skip("No notes available for testing")
+            # The error is the first and only event; stop reading once it arrives
+            event = None
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    event = json.loads(line[6:])
+                    break
 
-        note_id = notes[0]["id"]
-        response = client.get(f"/api/notes/{note_id}/suggest-stream")
+        assert event is not None
+        assert event["type"] == "error"
+        assert "not found" in event["message"].lower()
 
-        assert response.status_code == 200
-        content = response.text
 
-        # SSE events should start with "data: "
-        assert "data: " in content
+class _SuggestStream(NamedTuple):
+    """One /suggest-stream response and the SSE events read from its stream."""
 
-        # Parse events
-        events = []
-        for line in content.split("\n\n"):
-            if line.startswith("data: "):
-                import json
+    response: httpx.Response
+    events: list[dict[str, Any]]
+    event_types: set[str]
 
-                try:
-                    event_data = json.loads(line[6:])  # Skip "data: "
-                    events.append(event_data)
-                except json.JSONDecodeError:
-                    pass
 
-        # Should have at least progress and complete events
-        assert len(events) >= 1
+# Event types after which /suggest-stream sends nothing further
+_TERMINAL_SSE_EVENTS = frozenset({"complete", "error"})
 
-        # First event should be progress or error
-        assert events[0]["type"] in ["progress", "error"]
 
-        # If Ollama is available, should have complete event at end
-        # If not available, should have error event
-        last_event_type = events[-1]["type"]
-        assert last_event_type in ["complete", "error"]
+def _read_sse_events(lines: Iterable[str]) -> list[dict[str, Any]]:
+    """Parse `data: ` lines as they arrive, stopping at the terminal event.
 
-    @slow
-    def test_suggest_stream_full_flow(self, client: TestClient) -> None:
-        """Full streaming flow returns tags and links (slow test, hits real Ollama)."""
-        notes_response = client.get("/api/notes")
-        if notes_response.status_code != 200:
-            pytest.skip("Notes endpoint not available")
+    Malformed payloads are skipped.
+    """
+    events: list[dict[str, Any]] = []
+    for line in lines:
+        if not line.startswith("data: "):
+            continue
+        with suppress(json.JSONDecodeError):
+            events.append(json.loads(line[6:]))  # Skip "data: "
+            if events[-1].get("type") in _TERMINAL_SSE_EVENTS:
+                break
+    return events
+
+
+@pytest.fixture(scope="class")
+def suggest_stream(session_client: TestClient) -> Generator[_SuggestStream]:
+    """Stream suggestions for a mock note once and share the result across the class.
+
+    This drives the real endpoint against MockOllamaClient (~10ms) rather than
+    replaying a recorded stream, so the tests keep covering the SSE encoding.
+    """
+    notes_service = MockNotesService()
+    note_id = notes_service.list_notes()[0]["id"]
+    app.dependency_overrides[get_llm] = lambda: MockOllamaClient()
+    app.dependency_overrides[get_notes] = lambda: notes_service
+    try:
+        with session_client.stream("GET", f"/api/notes/{note_id}/suggest-stream") as response:
+            events = _read_sse_events(response.iter_lines())
+    finally:
+        app.dependency_overrides.clear()
 
-        notes = notes_response.json().get("notes", [])
-        if not notes:
-            pytest.skip("No notes available for testing")
+    yield _SuggestStream(response, events, {e.get("type") for e in events})
 
-        note_id = notes[0]["id"]
-        response = client.get(f"/api/notes/{note_id}/suggest-stream")
 
-        assert response.status_code == 200
-        content = response.text
+class TestSuggestStreamEvents:
+    """Assertions over a single successful /suggest-stream run (see `suggest_stream`)."""
 
-        # Parse all events
-        events = []
-        for line in content.split("\n\n"):
-            if line.startswith("data: "):
-                import json
+    def test_suggest_stream_returns_sse_content_type(self, suggest_stream: _SuggestStream) -> None:
+        """Streaming endpoint returns text/event-stream content type."""
+        assert suggest_stream.response.status_code == 200
+        assert "text/event-stream" in suggest_stream.response.headers.get("content-type", "")
 
-                try:
-                    event_data = json.loads(line[6:])
-                    events.append(event_data)
-                except json.JSONDecodeError:
-                    pass
+    def test_suggest_stream_no_buffering_headers(self, suggest_stream: _SuggestStream) -> None:
+        """Streaming endpoint sets proper no-buffering headers."""
+        assert suggest_stream.response.headers.get("cache-control") == "no-cache"
 
-        event_types = [e.get("type") for e in events]
+    def test_suggest_stream_returns_sse_events(self, suggest_stream: _SuggestStream) -> None:
+        """Streaming endpoint returns properly formatted SSE events."""
+        # First event is progress, last is complete (the mock is available)
+        events = suggest_stream.events
+        assert len(events) >= 1
+        assert events[0]["type"] == "progress"
+        assert events[-1]["type"] == "complete"
 
-        # If Ollama is available, should see progress phases
-        if "error" not in event_types:
-            assert "progress" in event_types
-            assert "complete" in event_types
+    def test_suggest_stream_full_flow(self, suggest_stream: _SuggestStream) -> None:
+        """Full streaming flow reports progress for both tags and links."""
+        assert "error" not in suggest_stream.event_types
+        assert {"progress", "complete"} <= suggest_stream.event_types
 
-            # Check progress phases
-            progress_events = [e for e in events if e.get("type") == "progress"]
-            phases = [e.get("phase") for e in progress_events]
-            assert "tags" in phases
-            assert "links" in phases
+        phases = {e.get("phase") for e in suggest_stream.events if e.get("type") == "progress"}
+        assert {"tags", "links"} <= phases
 
-    def test_suggest_stream_generating_events(self, client: TestClient) -> None:
+    def test_suggest_stream_generating_events(self, suggest_stream: _SuggestStream) -> None:
         """Streaming generates 'generating' heartbeat events during token generation."""
-        notes_response = client.get("/api/notes")
-        if notes_response.status_code != 200:
-            pytest.skip("Notes endpoint not available")
-
-        notes = notes_response.json().get("notes", [])
-        if not notes:
-            pytest.skip("No notes available for testing")
-
-        note_id = notes[0]["id"]
-        response = client.get(f"/api/notes/{note_id}/suggest-stream")
-
-        assert response.status_code == 200
-        content = response.text
-
-        # Parse all events
-        events = []
-        for line in content.split("\n\n"):
-            if line.startswith("data: "):
-                import json
-
-                try:
-                    event_data = json.loads(line[6:])
-                    events.append(event_data)
-                except json.JSONDecodeError:
-                    pass
-
-        event_types = [e.get("type") for e in events]
-
-        # If not an error, should have generating events with token counts
-        if "error" not in event_types:
-            # The mock generates tokens character by character, so we get generating events
-            generating_events = [e for e in events if e.get("type") == "generating"]
-            # Should have at least some generating events (sent every 10 tokens)
-            # Mock returns ~60 chars so we expect at least 5-6 generating events
-            assert len(generating_events) >= 4
-            # Each should have phase and token count
-            for gen_event in generating_events:
-                assert "phase" in gen_event
-                assert "tokens" in gen_event
-                assert gen_event["tokens"] > 0
-
-    @slow
-    def test_suggest_stream_no_buffering_headers(self, client: TestClient) -> None:
-        """Streaming endpoint sets proper no-buffering headers."""
-        notes_response = client.get("/api/notes")
-        if notes_response.status_code != 200:
-            pytest.skip("Notes endpoint not available")
-
-        notes = notes_response.json().get("notes", [])
-        if not notes:
-            pytest.skip("No notes available for testing")
-
-        note_id = notes[0]["id"]
-        response = client.get(f"/api/notes/{note_id}/suggest-stream")
-
-        assert response.status_code == 200
-        # Check for no-cache header
-        assert response.headers.get("cache-control") == "no-cache"
+        assert "error" not in suggest_stream.event_types
+
+        # The mock generates tokens character by character, so we get generating events
+        generating_events = [e for e in suggest_stream.events if e.get("type") == "generating"]
+        # Should have at least some generating events (sent every 10 tokens)
+        # Mock returns ~60 chars so we expect at least 5-6 generating events
+        assert len(generating_events) >= 4
+        # Each should have phase and token count
+        for gen_event in generating_events:
+            assert "phase" in gen_event
+            assert "tokens" in gen_event
+            assert gen_event["tokens"] > 0
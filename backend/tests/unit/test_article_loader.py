@@ -7,65 +7,30 @@ These tests verify article loading logic including:
 - Cache invalidation
 """
 
-import tempfile
+from collections.abc import Generator
 from pathlib import Path
+from typing import Any
 
-from adapters import article_loader
-
-
-class TestArticleLoaderDraftFiltering:
-    """Tests for draft article loading.
+import pytest
 
-    The loader itself no longer filters drafts by environment (#184) - it
-    always loads every article, tagged with its `draft` field. Visibility is
-    decided by callers (dependencies.py, routers/articles.py).
-    """
+from adapters import article_loader
+from config import settings
 
-    def create_test_article(self, article_dir: Path, filename: str, draft: bool = False) -> None:
-        """Helper to create a test article with frontmatter."""
-        content = f"""---
-id: 1
-title: "Test Article"
+ARTICLE_TEMPLATE = """---
+id: {id}
+title: "{title}"
 tags: ["test"]
-draft: {str(draft).lower()}
+draft: {draft}
 published_date: "2025-10-14T10:00:00"
 created_at: "2025-10-14T10:00:00"
 ---
 
-# Test Article
+# {title}
 
 This is test content.
 """
-        article_path = article_dir / filename
-        article_path.write_text(content)
-
-    def test_loads_both_published_and_draft_articles(self):
-        """Should load both draft and published articles, regardless of mode."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            articles_dir = Path(tmpdir)
-
-            # Create published and draft articles
-            self.create_test_article(articles_dir, "published.md", draft=False)
-            self.create_test_article(articles_dir, "draft.md", draft=True)
-
-            # Clear cache before test
-            article_loader._articles_cache = None
-            article_loader._articles_hash = None
-
-            articles = article_loader.load_static_articles_from_local(articles_dir)
 
-            # Should load both articles, with draft field preserved
-            assert len(articles) == 2
-            draft_flags = {a["draft"] for a in articles}
-            assert draft_flags == {True, False}
-
-    def test_loads_date_fields(self):
-        """Should properly load published_date and updated_date fields."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            articles_dir = Path(tmpdir)
-
-            # Create article with dates
-            content = """---
+DATED_ARTICLE = b"""---
 id: 2
 title: "Article with Dates"
 tags: ["test"]
@@ -77,27 +42,9 @@ created_at: "2025-10-14T10:00:00"
 
 # Article with dates
 """
-            (articles_dir / "dated.md").write_text(content)
-
-            # Clear cache before test
-            article_loader._articles_cache = None
-            article_loader._articles_hash = None
-
-            articles = article_loader.load_static_articles_from_local(articles_dir)
-
-            assert len(articles) == 1
-            article = articles[0]
-            assert article["published_date"] == "2025-10-14T10:00:00"
-            assert article["updated_date"] == "2025-10-20T15:30:00"
-            assert article["created_at"] == "2025-10-14T10:00:00"
-
-    def test_defaults_draft_to_false_when_missing(self):
-        """Should treat articles without draft field as published."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            articles_dir = Path(tmpdir)
 
-            # Create article without draft field
-            content = """---
+# No draft field at all
+LEGACY_ARTICLE = b"""---
 id: 3
 title: "Legacy Article"
 tags: ["test"]
@@ -106,73 +53,121 @@ created_at: "2025-10-14T10:00:00"
 
 # Legacy Article
 """
-            (articles_dir / "legacy.md").write_text(content)
 
-            # Clear cache before test
-            article_loader._articles_cache = None
-            article_loader._articles_hash = None
+# Rendered once at import; tests only vary the filename and draft flag
+PUBLISHED_ARTICLE = ARTICLE_TEMPLATE.format(id=1, title="Test Article", draft="false").encode()
+DRAFT_ARTICLE = ARTICLE_TEMPLATE.format(id=4, title="Draft Article", draft="true").encode()
 
-            articles = article_loader.load_static_articles_from_local(articles_dir)
 
-            assert len(articles) == 1
-            # Should default to False (published)
-            assert articles[0].get("draft", False) is False
+def create_test_article(article_dir: Path, filename: str, draft: bool = False) -> None:
+    """Helper to create a test article with frontmatter."""
+    (article_dir / filename).write_bytes(DRAFT_ARTICLE if draft else PUBLISHED_ARTICLE)
 
-    def test_cache_invalidation_on_file_change(self):
-        """Cache should invalidate when article files change."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            articles_dir = Path(tmpdir)
 
-            # Create initial article
-            self.create_test_article(articles_dir, "article.md", draft=False)
+@pytest.fixture(autouse=True)
+def reset_article_cache() -> Generator[None]:
+    """Start every test with an empty module-level article cache."""
+    article_loader.clear_articles_cache()
+    yield
+    article_loader.clear_articles_cache()
+
+
+@pytest.fixture(scope="session")
+def shared_articles_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Published, draft, dated and legacy articles, written once per session (per worker).
+
+    The directory is made read-only; tests that add or change files use tmp_path.
+    """
+    articles_dir = tmp_path_factory.mktemp("articles")
+    create_test_article(articles_dir, "published.md", draft=False)
+    create_test_article(articles_dir, "draft.md", draft=True)
+    (articles_dir / "dated.md").write_bytes(DATED_ARTICLE)
+    (articles_dir / "legacy.md").write_bytes(LEGACY_ARTICLE)
+    articles_dir.chmod(0o555)
+    return articles_dir
+
 
-            # Clear cache before test
-            article_loader._articles_cache = None
-            article_loader._articles_hash = None
+@pytest.fixture(params=[True, False], ids=["debug", "production"])
+def debug_mode(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run a test with settings.debug on and off."""
+    monkeypatch.setattr(settings, "debug", request.param)
+    return bool(request.param)
 
-            # First load
-            articles1 = article_loader.load_static_articles_from_local(articles_dir)
-            assert len(articles1) == 1
 
-            # Add another article
-            self.create_test_article(articles_dir, "article2.md", draft=False)
+def load_by_id(articles_dir: Path) -> dict[int, dict[str, Any]]:
+    """Load articles from a directory, keyed by their frontmatter id."""
+    return {a["id"]: a for a in article_loader.load_static_articles_from_local(articles_dir)}
 
-            # Second load should detect change
-            articles2 = article_loader.load_static_articles_from_local(articles_dir)
-            assert len(articles2) == 2
+
+class TestArticleLoaderDraftFiltering:
+    """Tests for draft article loading.
+
+    The loader itself no longer filters drafts by environment (#184) - it
+    always loads every article, tagged with its `draft` field. Visibility is
+    decided by callers (dependencies.py, routers/articles.py).
+    """
+
+    @pytest.mark.usefixtures("debug_mode")
+    def test_loads_both_published_and_draft_articles(self, shared_articles_dir: Path) -> None:
+        """Should load both draft and published articles, regardless of mode."""
+        articles = load_by_id(shared_articles_dir)
+
+        # Should load every article, with draft field preserved
+        assert set(articles) == {1, 2, 3, 4}
+        assert articles[1]["draft"] is False
+        assert articles[4]["draft"] is True
+
+    def test_loads_date_fields(self, shared_articles_dir: Path) -> None:
+        """Should properly load published_date and updated_date fields."""
+        article = load_by_id(shared_articles_dir)[2]
+
+        assert article["published_date"] == "2025-10-14T10:00:00"
+        assert article["updated_date"] == "2025-10-20T15:30:00"
+        assert article["created_at"] == "2025-10-14T10:00:00"
+
+    def test_defaults_draft_to_false_when_missing(self, shared_articles_dir: Path) -> None:
+        """Should treat articles without draft field as published."""
+        article = load_by_id(shared_articles_dir)[3]
+
+        # Should default to False (published)
+        assert article.get("draft", False) is False
+
+    def test_cache_invalidation_on_file_change(self, tmp_path: Path) -> None:
+        """Cache should invalidate when article files change."""
+        create_test_article(tmp_path, "article.md", draft=False)
+
+        # First load
+        articles1 = article_loader.load_static_articles_from_local(tmp_path)
+        assert len(articles1) == 1
+
+        # Add another article
+        create_test_article(tmp_path, "article2.md", draft=False)
+
+        # Second load should detect change
+        articles2 = article_loader.load_static_articles_from_local(tmp_path)
+        assert len(articles2) == 2
 
 
 class TestArticleLoaderCaching:
     """Tests for article caching behavior."""
 
-    def test_uses_cache_when_files_unchanged(self):
+    def test_uses_cache_when_files_unchanged(self, shared_articles_dir: Path) -> None:
         """Should return cached articles when files haven't changed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            articles_dir = Path(tmpdir)
+        # First load
+        articles1 = article_loader.load_static_articles_from_local(shared_articles_dir)
 
-            # Create test article
-            content = """---
-id: 4
-title: "Cached Article"
-tags: ["test"]
-draft: false
-published_date: "2025-10-14T10:00:00"
-created_at: "2025-10-14T10:00:00"
----
-
-# Cached Article
-"""
-            (articles_dir / "cached.md").write_text(content)
+        # Second load should use cache (same reference)
+        articles2 = article_loader.load_static_articles_from_local(shared_articles_dir)
 
-            # Clear cache before test
-            article_loader._articles_cache = None
-            article_loader._articles_hash = None
+        # Should return the same cached object
+        assert articles1 is articles2
 
-            # First load
-            articles1 = article_loader.load_static_articles_from_local(articles_dir)
+    def test_clear_articles_cache_forces_reload(self, shared_articles_dir: Path) -> None:
+        """Clearing the cache makes the next load re-read the directory."""
+        articles1 = article_loader.load_static_articles_from_local(shared_articles_dir)
 
-            # Second load should use cache (same reference)
-            articles2 = article_loader.load_static_articles_from_local(articles_dir)
+        article_loader.clear_articles_cache()
+        articles2 = article_loader.load_static_articles_from_local(shared_articles_dir)
 
-            # Should return the same cached object
-            assert articles1 is articles2
+        assert articles2 is not articles1
+        assert articles2 == articles1
@@ -20,7 +20,6 @@ os.environ["TESTING"] = "1"
 from auth import MAX_FAILED_ATTEMPTS
 from config import get_settings
 from core.sessions import create_session_token, derive_session_secret
-from main import app as real_app
 from routers.auth import create_auth_router
 
 TEST_ADMIN_TOKEN = "test-admin-token-for-ci"
@@ -116,6 +115,12 @@ def _client(adapter: FakeNeo4jAdapter) -> TestClient:
     return TestClient(app)
 
 
+@pytest.fixture
+def real_client(session_client: TestClient) -> TestClient:
+    """The full app (conftest's session client), for cross-cutting auth checks."""
+    return session_client
+
+
 @pytest.fixture
 def adapter() -> FakeNeo4jAdapter:
     return FakeNeo4jAdapter()
@@ -396,66 +401,71 @@ class TestAuthResponsesAreNotCacheable:
     /api/auth/session kept reporting the pre-login answer, for a full minute.
     """
 
-    def test_session_endpoint_is_no_store(self) -> None:
-        client = TestClient(real_app)
-        response = client.get("/api/auth/session")
+    def test_session_endpoint_is_no_store(self, real_client: TestClient) -> None:
+        response = real_client.get("/api/auth/session")
         assert "no-store" in response.headers["Cache-Control"]
 
-    def test_credentials_endpoint_is_no_store(self, session_headers: dict[str, str]) -> None:
-        client = TestClient(real_app)
-        response = client.get("/api/auth/credentials", headers=session_headers)
+    def test_credentials_endpoint_is_no_store(
+        self, real_client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        response = real_client.get("/api/auth/credentials", headers=session_headers)
         assert "no-store" in response.headers["Cache-Control"]
 
-    def test_auth_responses_are_private(self, session_headers: dict[str, str]) -> None:
+    def test_auth_responses_are_private(
+        self, real_client: TestClient, session_headers: dict[str, str]
+    ) -> None:
         """A shared cache must not hold one caller's credential list."""
-        client = TestClient(real_app)
-        response = client.get("/api/auth/credentials", headers=session_headers)
+        response = real_client.get("/api/auth/credentials", headers=session_headers)
         assert "private" in response.headers["Cache-Control"]
 
-    def test_other_get_endpoints_still_cache(self) -> None:
+    @pytest.mark.neo4j
+    def test_other_get_endpoints_still_cache(self, real_client: TestClient) -> None:
         """The fix must not disable caching for the rest of the API."""
-        client = TestClient(real_app)
-        response = client.get("/api/notes?limit=1")
+        response = real_client.get("/api/notes?limit=1")
         assert "max-age=60" in response.headers["Cache-Control"]
 
 
 class TestSessionTokenAcceptedByAdminEndpoints:
     """Session tokens must work everywhere the static token did."""
 
-    def test_session_token_authorizes_admin_endpoint(self, session_headers: dict[str, str]) -> None:
-        client = TestClient(real_app)
-        response = client.get("/api/admin/backups", headers=session_headers)
+    def test_session_token_authorizes_admin_endpoint(
+        self, real_client: TestClient, session_headers: dict[str, str]
+    ) -> None:
+        response = real_client.get("/api/admin/backups", headers=session_headers)
         assert response.status_code == 200
 
-    def test_expired_session_gets_401_not_403(self) -> None:
+    def test_expired_session_gets_401_not_403(self, real_client: TestClient) -> None:
         """401 tells the frontend to re-authenticate; 403 means a bad token."""
-        client = TestClient(real_app)
         secret = derive_session_secret(_admin_token(), get_settings().session_secret)
         expired = create_session_token(secret, "cred", time.time() - 100_000)
-        response = client.get("/api/admin/backups", headers={"Authorization": f"Bearer {expired}"})
+        response = real_client.get(
+            "/api/admin/backups", headers={"Authorization": f"Bearer {expired}"}
+        )
         assert response.status_code == 401
         assert "Session expired" in response.json()["detail"]
 
-    def test_expired_sessions_do_not_trigger_lockout(self) -> None:
+    def test_expired_sessions_do_not_trigger_lockout(self, real_client: TestClient) -> None:
         """A stale browser tab must not lock the admin out of signing back in."""
-        client = TestClient(real_app)
         secret = derive_session_secret(_admin_token(), get_settings().session_secret)
         expired = create_session_token(secret, "cred", time.time() - 100_000)
         headers = {"Authorization": f"Bearer {expired}"}
 
         for _ in range(MAX_FAILED_ATTEMPTS + 2):
-            assert client.get("/api/admin/backups", headers=headers).status_code == 401
+            assert real_client.get("/api/admin/backups", headers=headers).status_code == 401
 
         # Not locked out: a fresh session still works
         fresh = create_session_token(secret, "cred", time.time())
-        response = client.get("/api/admin/backups", headers={"Authorization": f"Bearer {fresh}"})
+        response = real_client.get(
+            "/api/admin/backups", headers={"Authorization": f"Bearer {fresh}"}
+        )
         assert response.status_code == 200
 
-    def test_forged_session_signature_rejected(self) -> None:
+    def test_forged_session_signature_rejected(self, real_client: TestClient) -> None:
         """A session token signed with the wrong secret is not session-shaped auth."""
-        client = TestClient(real_app)
         forged = create_session_token("attacker-secret", "cred", time.time())
-        response = client.get("/api/admin/backups", headers={"Authorization": f"Bearer {forged}"})
+        response = real_client.get(
+            "/api/admin/backups", headers={"Authorization": f"Bearer {forged}"}
+        )
         # Shaped like a session but unverifiable -> 401, never authorized
         assert response.status_code == 401
 
@@ -469,39 +479,35 @@ class TestStaticTokenIsEnrollmentOnly:
     the break-glass path), but cannot read, write, back up, or revoke.
     """
 
-    def test_token_rejected_on_admin_endpoint(self) -> None:
-        client = TestClient(real_app)
-        response = client.get(
+    def test_token_rejected_on_admin_endpoint(self, real_client: TestClient) -> None:
+        response = real_client.get(
             "/api/admin/backups", headers={"Authorization": f"Bearer {_admin_token()}"}
         )
         assert response.status_code == 403
         assert "passkey session" in response.json()["detail"].lower()
 
-    def test_token_rejected_on_credentials_list(self) -> None:
-        client = TestClient(real_app)
-        response = client.get(
+    def test_token_rejected_on_credentials_list(self, real_client: TestClient) -> None:
+        response = real_client.get(
             "/api/auth/credentials", headers={"Authorization": f"Bearer {_admin_token()}"}
         )
         assert response.status_code == 403
 
-    def test_token_rejected_on_note_creation(self) -> None:
-        client = TestClient(real_app)
-        response = client.post(
+    def test_token_rejected_on_note_creation(self, real_client: TestClient) -> None:
+        response = real_client.post(
             "/api/notes",
             json={"content": "should be blocked"},
             headers={"Authorization": f"Bearer {_admin_token()}"},
         )
         assert response.status_code == 403
 
-    def test_token_still_authorizes_enrollment(self) -> None:
+    def test_token_still_authorizes_enrollment(self, real_client: TestClient) -> None:
         """The one thing the token can still do: begin passkey enrollment.
 
         Auth is checked before the endpoint body, so passing the enrollment gate
         yields any status except 403 (200 if Neo4j is up, 503 if not) - an
         unauthorized token would be a flat 403.
         """
-        client = TestClient(real_app)
-        response = client.post(
+        response = real_client.post(
             "/api/auth/register/options",
             json={"name": "Bootstrap"},
             headers={"Authorization": f"Bearer {_admin_token()}"},
@@ -4,6 +4,8 @@ These tests verify pure functions with no I/O dependencies.
 All functions should be deterministic: same input → same output.
 """
 
+from unittest.mock import Mock
+
 import pytest
 
 from core import ai
@@ -35,12 +37,29 @@ class TestCosineSimilarity:
         vec2 = [1.0, 2.0, 3.0]
         assert ai.cosine_similarity(vec1, vec2) == 0.0
 
+    def test_different_lengths_skip_norms(self, monkeypatch: pytest.MonkeyPatch):
+        """A length mismatch is rejected before either vector is traversed."""
+        norm_spy = Mock(wraps=ai.vector_norm)
+        monkeypatch.setattr(ai, "vector_norm", norm_spy)
+
+        assert ai.cosine_similarity([1.0, 2.0], [1.0, 2.0, 3.0]) == 0.0
+        norm_spy.assert_not_called()
+
     def test_zero_vectors(self):
         """Zero vectors should return 0.0 (avoid division by zero)."""
         vec1 = [0.0, 0.0, 0.0]
         vec2 = [1.0, 2.0, 3.0]
         assert ai.cosine_similarity(vec1, vec2) == 0.0
 
+    def test_matches_reference_formula_on_embedding_sized_vectors(self):
+        """Result should match the textbook formula on 768-dim vectors."""
+        vec1 = [((i * 37) % 101) / 50.0 - 1.0 for i in range(768)]
+        vec2 = [((i * 53) % 97) / 48.0 - 1.0 for i in range(768)]
+
+        dot = sum(a * b for a, b in zip(vec1, vec2, strict=True))
+        norms = sum(a * a for a in vec1) ** 0.5 * sum(b * b for b in vec2) ** 0.5
+        assert ai.cosine_similarity(vec1, vec2) == pytest.approx(dot / norms)
+
 
 class TestRankDocumentsBySimilarity:
     """Tests for document ranking by similarity."""
@@ -84,6 +103,102 @@ class TestRankDocumentsBySimilarity:
         assert len(results) == 2
         assert all("score" in doc for doc in results)
 
+    def test_ties_keep_input_order(self):
+        """Equal scores should keep the documents' original order."""
+        query_emb = [1.0, 0.0]
+        docs = [
+            {"id": "low", "embedding": [0.0, 1.0]},
+            {"id": "tie-a", "embedding": [2.0, 0.0]},
+            {"id": "tie-b", "embedding": [1.0, 0.0]},
+        ]
+
+        results = ai.rank_documents_by_similarity(query_emb, docs, top_k=2)
+
+        assert [doc["id"] for doc in results] == ["tie-a", "tie-b"]
+
+    def test_scores_match_cosine_similarity_without_mutating_input(self):
+        """Scores should equal cosine_similarity, and input docs stay untouched."""
+        query_emb = [1.0, 2.0, 0.5]
+        docs = [
+            {"id": "doc1", "embedding": [0.3, 0.1, 0.9]},
+            {"id": "doc2", "embedding": [1.0, 0.0]},  # Dimension mismatch scores 0.0
+        ]
+
+        results = ai.rank_documents_by_similarity(query_emb, docs, top_k=2)
+
+        assert results[0]["score"] == pytest.approx(
+            ai.cosine_similarity(query_emb, docs[0]["embedding"])
+        )
+        assert results[1]["score"] == 0.0
+        assert all("score" not in doc for doc in docs)
+
+    def test_wrong_dimension_document_skips_norm(self, monkeypatch: pytest.MonkeyPatch):
+        """A wrong-dimension doc without a stored norm costs no norm pass."""
+        norm_spy = Mock(wraps=ai.vector_norm)
+        monkeypatch.setattr(ai, "vector_norm", norm_spy)
+        docs = [{"id": "short", "embedding": [1.0, 0.0]}]
+
+        (result,) = ai.rank_documents_by_similarity([1.0, 2.0, 0.5], docs, top_k=1)
+
+        assert result["score"] == 0.0
+        norm_spy.assert_called_once_with([1.0, 2.0, 0.5])  # the query's, only
+
+    def test_zero_query_scores_every_document_zero(self):
+        """A zero query vector has no direction; documents are kept with score 0."""
+        docs = [{"id": "a", "embedding": [1.0, 0.0]}, {"id": "b", "embedding": [0.0, 1.0]}]
+
+        results = ai.rank_documents_by_similarity([0.0, 0.0], docs, top_k=5)
+
+        assert [(doc["id"], doc["score"]) for doc in results] == [("a", 0.0), ("b", 0.0)]
+
+    def test_uses_stored_embedding_norm(self):
+        """A precomputed embedding_norm replaces the per-document norm pass."""
+        query_emb = [1.0, 0.0]
+        stored = {"id": "stored", "embedding": [3.0, 4.0], "embedding_norm": 5.0}
+        legacy = {"id": "legacy", "embedding": [3.0, 4.0], "embedding_norm": None}
+
+        results = ai.rank_documents_by_similarity(query_emb, [stored, legacy], top_k=2)
+
+        assert [doc["score"] for doc in results] == [pytest.approx(0.6)] * 2
+
+        # The stored value is trusted as-is rather than recomputed
+        skewed = {**stored, "embedding_norm": 10.0}
+        (result,) = ai.rank_documents_by_similarity(query_emb, [skewed], top_k=1)
+        assert result["score"] == pytest.approx(0.3)
+
+
+class TestVectorNorm:
+    """Tests for vector_norm (stored as embedding_norm at ingest)."""
+
+    @pytest.mark.parametrize(
+        ("vector", "expected"),
+        [([3.0, 4.0], 5.0), ([0.0, 0.0], 0.0), ([], 0.0), ([-2.0], 2.0)],
+    )
+    def test_l2_norm(self, vector: list[float], expected: float):
+        assert ai.vector_norm(vector) == pytest.approx(expected)
+
+
+class TestCosineSimilarityFromNorms:
+    """Tests for cosine_similarity_from_norms (norms precomputed or stored)."""
+
+    def test_matches_cosine_similarity(self):
+        vec1, vec2 = [1.0, 2.0, 3.0], [2.0, 0.5, -1.0]
+        result = ai.cosine_similarity_from_norms(
+            vec1, vec2, ai.vector_norm(vec1), ai.vector_norm(vec2)
+        )
+        assert result == ai.cosine_similarity(vec1, vec2)
+
+    @pytest.mark.parametrize(
+        ("vec1", "vec2"),
+        [([1.0, 2.0], [1.0, 2.0, 3.0]), ([0.0, 0.0], [1.0, 2.0]), ([], [])],
+    )
+    def test_degenerate_pairs_score_zero(self, vec1: list[float], vec2: list[float]):
+        """Mismatched lengths and empty or all-zero vectors score 0.0."""
+        result = ai.cosine_similarity_from_norms(
+            vec1, vec2, ai.vector_norm(vec1), ai.vector_norm(vec2)
+        )
+        assert result == 0.0
+
 
 class TestBuildContextFromDocuments:
     """Tests for building context strings from documents."""
@@ -458,44 +573,35 @@ class TestParseJSONResponse:
         assert isinstance(result, dict)
         assert result["summary"] == "A summary."
 
+    def test_recovers_first_payload_when_prose_has_more_brackets(self):
+        """Trailing bracketed prose after the payload is ignored."""
+        response = 'Result: [{"tag": "sre [core]"}] (see [1] for details)'
+        result = ai.parse_json_response(response, expected_type="array")
+
+        assert result == [{"tag": "sre [core]"}]
+
     def test_genuine_garbage_still_returns_none(self):
         """Hardening must not turn unparseable output into a false positive."""
         assert ai.parse_json_response("I could not do that.", expected_type="array") is None
 
 
-class TestExtractJSONPayload:
-    """Tests for bracket-matched payload extraction."""
-
-    def test_extracts_array_from_prose(self):
-        result = ai.extract_json_payload('Here: [{"a": 1}] done', opener="[")
-        assert result == '[{"a": 1}]'
+class TestDecodeEmbeddedJson:
+    """Tests for decoding a JSON payload wrapped in prose."""
 
-    def test_extracts_object_from_prose(self):
-        result = ai.extract_json_payload('Here: {"a": 1} done', opener="{")
-        assert result == '{"a": 1}'
+    def test_decodes_array_from_prose(self):
+        assert ai.decode_embedded_json('Here: [{"a": 1}] done [1]', "[") == [{"a": 1}]
 
-    def test_handles_nested_structures(self):
-        result = ai.extract_json_payload('x [{"a": [1, 2], "b": {"c": 3}}] y', opener="[")
-        assert result == '[{"a": [1, 2], "b": {"c": 3}}]'
+    def test_decodes_object_from_prose(self):
+        assert ai.decode_embedded_json('Here: {"a": [1, 2]} done', "{") == {"a": [1, 2]}
 
-    def test_ignores_brackets_inside_strings(self):
-        """Wikilink syntax in a reason field must not unbalance the scan.
+    def test_brackets_inside_strings_do_not_end_payload(self):
+        """Wikilinks in a reason field are the normal case in this codebase."""
+        text = '[{"reason": "see [[note-id]] here"}] trailing'
+        assert ai.decode_embedded_json(text, "[") == [{"reason": "see [[note-id]] here"}]
 
-        This codebase's own note IDs appear as [[note-id]], so payloads
-        containing them are the normal case, not an edge case.
-        """
-        result = ai.extract_json_payload('[{"reason": "see [[note-id]] here"}]', opener="[")
-        assert result == '[{"reason": "see [[note-id]] here"}]'
-
-    def test_ignores_escaped_quotes(self):
-        result = ai.extract_json_payload(r'[{"reason": "a \"quoted\" word"}]', opener="[")
-        assert result == r'[{"reason": "a \"quoted\" word"}]'
-
-    def test_returns_none_when_absent(self):
-        assert ai.extract_json_payload("no payload here", opener="[") is None
-
-    def test_returns_none_when_unbalanced(self):
-        assert ai.extract_json_payload('[{"a": 1}', opener="[") is None
+    @pytest.mark.parametrize("text", ["no payload here", '[{"a": 1}', "see [1 for details"])
+    def test_returns_none_without_valid_payload(self, text: str):
+        assert ai.decode_embedded_json(text, "[") is None
 
 
 class TestPromptBuilders:
@@ -532,6 +638,18 @@ class TestPromptBuilders:
         assert len(candidates) == 1
         assert candidates[0]["id"] == "note-3"
 
+    def test_filter_link_candidates_accepts_any_iterable(self):
+        """existing_links may be a set or generator, not just a list."""
+        all_notes = [{"id": f"note-{i}", "content": "text"} for i in range(5)]
+
+        candidates = ai.filter_link_candidates(
+            all_notes,
+            current_note_id="note-0",
+            existing_links=(f"note-{i}" for i in (1, 3)),
+        )
+
+        assert [n["id"] for n in candidates] == ["note-2", "note-4"]
+
     def test_build_link_suggestion_prompt(self):
         """Link suggestion prompt should format candidates correctly."""
         current_title = "Current Note"
@@ -561,6 +679,11 @@ class TestMeanVector:
     def test_empty_input(self):
         assert ai.mean_vector([]) == []
 
+    def test_matches_per_dimension_mean(self):
+        vectors = [[float(i * j % 7) / 3 for j in range(768)] for i in range(1, 6)]
+        expected = [sum(v[d] for v in vectors) / len(vectors) for d in range(768)]
+        assert ai.mean_vector(vectors) == expected
+
     def test_mismatched_lengths_return_empty(self):
         assert ai.mean_vector([[1.0, 2.0], [1.0]]) == []
 
@@ -615,3 +738,16 @@ class TestRankParentsByChunkSimilarity:
 
     def test_empty_chunks(self):
         assert ai.rank_parents_by_chunk_similarity([1.0], [], top_k=5) == []
+
+    def test_uses_stored_embedding_norm(self):
+        query = [1.0, 0.0]
+        chunks = [
+            {
+                "parent_type": "Note",
+                "parent_id": "x",
+                "embedding": [3.0, 4.0],
+                "embedding_norm": 5.0,
+            },
+        ]
+        results = ai.rank_parents_by_chunk_similarity(query, chunks, top_k=5)
+        assert results[0]["score"] == pytest.approx(0.6)
@@ -88,6 +88,10 @@ class TestValidateNoteId:
         """Spaces should be invalid."""
         assert notes.validate_note_id("curious elephant") is False
 
+    def test_rejects_trailing_newline(self):
+        """The whole string must match; a trailing newline is not ignored."""
+        assert notes.validate_note_id("curious-elephant\n") is False
+
     def test_requires_hyphen(self):
         """Must have exactly one hyphen."""
         assert notes.validate_note_id("curiouselephant") is False
@@ -256,3 +260,21 @@ class TestBuildLocalSubgraph:
 
         # All nodes should be included (all within 5 hops)
         assert len(subgraph["nodes"]) == 3
+
+    def test_skips_links_to_missing_notes(self):
+        """Dangling links are traversed past without adding phantom nodes."""
+        notes_list = [
+            {
+                "id": "center",
+                "title": "Center",
+                "author": "admin",
+                "tags": [],
+                "links": ["deleted-note", "neighbor"],
+            },
+            {"id": "neighbor", "title": "Neighbor", "author": "admin", "tags": [], "links": []},
+        ]
+
+        subgraph = notes.build_local_subgraph(notes_list, "center", depth=2)
+
+        node_ids = [n["id"] for n in subgraph["nodes"]]
+        assert node_ids == ["center", "neighbor"]
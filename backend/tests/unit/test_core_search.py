@@ -74,6 +74,12 @@ class TestExtractSnippet:
         # Should not start with partial word like "ificent"
         assert "systems" in result
 
+    def test_word_boundary_search_is_bounded(self):
+        """Edges only move to a space within 20 chars; otherwise cut as-is."""
+        content = "x" * 50 + " " + "y" * 40 + " systems " + "z" * 40 + " " + "w" * 50
+        result = search.extract_snippet(content, "systems", context_chars=30)
+        assert result == "..." + "y" * 29 + " systems " + "z" * 29 + "..."
+
 
 class TestExtractMultipleSnippets:
     """Tests for extract_multiple_snippets function."""
@@ -101,6 +107,15 @@ class TestExtractMultipleSnippets:
         result = search.extract_multiple_snippets(content, "sys", max_snippets=2)
         assert len(result) <= 2
 
+    def test_finds_distant_match_after_dense_cluster(self):
+        """A run of nearby matches should not hide a later, separate match."""
+        content = "sys " * 10 + "X" * 300 + " final sys here"
+        result = search.extract_multiple_snippets(
+            content, "sys", max_snippets=2, max_snippet_length=100
+        )
+        assert len(result) == 2
+        assert "final sys" in result[1]
+
     def test_no_match_returns_beginning(self):
         """No match returns beginning of content."""
         content = "The quick brown fox"
@@ -145,6 +160,18 @@ class TestFindBestMatchPosition:
         pos = search.find_best_match_position(content, "systems")
         assert pos == 4  # Position of "SYSTEMS"
 
+    def test_position_indexes_original_content(self):
+        """Offsets stay correct when lowercasing would change string length."""
+        content = "İstanbul SYSTEMS"  # "İ".lower() is two characters
+        pos = search.find_best_match_position(content, "systems")
+        assert pos == 9
+        assert content[pos : pos + 7] == "SYSTEMS"
+
+    def test_regex_metacharacters_match_literally(self):
+        """Query text is matched literally, not as a regex."""
+        assert search.find_best_match_position("cost is $5 (approx)", "$5 (") == 8
+        assert search.find_best_match_position("a+b", "a.b") is None
+
 
 class TestFuzzyMatchText:
     """Tests for fuzzy_match_text function."""
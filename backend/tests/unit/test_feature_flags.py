@@ -51,9 +51,9 @@ def flag_service(
 
 
 @pytest.fixture
-def client(flag_service: FeatureFlagService) -> TestClient:
+def client(session_client: TestClient, flag_service: FeatureFlagService) -> TestClient:
     """Test client with the mock-backed flag service installed."""
-    return TestClient(app)
+    return session_client
 
 
 class TestFeatureFlagService:
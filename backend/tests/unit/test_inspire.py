@@ -16,6 +16,7 @@ from fastapi.testclient import TestClient
 os.environ["TESTING"] = "1"
 
 from core import inspire as inspire_core
+from core.ai import cosine_similarity
 from main import app
 from routers.inspire import _cache
 
@@ -25,10 +26,13 @@ from routers.inspire import _cache
 
 
 @pytest.fixture
-def client() -> Generator[TestClient]:
-    """Get test client for API testing (no default dependency overrides)."""
-    with TestClient(app) as test_client:
-        yield test_client
+def client(session_client: TestClient) -> Generator[TestClient]:
+    """Get test client for API testing (no default dependency overrides).
+
+    Reuses the session-wide client so the app lifespan runs once; tests install
+    their own overrides, which are cleared afterwards.
+    """
+    yield session_client
     app.dependency_overrides.clear()
 
 
@@ -359,6 +363,26 @@ class TestFindUnlinkedSimilarNotes:
 
         assert result == []
 
+    def test_mixed_direction_links_all_excluded(self) -> None:
+        embedding = [1.0, 0.0, 0.0]
+        note_embeddings = [(f"note-{c}", f"Note {c}", embedding) for c in "abcd"]
+        # a->b forward, c<-d backward; only the cross pairs remain unlinked
+        existing_links = {"note-a": {"note-b"}, "note-d": {"note-c"}}
+
+        result = inspire_core.find_unlinked_similar_notes(
+            note_embeddings=note_embeddings,
+            existing_links=existing_links,
+            similarity_threshold=0.7,
+        )
+
+        pairs = {(r["note_a_id"], r["note_b_id"]) for r in result}
+        assert pairs == {
+            ("note-a", "note-c"),
+            ("note-a", "note-d"),
+            ("note-b", "note-c"),
+            ("note-b", "note-d"),
+        }
+
     def test_below_threshold_excluded(self) -> None:
         note_embeddings = [
             ("note-a", "Note A", [1.0, 0.0, 0.0]),
@@ -399,6 +423,55 @@ class TestFindUnlinkedSimilarNotes:
         assert len(result) == 1
         assert result[0]["kind"] == "connection"
 
+    def test_similarity_matches_cosine_similarity(self) -> None:
+        """Precomputed norms must not change scores, including degenerate vectors."""
+        note_embeddings = [
+            ("note-a", "Alpha", [3.0, 4.0, 0.0]),
+            ("note-b", "Beta", [1.0, 2.0, 2.0]),
+            ("note-c", "Gamma", [0.0, 0.0, 0.0]),
+            ("note-d", "Delta", [1.0, 1.0]),
+        ]
+        result = inspire_core.find_unlinked_similar_notes(
+            note_embeddings=note_embeddings,
+            existing_links={},
+            similarity_threshold=0.0,
+            limit=10,
+        )
+
+        by_pair = {(r["note_a_id"], r["note_b_id"]): r["similarity"] for r in result}
+        assert len(by_pair) == 6
+        assert by_pair[("note-a", "note-b")] == round(
+            cosine_similarity([3.0, 4.0, 0.0], [1.0, 2.0, 2.0]), 3
+        )
+        assert by_pair[("note-a", "note-c")] == 0.0
+        assert by_pair[("note-a", "note-d")] == 0.0
+
+    def test_uses_stored_norms_when_given(self) -> None:
+        note_embeddings = [
+            ("note-a", "Alpha", [3.0, 4.0, 0.0]),
+            ("note-b", "Beta", [1.0, 2.0, 2.0]),
+        ]
+        computed = inspire_core.find_unlinked_similar_notes(
+            note_embeddings=note_embeddings, existing_links={}, similarity_threshold=0.0
+        )
+        stored = inspire_core.find_unlinked_similar_notes(
+            note_embeddings=note_embeddings,
+            existing_links={},
+            similarity_threshold=0.0,
+            embedding_norms=[5.0, None],
+        )
+        # A deliberately wrong stored norm proves the stored value is trusted
+        halved = inspire_core.find_unlinked_similar_notes(
+            note_embeddings=note_embeddings,
+            existing_links={},
+            similarity_threshold=0.0,
+            embedding_norms=[10.0, 3.0],
+        )
+
+        assert stored == computed
+        assert computed[0]["similarity"] == round(11 / 15, 3)
+        assert halved[0]["similarity"] == round(11 / 30, 3)
+
     def test_respects_limit(self) -> None:
         embedding = [1.0, 0.0, 0.0]
         note_embeddings = [(f"note-{i}", f"Note {i}", embedding) for i in range(5)]
@@ -408,6 +481,25 @@ class TestFindUnlinkedSimilarNotes:
 
         assert len(result) == 2
 
+    def test_limit_keeps_highest_with_ties_in_scan_order(self) -> None:
+        note_embeddings = [
+            ("note-a", "Alpha", [1.0, 0.0]),
+            ("note-b", "Beta", [1.0, 0.0]),
+            ("note-c", "Gamma", [1.0, 0.0]),
+            ("note-d", "Delta", [0.8, 0.6]),
+        ]
+        result = inspire_core.find_unlinked_similar_notes(
+            note_embeddings=note_embeddings, existing_links={}, limit=4
+        )
+
+        # Three identical pairs tie at 1.0 and keep their a-b, a-c, b-c scan order
+        assert [(r["note_a_id"], r["note_b_id"]) for r in result] == [
+            ("note-a", "note-b"),
+            ("note-a", "note-c"),
+            ("note-b", "note-c"),
+            ("note-a", "note-d"),
+        ]
+
 
 class TestFindHubOpportunities:
     """find_hub_opportunities: connected components over similar-pairs."""
@@ -652,6 +744,16 @@ class TestParseInspirationResponse:
 
         assert result == []
 
+    def test_non_string_type_rejected(self) -> None:
+        item = (
+            '{"type": ["orphan"], "title": "Test", "description": "Test", '
+            '"related_notes": ["a"], "action_text": "Edit"}'
+        )
+        result = inspire_core.parse_inspiration_response(f"[{item}, {self.VALID_ITEM}]")
+
+        assert len(result) == 1
+        assert result[0]["type"] == "orphan"
+
     def test_missing_required_fields_rejected(self) -> None:
         result = inspire_core.parse_inspiration_response('[{"type": "orphan", "title": "Test"}]')
 
@@ -677,6 +779,10 @@ class TestParseInspirationResponse:
     def test_unparseable_garbage_returns_empty_list(self) -> None:
         assert inspire_core.parse_inspiration_response("not json at all") == []
 
+    def test_truncated_array_in_prose_returns_empty_list(self) -> None:
+        response = f'Here you go:\n[{self.VALID_ITEM}, {{"type": '
+        assert inspire_core.parse_inspiration_response(response) == []
+
 
 class TestBuildInspirationPrompt:
     """build_inspiration_prompt: includes candidate data and guardrails."""
@@ -1,8 +1,15 @@
 """Unit tests for main API module."""
 
 from io import BytesIO
+from pathlib import Path
+from typing import Any
 
+import pytest
+from fastapi import HTTPException, UploadFile
 from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+import main
 
 # Upload endpoint is admin-only (#224). admin_headers (a passkey-session token)
 # comes from conftest since #267.
@@ -59,21 +66,12 @@ def test_get_articles(client: TestClient) -> None:
     assert "resources" in data
 
 
-def test_get_article_by_id(client: TestClient) -> None:
+def test_get_article_by_id(client: TestClient, first_article_id: int) -> None:
     """Test getting a specific article by ID."""
-    # First get all articles to find a valid ID
-    response = client.get("/api/articles")
-    articles = response.json()["resources"]
-    assert len(articles) > 0, "No articles found"
-
-    # Get the first article's ID
-    article_id = articles[0]["id"]
-
-    # Get that specific article
-    response = client.get(f"/api/articles/{article_id}")
+    response = client.get(f"/api/articles/{first_article_id}")
     assert response.status_code == 200
     data = response.json()
-    assert data["resource"]["id"] == article_id
+    assert data["resource"]["id"] == first_article_id
 
 
 def test_get_nonexistent_article(client: TestClient) -> None:
@@ -83,6 +81,13 @@ def test_get_nonexistent_article(client: TestClient) -> None:
     assert response.json()["detail"] == "Article not found"
 
 
+def _upload_file(data: bytes, filename: str, content_type: str) -> UploadFile:
+    """Build an UploadFile as FastAPI would, without a multipart round-trip."""
+    return UploadFile(
+        BytesIO(data), filename=filename, headers=Headers({"content-type": content_type})
+    )
+
+
 def test_upload_image(client: TestClient, admin_headers: dict[str, str]) -> None:
     """Test image upload endpoint with valid JPEG data."""
     files = {"file": ("test.jpg", BytesIO(JPEG_DATA), "image/jpeg")}
@@ -97,6 +102,27 @@ def test_upload_image(client: TestClient, admin_headers: dict[str, str]) -> None
     assert data["filename"].endswith(".webp") or data["filename"].endswith(".tmp")
 
 
+def test_upload_stores_exact_bytes_across_chunks(
+    client: TestClient,
+    admin_headers: dict[str, str],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The spooled upload is copied to disk intact when read in several chunks."""
+    monkeypatch.setattr(main, "UPLOAD_DIR", tmp_path)
+    monkeypatch.setattr(main, "UPLOAD_READ_CHUNK", 7)
+    # Valid JPEG magic, undecodable body: optimization fails and the raw
+    # temp file is served, so its bytes can be checked
+    payload = JPEG_DATA[:4] + bytes(range(256)) * 3
+    files = {"file": ("test.jpg", BytesIO(payload), "image/jpeg")}
+
+    response = client.post("/api/upload-image", files=files, headers=admin_headers)
+    assert response.status_code == 200
+    filename = response.json()["filename"]
+    assert filename.endswith(".tmp")
+    assert (tmp_path / filename).read_bytes() == payload
+
+
 def test_upload_requires_auth(client: TestClient) -> None:
     """Unauthenticated uploads are rejected (#224)."""
     files = {"file": ("test.jpg", BytesIO(JPEG_DATA), "image/jpeg")}
@@ -131,34 +157,73 @@ def test_upload_oversized_content_length_rejected_early(
     assert response.status_code == 413
 
 
-def test_upload_invalid_file_type(client: TestClient, admin_headers: dict[str, str]) -> None:
-    """Test uploading non-image file is rejected."""
-    file_data = b"not an image"
-    files = {"file": ("test.txt", BytesIO(file_data), "text/plain")}
+def test_upload_invalid_file_type_over_http(
+    client: TestClient, admin_headers: dict[str, str]
+) -> None:
+    """A validation failure surfaces as a 400 from the endpoint."""
+    files = {"file": ("test.txt", BytesIO(b"not an image"), "text/plain")}
 
     response = client.post("/api/upload-image", files=files, headers=admin_headers)
     assert response.status_code == 400
     assert "Invalid file type" in response.json()["detail"]
 
 
-def test_upload_fake_content_type(client: TestClient, admin_headers: dict[str, str]) -> None:
+# Validation cases below call _validate_upload directly: no multipart encoding
+# or parsing, and no auth/rate-limit plumbing unrelated to what they check.
+
+
+@pytest.mark.asyncio
+async def test_validate_upload_accepts_image() -> None:
+    """A JPEG upload reports its size and detected type."""
+    upload = _upload_file(JPEG_DATA, "test.jpg", "image/jpeg")
+
+    assert await main._validate_upload(upload) == (len(JPEG_DATA), "image/jpeg")
+
+
+@pytest.mark.asyncio
+async def test_validate_upload_invalid_file_type() -> None:
+    """Test uploading non-image file is rejected."""
+    upload = _upload_file(b"not an image", "test.txt", "text/plain")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await main._validate_upload(upload)
+    assert exc_info.value.status_code == 400
+    assert "Invalid file type" in exc_info.value.detail
+
+
+@pytest.mark.asyncio
+async def test_validate_upload_fake_content_type() -> None:
     """Test that files with fake Content-Type but invalid magic bytes are rejected."""
-    # Try to upload a text file with fake image/jpeg Content-Type header
-    fake_image = b"This is not actually a JPEG image"
-    files = {"file": ("test.jpg", BytesIO(fake_image), "image/jpeg")}
+    # A text file with a fake image/jpeg Content-Type header
+    upload = _upload_file(b"This is not actually a JPEG image", "test.jpg", "image/jpeg")
 
-    response = client.post("/api/upload-image", files=files, headers=admin_headers)
-    assert response.status_code == 400
-    assert "File content does not match" in response.json()["detail"]
+    with pytest.raises(HTTPException) as exc_info:
+        await main._validate_upload(upload)
+    assert exc_info.value.status_code == 400
+    assert "File content does not match" in exc_info.value.detail
 
 
-def test_upload_empty_file(client: TestClient, admin_headers: dict[str, str]) -> None:
+@pytest.mark.asyncio
+async def test_validate_upload_empty_file() -> None:
     """Test that empty files are rejected."""
-    files = {"file": ("test.jpg", BytesIO(b""), "image/jpeg")}
+    upload = _upload_file(b"", "test.jpg", "image/jpeg")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await main._validate_upload(upload)
+    assert exc_info.value.status_code == 400
+    assert "Empty file" in exc_info.value.detail
 
-    response = client.post("/api/upload-image", files=files, headers=admin_headers)
-    assert response.status_code == 400
-    assert "Empty file" in response.json()["detail"]
+
+@pytest.mark.asyncio
+async def test_validate_upload_too_large(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Bodies over MAX_FILE_SIZE are refused during the chunked read."""
+    monkeypatch.setattr(main, "MAX_FILE_SIZE", 16)
+    monkeypatch.setattr(main, "UPLOAD_READ_CHUNK", 4)
+    upload = _upload_file(JPEG_DATA, "test.jpg", "image/jpeg")
+
+    with pytest.raises(HTTPException) as exc_info:
+        await main._validate_upload(upload)
+    assert exc_info.value.status_code == 413
 
 
 def test_security_headers_present(client: TestClient) -> None:
@@ -175,15 +240,12 @@ def test_security_headers_present(client: TestClient) -> None:
     assert "Permissions-Policy" in response.headers
 
 
-def test_article_has_markdown_content(client: TestClient) -> None:
+def test_article_has_markdown_content(
+    client: TestClient, published_articles: list[dict[str, Any]]
+) -> None:
     """Test that individual articles have markdown content."""
-    # List endpoint should NOT have content (optimization)
-    response = client.get("/api/articles")
-    articles = response.json()["resources"]
-    assert len(articles) > 0, "No articles found"
-
-    # List endpoint should have metadata but not content
-    article = articles[0]
+    # List endpoint should have metadata but not content (optimization)
+    article = published_articles[0]
     assert "id" in article
     assert "title" in article
     assert "content" not in article, "List endpoint should not return content"
@@ -196,16 +258,9 @@ def test_article_has_markdown_content(client: TestClient) -> None:
     assert len(detail_article["content"]) > 0
 
 
-def test_get_article_related_notes(client: TestClient) -> None:
+def test_get_article_related_notes(client: TestClient, first_article_id: int) -> None:
     """Test getting notes related to an article using semantic search."""
-    # Get a valid article ID
-    response = client.get("/api/articles")
-    articles = response.json()["resources"]
-    assert len(articles) > 0, "No articles found"
-    article_id = articles[0]["id"]
-
-    # Get related notes
-    response = client.get(f"/api/articles/{article_id}/related-notes")
+    response = client.get(f"/api/articles/{first_article_id}/related-notes")
     assert response.status_code == 200
     data = response.json()
 
@@ -233,15 +288,9 @@ def test_get_related_notes_nonexistent_article(client: TestClient) -> None:
     assert response.json()["detail"] == "Article not found"
 
 
-def test_get_related_notes_with_limit(client: TestClient) -> None:
+def test_get_related_notes_with_limit(client: TestClient, first_article_id: int) -> None:
     """Test limiting number of related notes returned."""
-    # Get a valid article ID
-    response = client.get("/api/articles")
-    articles = response.json()["resources"]
-    article_id = articles[0]["id"]
-
-    # Request with limit=1
-    response = client.get(f"/api/articles/{article_id}/related-notes?limit=1")
+    response = client.get(f"/api/articles/{first_article_id}/related-notes?limit=1")
     assert response.status_code == 200
     data = response.json()
 
@@ -1,6 +1,8 @@
 """Unit tests for notes API endpoints."""
 
 import os
+from collections.abc import Generator
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
@@ -8,32 +10,96 @@ from fastapi.testclient import TestClient
 # Set testing mode before importing app modules
 os.environ["TESTING"] = "1"
 
-from main import app
-from notes_service import get_notes_service
+from notes_service import NotesService, get_notes_service
 
 # admin_headers (a passkey-session token) comes from conftest since #267.
 
+# Every test here goes through the real NotesService, so the module is marked
+# neo4j: it runs in CI and skips (rather than fails) without a database.
+pytestmark = pytest.mark.neo4j
+
 
 @pytest.fixture
-def client() -> TestClient:
-    """Get test client for API testing."""
-    return TestClient(app)
+def client(session_client: TestClient) -> TestClient:
+    """Get test client for API testing.
 
+    The session-wide client: nothing here installs dependency overrides, and
+    per-test isolation comes from clean_notes, not from a fresh client.
+    """
+    return session_client
 
-@pytest.fixture(autouse=True)
-def clean_notes() -> None:
-    """Clean up notes before and after each test."""
-    notes_service = get_notes_service()
 
-    # Clear Neo4j notes before test
-    if notes_service.neo4j.is_available():
-        notes_service.neo4j.driver.execute_query("MATCH (n:Note) DETACH DELETE n")
+@pytest.fixture(scope="session")
+def notes_service() -> NotesService:
+    """The real service, for seeding data a test isn't asserting on.
 
-    yield
+    Setup goes through create_note directly; HTTP is reserved for the
+    endpoint under test (creation over HTTP is covered by TestCreateNote).
+    Session-scoped since get_notes_service returns a process-wide singleton,
+    which also lets the module-scoped cleanup below depend on it.
+    """
+    return get_notes_service()
+
+
+@pytest.fixture
+def existing_note(notes_service: NotesService) -> dict[str, Any]:
+    """A note for tests that only need some note to act on.
+
+    Function-scoped on purpose: clean_notes empties the graph after every
+    writing test, so a longer-lived note would not survive.
+    """
+    return notes_service.create_note(content="Test note", title="Title")
+
+
+def _delete_all_notes(notes_service: NotesService) -> None:
+    """Remove every Note node in one round-trip (no-op without Neo4j)."""
+    neo4j = notes_service.neo4j
+    if neo4j.is_available():
+        neo4j.driver.execute_query("MATCH (n:Note) DETACH DELETE n")
+
+
+# Set whenever a test creates Note nodes; clean_notes skips the delete otherwise
+_notes_written = {"dirty": False}
+
+
+@pytest.fixture(autouse=True, scope="module")
+def clean_notes_before_module(notes_service: NotesService) -> Generator[None]:
+    """Start the module from an empty graph and track Note writes from then on.
+
+    The leftover delete is unconditional (earlier runs may have left notes).
+    After it, the adapter's only Note-creating methods - create_note (used by
+    the API and by service calls in tests alike), create_notes and
+    import_database - are wrapped to mark the graph dirty.
+    """
+    _delete_all_notes(notes_service)
+
+    adapter_cls = type(notes_service.neo4j)
+    with pytest.MonkeyPatch.context() as mp:
+        for name in ("create_note", "create_notes", "import_database"):
+            original = getattr(adapter_cls, name)
+
+            def marking(*args: Any, _original: Any = original, **kwargs: Any) -> Any:
+                _notes_written["dirty"] = True
+                return _original(*args, **kwargs)
+
+            mp.setattr(adapter_cls, name, marking)
+        yield
 
-    # Clear Neo4j notes after test
-    if notes_service.neo4j.is_available():
-        notes_service.neo4j.driver.execute_query("MATCH (n:Note) DETACH DELETE n")
+
+@pytest.fixture(autouse=True)
+def clean_notes(notes_service: NotesService) -> Generator[None]:
+    """Clean up notes after each test that created any.
+
+    Every teardown leaves the graph empty for the next test, so one delete per
+    writing test (plus one at module start) isolates as well as clearing both
+    before and after; read-only and auth-rejection tests skip the round-trip.
+    A rolled-back wrapping transaction isn't an option: the endpoints commit
+    through their own driver sessions.
+    """
+    _notes_written["dirty"] = False
+    yield
+    if _notes_written["dirty"]:
+        _delete_all_notes(notes_service)
 
 
 class TestCreateNote:
@@ -102,11 +168,10 @@ class TestListNotes:
         assert data["notes"] == []
         assert data["count"] == 0
 
-    def test_list_multiple_notes(self, client: TestClient, admin_headers: dict[str, str]) -> None:
+    def test_list_multiple_notes(self, client: TestClient, notes_service: NotesService) -> None:
         """Test listing multiple notes."""
         # Create notes
-        client.post("/api/notes", json={"content": "Note 1"}, headers=admin_headers)
-        client.post("/api/notes", json={"content": "Note 2"}, headers=admin_headers)
+        notes_service.bulk_create_notes([{"content": "Note 1"}, {"content": "Note 2"}])
 
         # List notes
         response = client.get("/api/notes")
@@ -116,17 +181,13 @@ class TestListNotes:
         assert all(note["author"] == "Erik" for note in data["notes"])
 
     def test_list_notes_ordered_by_created_at(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Test that notes are ordered by created_at descending (newest first)."""
-        import time
-
-        # Create notes in order with small delays to ensure distinct timestamps
-        client.post("/api/notes", json={"content": "First"}, headers=admin_headers)
-        time.sleep(0.01)  # 10ms delay
-        client.post("/api/notes", json={"content": "Second"}, headers=admin_headers)
-        time.sleep(0.01)  # 10ms delay
-        client.post("/api/notes", json={"content": "Third"}, headers=admin_headers)
+        # Bulk creation assigns increasing created_at in input order
+        notes_service.bulk_create_notes(
+            [{"content": "First"}, {"content": "Second"}, {"content": "Third"}]
+        )
 
         # List notes with full content to check ordering
         response = client.get("/api/notes?include_full_content=true")
@@ -138,13 +199,11 @@ class TestListNotes:
         assert notes[2]["content"] == "First"
 
     def test_list_notes_default_excludes_embedding(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Test that default response excludes embeddings for performance."""
         # Create note (will have embedding if Neo4j is available)
-        client.post(
-            "/api/notes", json={"content": "Test note with embedding"}, headers=admin_headers
-        )
+        notes_service.create_note(content="Test note with embedding")
 
         # List notes with defaults
         response = client.get("/api/notes")
@@ -158,12 +217,12 @@ class TestListNotes:
         assert "embedding_version" not in notes[0]
 
     def test_list_notes_default_returns_preview(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Test that default response returns content preview, not full content."""
         # Create note with long content (>200 chars)
         long_content = "A" * 300  # 300 characters
-        client.post("/api/notes", json={"content": long_content}, headers=admin_headers)
+        notes_service.create_note(content=long_content)
 
         # List notes with defaults
         response = client.get("/api/notes")
@@ -182,12 +241,12 @@ class TestListNotes:
         assert preview.endswith("...")
 
     def test_list_notes_include_full_content(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Test that include_full_content=true returns complete content."""
         # Create note with long content
         long_content = "B" * 300
-        client.post("/api/notes", json={"content": long_content}, headers=admin_headers)
+        notes_service.create_note(content=long_content)
 
         # List notes with full content
         response = client.get("/api/notes?include_full_content=true")
@@ -201,22 +260,11 @@ class TestListNotes:
         assert len(notes[0]["content"]) == 300
 
     def test_list_notes_include_embedding(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Test that include_embedding=true returns embedding vectors."""
-        from notes_service import get_notes_service
-
-        notes_service = get_notes_service()
-
-        # Skip if Neo4j not available
-        if not notes_service.neo4j.is_available():
-            pytest.skip("Neo4j not available")
-
         # Create note
-        response = client.post(
-            "/api/notes", json={"content": "Test note for embedding"}, headers=admin_headers
-        )
-        note_id = response.json()["id"]
+        note_id = notes_service.create_note(content="Test note for embedding")["id"]
 
         # Store a test embedding
         test_embedding = [0.1] * 768  # Standard embedding size
@@ -243,15 +291,11 @@ class TestListNotes:
         assert notes[0]["embedding_model"] == "test-model"
         assert notes[0]["embedding_version"] == 1
 
-    def test_list_notes_minimal_mode(
-        self, client: TestClient, admin_headers: dict[str, str]
-    ) -> None:
+    def test_list_notes_minimal_mode(self, client: TestClient, notes_service: NotesService) -> None:
         """Test that minimal=true returns only id and title."""
         # Create note with all fields
-        client.post(
-            "/api/notes",
-            json={"content": "Full content here", "title": "Test Title", "tags": ["tag1", "tag2"]},
-            headers=admin_headers,
+        notes_service.create_note(
+            content="Full content here", title="Test Title", tags=["tag1", "tag2"]
         )
 
         # List notes in minimal mode
@@ -276,20 +320,13 @@ class TestListNotes:
         assert "link_count" not in note
 
     def test_list_notes_includes_link_count(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Test that default response includes link_count field."""
         # Create two notes with a link between them
-        response1 = client.post(
-            "/api/notes", json={"content": "First note", "title": "Note 1"}, headers=admin_headers
-        )
-        note1_id = response1.json()["id"]
+        note1_id = notes_service.create_note(content="First note", title="Note 1")["id"]
 
-        client.post(
-            "/api/notes",
-            json={"content": f"Second note linking to [[{note1_id}]]", "title": "Note 2"},
-            headers=admin_headers,
-        )
+        notes_service.create_note(content=f"Second note linking to [[{note1_id}]]", title="Note 2")
 
         # List notes
         response = client.get("/api/notes")
@@ -309,15 +346,10 @@ class TestListNotes:
 class TestGetNote:
     """Tests for GET /api/notes/{note_id} endpoint."""
 
-    def test_get_note_by_id(self, client: TestClient, admin_headers: dict[str, str]) -> None:
+    def test_get_note_by_id(self, client: TestClient, existing_note: dict[str, Any]) -> None:
         """Test getting specific note."""
-        # Create note
-        create_response = client.post(
-            "/api/notes", json={"content": "Test note", "title": "Title"}, headers=admin_headers
-        )
-        note_id = create_response.json()["id"]
+        note_id = existing_note["id"]
 
-        # Get note
         response = client.get(f"/api/notes/{note_id}")
         assert response.status_code == 200
         data = response.json()
@@ -352,18 +384,11 @@ class TestUpdateNote:
     """Tests for PUT /api/notes/{note_id} endpoint."""
 
     def test_update_note_with_admin_token(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, existing_note: dict[str, Any], admin_headers: dict[str, str]
     ) -> None:
         """Test updating note with admin authentication."""
-        # Create note
-        create_response = client.post(
-            "/api/notes", json={"content": "Original content"}, headers=admin_headers
-        )
-        note_id = create_response.json()["id"]
-
-        # Update note
         response = client.put(
-            f"/api/notes/{note_id}",
+            f"/api/notes/{existing_note['id']}",
             json={"content": "Updated content", "title": "New Title", "tags": ["updated"]},
             headers=admin_headers,
         )
@@ -375,29 +400,19 @@ class TestUpdateNote:
         assert data["tags"] == ["updated"]
 
     def test_update_note_without_auth(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, existing_note: dict[str, Any]
     ) -> None:
         """Test that updating note without authentication fails."""
-        # Create note
-        create_response = client.post(
-            "/api/notes", json={"content": "Original"}, headers=admin_headers
-        )
-        note_id = create_response.json()["id"]
-
-        # Try to update without auth
-        response = client.put(f"/api/notes/{note_id}", json={"content": "Hacked"})
+        response = client.put(f"/api/notes/{existing_note['id']}", json={"content": "Hacked"})
 
         assert response.status_code == 401
 
     def test_update_with_new_wikilinks(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService, admin_headers: dict[str, str]
     ) -> None:
         """Test that updating content updates wikilinks."""
         # Create note
-        create_response = client.post(
-            "/api/notes", json={"content": "Links to [[old-note]]"}, headers=admin_headers
-        )
-        note_id = create_response.json()["id"]
+        note_id = notes_service.create_note(content="Links to [[old-note]]")["id"]
 
         # Update with new links
         response = client.put(
@@ -415,14 +430,10 @@ class TestDeleteNote:
     """Tests for DELETE /api/notes/{note_id} endpoint."""
 
     def test_delete_note_with_admin_token(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, existing_note: dict[str, Any], admin_headers: dict[str, str]
     ) -> None:
         """Test deleting note with admin authentication."""
-        # Create note
-        create_response = client.post(
-            "/api/notes", json={"content": "To be deleted"}, headers=admin_headers
-        )
-        note_id = create_response.json()["id"]
+        note_id = existing_note["id"]
 
         # Delete note
         response = client.delete(f"/api/notes/{note_id}", headers=admin_headers)
@@ -434,30 +445,19 @@ class TestDeleteNote:
         assert get_response.status_code == 404
 
     def test_delete_note_without_auth(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, existing_note: dict[str, Any]
     ) -> None:
         """Test that deleting note without authentication fails."""
-        # Create note
-        create_response = client.post(
-            "/api/notes", json={"content": "Protected"}, headers=admin_headers
-        )
-        note_id = create_response.json()["id"]
-
-        # Try to delete without auth
-        response = client.delete(f"/api/notes/{note_id}")
+        response = client.delete(f"/api/notes/{existing_note['id']}")
         assert response.status_code == 401
 
 
 class TestBacklinks:
     """Tests for GET /api/notes/{note_id}/backlinks endpoint."""
 
-    def test_get_backlinks(self, client: TestClient) -> None:
+    def test_get_backlinks(self, client: TestClient, notes_service: NotesService) -> None:
         """Test getting backlinks to a note."""
         # Create target note
-        from notes_service import get_notes_service
-
-        notes_service = get_notes_service()
-
         # Create notes with links
         target = notes_service.create_note(content="Target note", title="Target")
         target_id = target["id"]
@@ -478,16 +478,30 @@ class TestBacklinks:
         assert source1["id"] in backlink_ids
         assert source2["id"] in backlink_ids
 
-    def test_get_backlinks_for_note_with_none(self, client: TestClient) -> None:
-        """Test getting backlinks when note has none."""
-        # Create note with no backlinks
-        from notes_service import get_notes_service
+    def test_get_backlinks_from_bulk_created_notes(
+        self, client: TestClient, notes_service: NotesService
+    ) -> None:
+        """Test that bulk-created notes get their wikilinks as LINKS_TO edges."""
+        target_id = notes_service.create_note(content="Target note")["id"]
 
-        notes_service = get_notes_service()
+        sources = notes_service.bulk_create_notes(
+            [
+                {"content": f"Links to [[{target_id}]]", "title": "Source 1"},
+                {"content": f"Also links to [[{target_id}]]", "title": "Source 2"},
+            ]
+        )
+        assert [source["links"] for source in sources] == [[target_id], [target_id]]
 
-        note = notes_service.create_note(content="Lonely note")
+        response = client.get(f"/api/notes/{target_id}/backlinks")
+        assert response.status_code == 200
+        backlink_ids = {note["id"] for note in response.json()["backlinks"]}
+        assert backlink_ids == {source["id"] for source in sources}
 
-        response = client.get(f"/api/notes/{note['id']}/backlinks")
+    def test_get_backlinks_for_note_with_none(
+        self, client: TestClient, existing_note: dict[str, Any]
+    ) -> None:
+        """Test getting backlinks when note has none."""
+        response = client.get(f"/api/notes/{existing_note['id']}/backlinks")
         assert response.status_code == 200
         data = response.json()
         assert data["count"] == 0
@@ -497,15 +511,12 @@ class TestBacklinks:
 class TestOutboundLinks:
     """Tests for GET /api/notes/{note_id}/links endpoint."""
 
-    def test_get_outbound_links(self, client: TestClient) -> None:
+    def test_get_outbound_links(self, client: TestClient, notes_service: NotesService) -> None:
         """Test getting outbound links from a note."""
-        from notes_service import get_notes_service
-
-        notes_service = get_notes_service()
-
         # Create target notes
-        target1 = notes_service.create_note(content="Target 1")
-        target2 = notes_service.create_note(content="Target 2")
+        target1, target2 = notes_service.bulk_create_notes(
+            [{"content": "Target 1"}, {"content": "Target 2"}]
+        )
 
         # Create source note with links
         source = notes_service.create_note(
@@ -522,15 +533,11 @@ class TestOutboundLinks:
         assert target1["id"] in link_ids
         assert target2["id"] in link_ids
 
-    def test_get_outbound_links_for_note_with_none(self, client: TestClient) -> None:
+    def test_get_outbound_links_for_note_with_none(
+        self, client: TestClient, existing_note: dict[str, Any]
+    ) -> None:
         """Test getting outbound links when note has none."""
-        from notes_service import get_notes_service
-
-        notes_service = get_notes_service()
-
-        note = notes_service.create_note(content="No links here")
-
-        response = client.get(f"/api/notes/{note['id']}/links")
+        response = client.get(f"/api/notes/{existing_note['id']}/links")
         assert response.status_code == 200
         data = response.json()
         assert data["count"] == 0
@@ -540,12 +547,12 @@ class TestOutboundLinks:
 class TestRandomNote:
     """Tests for GET /api/notes/random endpoint."""
 
-    def test_get_random_note(self, client: TestClient, admin_headers: dict[str, str]) -> None:
+    def test_get_random_note(self, client: TestClient, notes_service: NotesService) -> None:
         """Test getting a random note when notes exist."""
         # Create several notes
-        client.post("/api/notes", json={"content": "Note 1"}, headers=admin_headers)
-        client.post("/api/notes", json={"content": "Note 2"}, headers=admin_headers)
-        client.post("/api/notes", json={"content": "Note 3"}, headers=admin_headers)
+        notes_service.bulk_create_notes(
+            [{"content": "Note 1"}, {"content": "Note 2"}, {"content": "Note 3"}]
+        )
 
         # Get random note
         response = client.get("/api/notes/random")
@@ -557,15 +564,11 @@ class TestRandomNote:
         assert data["content"] in ["Note 1", "Note 2", "Note 3"]
 
     def test_get_random_note_returns_valid_structure(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Test that random note returns complete note structure."""
         # Create note with all fields
-        client.post(
-            "/api/notes",
-            json={"content": "Full note", "title": "Test Title", "tags": ["test"]},
-            headers=admin_headers,
-        )
+        notes_service.create_note(content="Full note", title="Test Title", tags=["test"])
 
         response = client.get("/api/notes/random")
         assert response.status_code == 200
@@ -587,12 +590,13 @@ class TestRandomNote:
         assert "No notes available" in response.json()["detail"]
 
     def test_get_random_note_different_results(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Test that calling random multiple times can return different notes."""
-        # Create 10 notes to increase chance of different results
+        # Create 10 notes to increase chance of different results. Setup goes
+        # through the service; note creation over HTTP is covered elsewhere
         for i in range(10):
-            client.post("/api/notes", json={"content": f"Note {i}"}, headers=admin_headers)
+            notes_service.create_note(content=f"Note {i}")
 
         # Get random notes multiple times
         note_ids = set()
@@ -609,12 +613,8 @@ class TestRandomNote:
 class TestOrphanDetection:
     """Tests for orphan detection endpoints."""
 
-    def test_get_orphan_notes(self, client: TestClient, admin_headers: dict[str, str]) -> None:
+    def test_get_orphan_notes(self, client: TestClient, notes_service: NotesService) -> None:
         """Test getting orphan notes (no links, no backlinks)."""
-        from notes_service import get_notes_service
-
-        notes_service = get_notes_service()
-
         # Create orphan note (no links)
         orphan = notes_service.create_note(content="Isolated note")
 
@@ -630,12 +630,8 @@ class TestOrphanDetection:
         assert data["count"] == 1
         assert data["notes"][0]["id"] == orphan["id"]
 
-    def test_get_dead_end_notes(self, client: TestClient, admin_headers: dict[str, str]) -> None:
+    def test_get_dead_end_notes(self, client: TestClient, notes_service: NotesService) -> None:
         """Test getting dead-end notes (no outbound links)."""
-        from notes_service import get_notes_service
-
-        notes_service = get_notes_service()
-
         # Create notes
         target = notes_service.create_note(content="Target note")
         dead_end = notes_service.create_note(content="Dead end - no outbound links")
@@ -666,12 +662,8 @@ class TestOrphanDetection:
 class TestEntryPointDiscovery:
     """Tests for entry point discovery endpoints."""
 
-    def test_get_hub_notes(self, client: TestClient, admin_headers: dict[str, str]) -> None:
+    def test_get_hub_notes(self, client: TestClient, notes_service: NotesService) -> None:
         """Test getting hub notes (many outbound links)."""
-        from notes_service import get_notes_service
-
-        notes_service = get_notes_service()
-
         # Create target notes
         targets = [notes_service.create_note(content=f"Target {i}") for i in range(5)]
 
@@ -692,13 +684,9 @@ class TestEntryPointDiscovery:
         assert data["notes"][0]["link_count"] == 5
 
     def test_get_hub_notes_with_min_links(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Test hub notes with custom min_links parameter."""
-        from notes_service import get_notes_service
-
-        notes_service = get_notes_service()
-
         # Create targets
         targets = [notes_service.create_note(content=f"Target {i}") for i in range(3)]
 
@@ -714,12 +702,8 @@ class TestEntryPointDiscovery:
         assert data["count"] == 1
         assert data["notes"][0]["id"] == hub["id"]
 
-    def test_get_central_notes(self, client: TestClient, admin_headers: dict[str, str]) -> None:
+    def test_get_central_notes(self, client: TestClient, notes_service: NotesService) -> None:
         """Test getting central notes (many backlinks)."""
-        from notes_service import get_notes_service
-
-        notes_service = get_notes_service()
-
         # Create central concept note
         central = notes_service.create_note(content="Central concept", title="Core Idea")
 
@@ -737,13 +721,9 @@ class TestEntryPointDiscovery:
         assert data["notes"][0]["backlink_count"] == 5
 
     def test_get_central_notes_with_min_backlinks(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Test central notes with custom min_backlinks parameter."""
-        from notes_service import get_notes_service
-
-        notes_service = get_notes_service()
-
         # Create note with 2 backlinks
         target = notes_service.create_note(content="Referenced note")
         notes_service.create_note(content=f"Link 1: [[{target['id']}]]")
@@ -803,20 +783,12 @@ class TestIsReferenceField:
         assert data["is_reference"] is False
 
     def test_filter_notes_by_insights(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Can filter notes to show only insights."""
         # Create one insight and one reference
-        client.post(
-            "/api/notes",
-            json={"content": "Insight note"},
-            headers=admin_headers,
-        )
-        client.post(
-            "/api/notes",
-            json={"content": "Reference note", "is_reference": True},
-            headers=admin_headers,
-        )
+        notes_service.create_note(content="Insight note")
+        notes_service.create_note(content="Reference note", is_reference=True)
 
         # Filter for insights only (with full content to check)
         response = client.get("/api/notes?is_reference=false&include_full_content=true")
@@ -828,20 +800,12 @@ class TestIsReferenceField:
         assert data["notes"][0]["content"] == "Insight note"
 
     def test_filter_notes_by_references(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Can filter notes to show only references."""
         # Create one insight and one reference
-        client.post(
-            "/api/notes",
-            json={"content": "Insight note"},
-            headers=admin_headers,
-        )
-        client.post(
-            "/api/notes",
-            json={"content": "Reference note", "is_reference": True},
-            headers=admin_headers,
-        )
+        notes_service.create_note(content="Insight note")
+        notes_service.create_note(content="Reference note", is_reference=True)
 
         # Filter for references only (with full content to check)
         response = client.get("/api/notes?is_reference=true&include_full_content=true")
@@ -853,20 +817,12 @@ class TestIsReferenceField:
         assert data["notes"][0]["content"] == "Reference note"
 
     def test_list_all_notes_without_filter(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Without filter, returns all notes (insights and references)."""
         # Create one insight and one reference
-        client.post(
-            "/api/notes",
-            json={"content": "Insight note"},
-            headers=admin_headers,
-        )
-        client.post(
-            "/api/notes",
-            json={"content": "Reference note", "is_reference": True},
-            headers=admin_headers,
-        )
+        notes_service.create_note(content="Insight note")
+        notes_service.create_note(content="Reference note", is_reference=True)
 
         # List all notes without filter
         response = client.get("/api/notes")
@@ -876,17 +832,13 @@ class TestIsReferenceField:
         assert data["count"] == 2
 
     def test_update_note_to_reference(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService, admin_headers: dict[str, str]
     ) -> None:
         """Can update an insight to become a reference."""
         # Create insight
-        create_response = client.post(
-            "/api/notes",
-            json={"content": "Originally an insight"},
-            headers=admin_headers,
-        )
-        note_id = create_response.json()["id"]
-        assert create_response.json()["is_reference"] is False
+        created = notes_service.create_note(content="Originally an insight")
+        note_id = created["id"]
+        assert created["is_reference"] is False
 
         # Update to reference
         update_response = client.put(
@@ -901,16 +853,11 @@ class TestIsReferenceField:
         assert data["content"] == "Now a reference"
 
     def test_update_note_without_changing_is_reference(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService, admin_headers: dict[str, str]
     ) -> None:
         """Updating note without is_reference preserves existing value."""
         # Create reference
-        create_response = client.post(
-            "/api/notes",
-            json={"content": "A reference", "is_reference": True},
-            headers=admin_headers,
-        )
-        note_id = create_response.json()["id"]
+        note_id = notes_service.create_note(content="A reference", is_reference=True)["id"]
 
         # Update content without changing is_reference
         update_response = client.put(
@@ -925,16 +872,11 @@ class TestIsReferenceField:
         assert data["content"] == "Updated reference content"
 
     def test_get_note_includes_is_reference(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Getting a single note includes is_reference field."""
         # Create reference note
-        create_response = client.post(
-            "/api/notes",
-            json={"content": "DORA metrics", "is_reference": True},
-            headers=admin_headers,
-        )
-        note_id = create_response.json()["id"]
+        note_id = notes_service.create_note(content="DORA metrics", is_reference=True)["id"]
 
         # Get note
         response = client.get(f"/api/notes/{note_id}")
@@ -953,13 +895,9 @@ class TestNoteOfDay:
     longer reports is_stale/days_stale.
     """
 
-    def test_returns_a_note(self, client: TestClient, admin_headers: dict[str, str]) -> None:
+    def test_returns_a_note(self, client: TestClient, notes_service: NotesService) -> None:
         """Endpoint returns a note when the knowledge base is non-empty."""
-        client.post(
-            "/api/notes",
-            json={"title": "A Note", "content": "Some content."},
-            headers=admin_headers,
-        )
+        notes_service.create_note(title="A Note", content="Some content.")
 
         response = client.get("/api/notes/note-of-day")
 
@@ -969,14 +907,10 @@ class TestNoteOfDay:
         assert "id" in data["note"]
 
     def test_reports_no_staleness_fields(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService
     ) -> None:
         """Regression guard for #262: review state must not come back."""
-        client.post(
-            "/api/notes",
-            json={"title": "A Note", "content": "Some content."},
-            headers=admin_headers,
-        )
+        notes_service.create_note(title="A Note", content="Some content.")
 
         data = client.get("/api/notes/note-of-day").json()
 
@@ -1005,13 +939,9 @@ class TestStalenessRemoved:
         assert response.status_code != 200 or "notes" not in response.json()
 
     def test_review_endpoint_is_gone(
-        self, client: TestClient, admin_headers: dict[str, str]
+        self, client: TestClient, notes_service: NotesService, admin_headers: dict[str, str]
     ) -> None:
-        client.post(
-            "/api/notes",
-            json={"title": "A Note", "content": "Content."},
-            headers=admin_headers,
-        )
+        notes_service.create_note(title="A Note", content="Content.")
         notes = client.get("/api/notes").json()["notes"]
         note_id = notes[0]["id"]
 
@@ -72,3 +72,26 @@ class TestLazyReconnect:
         assert client.embeddings_available() is False
         client.client = object()
         assert client.embeddings_available() is True
+
+    def test_try_connect_applies_request_timeout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The configured per-request timeout is passed to the ollama client."""
+        import ollama
+
+        import ollama_client
+
+        captured: dict[str, object] = {}
+
+        class FakeClient:
+            def __init__(self, **kwargs: object) -> None:
+                captured.update(kwargs)
+
+            def list(self) -> list[str]:
+                return []
+
+        monkeypatch.setattr(ollama, "Client", FakeClient)
+        monkeypatch.setattr(ollama_client.settings, "ollama_request_timeout", 30.0)
+        client = _make_disconnected_client()
+        client.host = "http://mock:11434"
+
+        assert client._try_connect() is True
+        assert captured == {"host": "http://mock:11434", "timeout": 30.0}
@@ -7,6 +7,8 @@ Tests the /api/search endpoint including:
 - Error handling
 """
 
+from typing import Any
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -246,13 +248,14 @@ class TestChunkedSemanticSearch:
         neo4j.get_all_chunk_embeddings.return_value = chunks
         main.app.dependency_overrides[get_neo4j] = lambda: neo4j
 
-    def test_best_chunk_ranks_document_first(self, client: TestClient) -> None:
+    def test_best_chunk_ranks_document_first(
+        self, client: TestClient, published_articles: list[dict[str, Any]]
+    ) -> None:
         """A document whose chunk matches the query embedding exactly ranks first."""
         # Pick two real articles from the corpus
-        articles = client.get("/api/articles").json()["resources"]
-        assert len(articles) >= 2
-        target_id = str(articles[0]["id"])
-        other_id = str(articles[1]["id"])
+        assert len(published_articles) >= 2
+        target_id = str(published_articles[0]["id"])
+        other_id = str(published_articles[1]["id"])
 
         # The mock Ollama client's query embedding is deterministic per text,
         # so use it as the target chunk's embedding (cosine similarity 1.0)
@@ -281,15 +284,16 @@ class TestChunkedSemanticSearch:
         assert results[0]["type"] == "article"
         assert results[0]["score"] == pytest.approx(1.0)
 
-    def test_falls_back_to_document_embeddings_without_chunks(self, client: TestClient) -> None:
+    def test_falls_back_to_document_embeddings_without_chunks(
+        self, client: TestClient, first_article_id: int
+    ) -> None:
         """With no chunk data, search uses the whole-document embedding path."""
         from unittest.mock import MagicMock
 
         import main
         from dependencies import get_neo4j
 
-        articles = client.get("/api/articles").json()["resources"]
-        target_id = str(articles[0]["id"])
+        target_id = str(first_article_id)
 
         neo4j = MagicMock()
         neo4j.is_available.return_value = True
@@ -1,20 +1,13 @@
 """Unit tests for templates API endpoints."""
 
-import os
-
 import pytest
 from fastapi.testclient import TestClient
 
-# Set testing mode before importing app modules
-os.environ["TESTING"] = "1"
-
-from main import app
-
 
 @pytest.fixture
-def client() -> TestClient:
-    """Get test client for API testing."""
-    return TestClient(app)
+def client(session_client: TestClient) -> TestClient:
+    """Get test client for API testing (the shared session client)."""
+    return session_client
 
 
 class TestListTemplates:
@@ -41,6 +41,10 @@ class TestExtractLinks:
 
         assert links == ["note-id"]
 
+    def test_returns_empty_without_brackets(self):
+        """Content with no [[ at all yields no links."""
+        assert self.parser.extract_links("Plain text with [single] brackets") == []
+
 
 class TestExtractArticleLinks:
     """Tests for article link extraction [[article:id]]."""
@@ -235,3 +239,10 @@ class TestGetLinkContext:
         context = self.parser.get_link_context(content, "missing-link")
 
         assert context is None
+
+    def test_treats_link_id_literally(self):
+        """Regex metacharacters in the link ID should match only themselves."""
+        content = "Before [[a.b]] after"
+
+        assert self.parser.get_link_context(content, "a.b", context_chars=7) == content
+        assert self.parser.get_link_context("Before [[axb]] after", "a.b") is None
@@ -28,6 +28,9 @@ class WikilinkParser:
         Returns:
             List of unique note IDs
         """
+        # Most notes carry no links; a substring check is far cheaper than a regex scan
+        if "[[" not in content:
+            return []
         links = self.WIKILINK_PATTERN.findall(content)
         unique_links = list(dict.fromkeys(links))  # Preserve order, remove duplicates
         logger.debug("Extracted %d note wikilinks from content", len(unique_links))
@@ -168,14 +171,15 @@ class WikilinkParser:
         Returns:
             Context string or None if link not found
         """
-        pattern = re.compile(r"\[\[" + re.escape(link_id) + r"\]\]")
-        match = pattern.search(content)
+        # The link is a fixed string, so a plain find avoids compiling a regex per call
+        link = f"[[{link_id}]]"
+        link_start = content.find(link)
 
-        if not match:
+        if link_start == -1:
             return None
 
-        start = max(0, match.start() - context_chars)
-        end = min(len(content), match.end() + context_chars)
+        start = max(0, link_start - context_chars)
+        end = min(len(content), link_start + len(link) + context_chars)
 
         context = content[start:end].strip()
 